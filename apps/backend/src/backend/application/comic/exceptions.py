@@ -27,6 +27,15 @@ class ComicNotFoundError(BaseAppError):
                 raise ValueError("Invalid type.")
 
 
+@dataclass(slots=True)
+class ComicBatchLimitExceededError(BaseAppError):
+    limit: int
+
+    @property
+    def message(self) -> str:
+        return f"Too many comics requested at once (max {self.limit})."
+
+
 @dataclass(slots=True)
 class ComicNumberAlreadyExistsError(BaseAppError):
     number: IssueNumber
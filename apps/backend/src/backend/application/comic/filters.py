@@ -16,6 +16,23 @@ class DateRange:
     end: datetime.date | None = None
 
 
+class TranslationField(StrEnum):
+    TITLE = "title"
+    TOOLTIP = "tooltip"
+    TRANSLATOR_COMMENT = "translator_comment"
+    SOURCE_URL = "source_url"
+    IMAGES = "images"
+
+
+@dataclass(slots=True, kw_only=True)
+class TranslationProjection:
+    languages: list[Language] = field(default_factory=list)
+    fields: list[TranslationField] = field(default_factory=list)
+
+    def includes(self, field_: TranslationField) -> bool:
+        return not self.fields or field_ in self.fields
+
+
 @dataclass(slots=True, kw_only=True)
 class ComicFilters:
     search_query: str | None = None
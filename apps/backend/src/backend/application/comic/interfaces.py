@@ -1,11 +1,13 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 from functools import singledispatchmethod
 from typing import NoReturn, Protocol
 
-from backend.application.comic.filters import ComicFilters
+from backend.application.comic.filters import ComicFilters, TranslationProjection
 from backend.application.comic.responses import (
     ComicCompactResponseData,
+    ComicExportData,
     ComicResponseData,
+    ResourceVersionData,
     TagResponseData,
     TranslationResponseData,
 )
@@ -39,13 +41,43 @@ class ComicRepoInterface(Protocol):
     async def get_by(self) -> NoReturn: ...
 
     @get_by.register  # type: ignore[arg-type]
-    async def _(self, comic_id: ComicId) -> ComicResponseData: ...
+    async def _(
+        self,
+        comic_id: ComicId,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData: ...
 
     @get_by.register  # type: ignore[arg-type]
-    async def _(self, number: IssueNumber) -> ComicResponseData: ...
+    async def _(
+        self,
+        number: IssueNumber,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData: ...
 
     @get_by.register  # type: ignore[arg-type]
-    async def _(self, slug: str) -> ComicResponseData: ...
+    async def _(
+        self,
+        slug: str,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData: ...
+
+    @singledispatchmethod
+    async def get_version_by(self) -> NoReturn: ...
+
+    @get_version_by.register  # type: ignore[arg-type]
+    async def _(self, comic_id: ComicId) -> ResourceVersionData: ...
+
+    @get_version_by.register  # type: ignore[arg-type]
+    async def _(self, number: IssueNumber) -> ResourceVersionData: ...
+
+    @get_version_by.register  # type: ignore[arg-type]
+    async def _(self, slug: str) -> ResourceVersionData: ...
+
+    async def get_many(
+        self,
+        comic_ids: Sequence[ComicId],
+        numbers: Sequence[IssueNumber],
+    ) -> list[ComicResponseData]: ...
 
     async def get_list(
         self,
@@ -53,6 +85,8 @@ class ComicRepoInterface(Protocol):
         pagination: Pagination,
     ) -> tuple[int, Sequence[ComicCompactResponseData]]: ...
 
+    def stream_export(self, *, with_translations: bool) -> AsyncIterator[ComicExportData]: ...
+
     async def get_issue_number_by_id(self, comic_id: ComicId) -> IssueNumber | None: ...
 
     async def get_latest_issue_number(self) -> IssueNumber | None: ...
@@ -64,15 +98,30 @@ class ComicRepoInterface(Protocol):
         status: TranslationStatus | None = None,
     ) -> list[TranslationResponseData]: ...
 
-    async def relink_tags(self, comic_id: ComicId, tag_ids: Sequence[TagId]) -> None: ...
+    async def relink_tags(
+        self,
+        comic_id: ComicId,
+        tag_ids: Sequence[TagId],
+    ) -> list[TagResponseData]: ...
+
+    async def relink_many_tags(self, links: Mapping[ComicId, Sequence[TagId]]) -> None: ...
+
+    async def update_many(self, comics: Sequence[ComicEntity]) -> None: ...
+
+    async def get_extra_comic_ids_by_slugs(self, slugs: Sequence[str]) -> dict[str, ComicId]: ...
 
     async def load(self, comic_id: ComicId) -> ComicEntity: ...
 
+    async def load_many(self, comic_ids: Sequence[ComicId]) -> dict[ComicId, ComicEntity]: ...
+
 
 class TagRepoInterface(Protocol):
     async def create(self, tag: NewTagEntity) -> TagId: ...
 
-    async def create_many(self, tags: Sequence[NewTagEntity]) -> Sequence[TagId]: ...
+    async def create_many(
+        self,
+        tags: Sequence[NewTagEntity],
+    ) -> Sequence[tuple[TagId, bool]]: ...
 
     async def update(self, tag: TagEntity) -> None: ...
 
@@ -82,6 +131,8 @@ class TagRepoInterface(Protocol):
 
     async def load(self, tag_id: TagId) -> TagEntity: ...
 
+    async def get_existing_ids(self, tag_ids: Sequence[TagId]) -> set[TagId]: ...
+
 
 class TranslationRepoInterface(Protocol):
     async def create(self, translation: NewTranslationEntity) -> TranslationId: ...
@@ -92,4 +143,6 @@ class TranslationRepoInterface(Protocol):
 
     async def get_by_id(self, translation_id: TranslationId) -> TranslationResponseData: ...
 
+    async def get_version_by_id(self, translation_id: TranslationId) -> ResourceVersionData: ...
+
     async def load(self, translation_id: TranslationId) -> TranslationEntity: ...
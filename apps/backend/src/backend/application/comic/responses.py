@@ -1,7 +1,10 @@
 import datetime as dt
 from dataclasses import dataclass
+from enum import StrEnum
+from typing import Self
 
-from backend.domain.entities import TranslationStatus
+from backend.domain.entities import ComicEntity, ImageEntity, TranslationEntity, TranslationStatus
+from backend.domain.utils import cast_or_none
 from backend.domain.value_objects import Language
 
 
@@ -12,6 +15,24 @@ class TranslationImageResponseData:
     original: str | None
     converted: str | None
     converted_2x: str | None
+    converted_avif: str | None = None
+    converted_2x_avif: str | None = None
+    width: int | None = None
+    height: int | None = None
+
+    @classmethod
+    def from_entity(cls, image: ImageEntity) -> Self:
+        return cls(
+            id=image.id.value,
+            translation_id=image.link_id.value,  # type: ignore[union-attr]
+            original=cast_or_none(str, image.original_path),
+            converted=cast_or_none(str, image.converted_path),
+            converted_2x=cast_or_none(str, image.converted_2x_path),
+            converted_avif=cast_or_none(str, image.avif_path(image.converted_path)),
+            converted_2x_avif=cast_or_none(str, image.avif_path(image.converted_2x_path)),
+            width=image.metadata.width if image.metadata else None,
+            height=image.metadata.height if image.metadata else None,
+        )
 
 
 @dataclass(slots=True)
@@ -27,6 +48,21 @@ class TranslationResponseData:
     images: list[TranslationImageResponseData]
     status: TranslationStatus
 
+    @classmethod
+    def from_entity(cls, translation: TranslationEntity, images: list[ImageEntity]) -> Self:
+        return cls(
+            id=translation.id.value,
+            comic_id=translation.comic_id.value,
+            title=translation.title.value,
+            language=translation.language,
+            tooltip=translation.tooltip,
+            transcript=translation.transcript,
+            translator_comment=translation.translator_comment,
+            source_url=translation.source_url,
+            images=[TranslationImageResponseData.from_entity(image) for image in images],
+            status=translation.status,
+        )
+
 
 @dataclass(slots=True)
 class TagResponseData:
@@ -53,6 +89,54 @@ class ComicResponseData:
     images: list[TranslationImageResponseData]
     translations: list[TranslationResponseData]
 
+    @classmethod
+    def from_entity(
+        cls,
+        comic: ComicEntity,
+        tags: list[TagResponseData],
+        images: list[ImageEntity],
+    ) -> Self:
+        return cls(
+            id=comic.id.value,
+            number=comic.number.value if comic.number else None,
+            publication_date=comic.publication_date,
+            xkcd_url=comic.xkcd_url,
+            explain_url=comic.explain_url,
+            click_url=comic.click_url,
+            translation_id=comic.original_translation_id.value,
+            title=comic.title.value,
+            tooltip=comic.tooltip,
+            is_interactive=comic.is_interactive,
+            has_translations=[],
+            tags=tags,
+            images=[TranslationImageResponseData.from_entity(image) for image in images],
+            translations=[],
+        )
+
+
+@dataclass(slots=True)
+class ComicBatchItemData:
+    comic_id: int | None
+    number: int | None
+    comic: ComicResponseData | None
+
+
+class BulkItemStatus(StrEnum):
+    CREATED = "CREATED"
+    UPDATED = "UPDATED"
+    UNCHANGED = "UNCHANGED"
+    NOT_FOUND = "NOT_FOUND"
+    INVALID = "INVALID"
+    CONFLICT = "CONFLICT"
+
+
+@dataclass(slots=True)
+class BulkItemResultData:
+    index: int
+    id: int | None
+    status: BulkItemStatus
+    error: str | None = None
+
 
 @dataclass(slots=True)
 class ComicCompactResponseData:
@@ -61,3 +145,36 @@ class ComicCompactResponseData:
     publication_date: dt.date
     title: str
     image_url: str | None
+    thumbnail_url: str | None = None
+
+
+@dataclass(slots=True)
+class TranslationExportData:
+    id: int
+    language: Language
+    title: str
+    tooltip: str
+    source_url: str | None
+
+
+@dataclass(slots=True)
+class ComicExportData:
+    id: int
+    number: int | None
+    slug: str | None
+    publication_date: dt.date
+    title: str
+    tooltip: str
+    xkcd_url: str | None
+    explain_url: str | None
+    click_url: str | None
+    is_interactive: bool
+    image_url: str | None
+    tags: list[str]
+    translations: list[TranslationExportData] | None
+
+
+@dataclass(slots=True)
+class ResourceVersionData:
+    last_modified: dt.datetime
+    fingerprint: str
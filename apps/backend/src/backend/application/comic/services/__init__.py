@@ -1,3 +1,4 @@
+from .comic import BulkUpdateComicsInteractor as BulkUpdateComicsInteractor
 from .comic import ComicReader as ComicReader
 from .comic import CreateComicInteractor as CreateComicInteractor
 from .comic import DeleteComicInteractor as DeleteComicInteractor
@@ -1,15 +1,27 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 
 from backend.application.comic.commands import ComicCreateCommand, ComicUpdateCommand
-from backend.application.comic.filters import ComicFilters
+from backend.application.comic.exceptions import (
+    ComicBatchLimitExceededError,
+    ComicNotFoundError,
+    ExtraComicTitleAlreadyExistsError,
+    TagNotFoundError,
+)
+from backend.application.comic.filters import ComicFilters, TranslationProjection
 from backend.application.comic.interfaces import (
     ComicRepoInterface,
+    TagRepoInterface,
     TranslationRepoInterface,
 )
 from backend.application.comic.responses import (
+    BulkItemResultData,
+    BulkItemStatus,
+    ComicBatchItemData,
     ComicCompactResponseData,
+    ComicExportData,
     ComicResponseData,
+    ResourceVersionData,
     TranslationResponseData,
 )
 from backend.application.comic.services.mixins import (
@@ -17,10 +29,14 @@ from backend.application.comic.services.mixins import (
     TranslationImagePathData,
 )
 from backend.application.common.interfaces import (
+    CacheNamespace,
+    InvalidateCacheMessage,
+    PublisherRouterInterface,
     TransactionManagerInterface,
 )
 from backend.application.common.pagination import Pagination
-from backend.domain.entities import ImageLinkType, TranslationStatus
+from backend.domain.entities import ComicEntity, ImageLinkType, TranslationStatus
+from backend.domain.exceptions import BaseAppError
 from backend.domain.value_objects import (
     ComicId,
     ImageId,
@@ -30,19 +46,36 @@ from backend.domain.value_objects import (
     TranslationId,
 )
 
+COMIC_BATCH_LIMIT = 300
+
+
+def apply_comic_update(comic: ComicEntity, command: ComicUpdateCommand) -> None:
+    if "title" in command:
+        comic.set_title(command["title"])
+    if "tooltip" in command:
+        comic.tooltip = command["tooltip"]
+    if "click_url" in command:
+        comic.click_url = command["click_url"]
+    if "explain_url" in command:
+        comic.explain_url = command["explain_url"]
+    if "is_interactive" in command:
+        comic.is_interactive = command["is_interactive"]
+    if "transcript" in command:
+        comic.transcript = command["transcript"]
+
 
 @dataclass(slots=True)
 class CreateComicInteractor(ProcessTranslationImageMixin):
     comic_repo: ComicRepoInterface
     transaction: TransactionManagerInterface
 
-    async def execute(self, command: ComicCreateCommand) -> ComicId:
+    async def execute(self, command: ComicCreateCommand) -> ComicResponseData:
         new_comic, tag_ids, image_ids = command.unpack()
 
-        comic_id, original_translation_id = await self.comic_repo.create(new_comic)
-        await self.comic_repo.relink_tags(comic_id, tag_ids)
-        await self.create_images(
-            link_id=original_translation_id,
+        new_comic.id, new_comic.original_translation_id = await self.comic_repo.create(new_comic)
+        tags = await self.comic_repo.relink_tags(new_comic.id, tag_ids)
+        images = await self.create_images(
+            link_id=new_comic.original_translation_id,
             image_ids=image_ids,
             path_data=TranslationImagePathData(
                 number=new_comic.number,
@@ -54,9 +87,10 @@ class CreateComicInteractor(ProcessTranslationImageMixin):
 
         await self.transaction.commit()
 
+        await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]))
         await self.postprocess_images_in_background(image_ids)
 
-        return comic_id
+        return ComicResponseData.from_entity(new_comic, tags, images)
 
 
 @dataclass(slots=True)
@@ -65,23 +99,12 @@ class UpdateComicInteractor(ProcessTranslationImageMixin):
     translation_repo: TranslationRepoInterface
     transaction: TransactionManagerInterface
 
-    async def execute(self, command: ComicUpdateCommand) -> None:
+    async def execute(self, command: ComicUpdateCommand) -> ComicResponseData:
         comic_id = ComicId(command["comic_id"])
         comic = await self.comic_repo.load(comic_id)
 
         # TODO: rename_images_flag = False
-        if "title" in command:
-            comic.set_title(command["title"])
-        if "tooltip" in command:
-            comic.tooltip = command["tooltip"]
-        if "click_url" in command:
-            comic.explain_url = command["click_url"]
-        if "explain_url" in command:
-            comic.explain_url = command["explain_url"]
-        if "is_interactive" in command:
-            comic.is_interactive = command["is_interactive"]
-        if "transcript" in command:
-            comic.transcript = command["transcript"]
+        apply_comic_update(comic, command)
 
         await self.comic_repo.update(comic)
 
@@ -108,10 +131,114 @@ class UpdateComicInteractor(ProcessTranslationImageMixin):
                 )
             )
 
+        updated_comic: ComicResponseData = await self.comic_repo.get_by(comic_id)
+
         await self.transaction.commit()
 
+        await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]))
         await self.postprocess_images_in_background(created_image_ids)
 
+        return updated_comic
+
+
+@dataclass(slots=True)
+class BulkUpdateComicsInteractor:
+    comic_repo: ComicRepoInterface
+    tag_repo: TagRepoInterface
+    transaction: TransactionManagerInterface
+    publisher: PublisherRouterInterface
+
+    async def execute(self, commands: list[ComicUpdateCommand]) -> list[BulkItemResultData]:
+        if len(commands) > COMIC_BATCH_LIMIT:
+            raise ComicBatchLimitExceededError(COMIC_BATCH_LIMIT)
+
+        comics = await self.comic_repo.load_many(
+            list(dict.fromkeys(ComicId(command["comic_id"]) for command in commands))
+        )
+        existing_tag_ids = await self.tag_repo.get_existing_ids(
+            list({TagId(tag_id) for command in commands for tag_id in command.get("tag_ids", [])})
+        )
+
+        results: list[BulkItemResultData] = []
+        updated: dict[ComicId, ComicEntity] = {}
+        tag_links: dict[ComicId, list[TagId]] = {}
+
+        for index, command in enumerate(commands):
+            comic_id = ComicId(command["comic_id"])
+            comic = comics.get(comic_id)
+
+            if comic is None:
+                results.append(
+                    BulkItemResultData(
+                        index=index,
+                        id=comic_id.value,
+                        status=BulkItemStatus.NOT_FOUND,
+                        error=ComicNotFoundError(comic_id).message,
+                    )
+                )
+                continue
+
+            tag_ids = [TagId(tag_id) for tag_id in command.get("tag_ids", [])]
+            try:
+                if missing_tag_ids := [t for t in tag_ids if t not in existing_tag_ids]:
+                    raise TagNotFoundError(missing_tag_ids[0].value)
+                apply_comic_update(comic, command)
+            except BaseAppError as err:
+                results.append(
+                    BulkItemResultData(
+                        index=index,
+                        id=comic_id.value,
+                        status=BulkItemStatus.INVALID,
+                        error=err.message,
+                    )
+                )
+                continue
+
+            updated[comic_id] = comic
+            if "tag_ids" in command:
+                tag_links[comic_id] = tag_ids
+
+            results.append(
+                BulkItemResultData(index=index, id=comic_id.value, status=BulkItemStatus.UPDATED)
+            )
+
+        await self._drop_slug_conflicts(results, updated, tag_links)
+
+        await self.comic_repo.update_many(list(updated.values()))
+        await self.comic_repo.relink_many_tags(tag_links)
+        await self.transaction.commit()
+
+        if updated:
+            await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]))
+
+        return results
+
+    async def _drop_slug_conflicts(
+        self,
+        results: list[BulkItemResultData],
+        updated: dict[ComicId, ComicEntity],
+        tag_links: dict[ComicId, list[TagId]],
+    ) -> None:
+        slugs = {comic_id: comic.slug for comic_id, comic in updated.items() if comic.slug}
+        owners = await self.comic_repo.get_extra_comic_ids_by_slugs(list(set(slugs.values())))
+
+        claimed: dict[str, ComicId] = {}
+        conflicts: dict[ComicId, str] = {}
+        for comic_id, slug in slugs.items():
+            owner = owners.get(slug, comic_id)
+            if owner != comic_id or claimed.setdefault(slug, comic_id) != comic_id:
+                conflicts[comic_id] = ExtraComicTitleAlreadyExistsError(
+                    updated.pop(comic_id).title
+                ).message
+                tag_links.pop(comic_id, None)
+
+        for result in results:
+            if result.status != BulkItemStatus.UPDATED or result.id is None:
+                continue
+            if error := conflicts.get(ComicId(result.id)):
+                result.status = BulkItemStatus.CONFLICT
+                result.error = error
+
 
 @dataclass(slots=True)
 class DeleteComicInteractor(ProcessTranslationImageMixin):
@@ -134,19 +261,70 @@ class DeleteComicInteractor(ProcessTranslationImageMixin):
         await self.comic_repo.delete(comic_id)
         await self.transaction.commit()
 
+        await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]))
+
 
 @dataclass(slots=True)
 class ComicReader:
     comic_repo: ComicRepoInterface
 
-    async def get_by_id(self, comic_id: ComicId) -> ComicResponseData:
-        return await self.comic_repo.get_by(comic_id)
+    async def get_by_id(
+        self,
+        comic_id: ComicId,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData:
+        return await self.comic_repo.get_by(comic_id, projection)
 
-    async def get_by_issue_number(self, number: IssueNumber) -> ComicResponseData:
-        return await self.comic_repo.get_by(number)
+    async def get_by_issue_number(
+        self,
+        number: IssueNumber,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData:
+        return await self.comic_repo.get_by(number, projection)
 
-    async def get_by_slug(self, slug: str) -> ComicResponseData:
-        return await self.comic_repo.get_by(slug)
+    async def get_by_slug(
+        self,
+        slug: str,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData:
+        return await self.comic_repo.get_by(slug, projection)
+
+    async def get_many(
+        self,
+        comic_ids: Sequence[ComicId],
+        numbers: Sequence[IssueNumber],
+    ) -> list[ComicBatchItemData]:
+        if len(comic_ids) + len(numbers) > COMIC_BATCH_LIMIT:
+            raise ComicBatchLimitExceededError(COMIC_BATCH_LIMIT)
+
+        comics = await self.comic_repo.get_many(comic_ids, numbers) if comic_ids or numbers else []
+
+        by_id = {comic.id: comic for comic in comics}
+        by_number = {comic.number: comic for comic in comics if comic.number is not None}
+
+        items = [
+            ComicBatchItemData(
+                comic_id=comic_id.value, number=None, comic=by_id.get(comic_id.value)
+            )
+            for comic_id in comic_ids
+        ]
+        items.extend(
+            ComicBatchItemData(
+                comic_id=None, number=number.value, comic=by_number.get(number.value)
+            )
+            for number in numbers
+        )
+
+        return items
+
+    async def get_version_by_id(self, comic_id: ComicId) -> ResourceVersionData:
+        return await self.comic_repo.get_version_by(comic_id)
+
+    async def get_version_by_issue_number(self, number: IssueNumber) -> ResourceVersionData:
+        return await self.comic_repo.get_version_by(number)
+
+    async def get_version_by_slug(self, slug: str) -> ResourceVersionData:
+        return await self.comic_repo.get_version_by(slug)
 
     async def get_latest_issue_number(self) -> IssueNumber | None:
         return await self.comic_repo.get_latest_issue_number()
@@ -158,6 +336,9 @@ class ComicReader:
     ) -> tuple[int, Sequence[ComicCompactResponseData]]:
         return await self.comic_repo.get_list(filters, pagination)
 
+    def export(self, *, with_translations: bool) -> AsyncIterator[ComicExportData]:
+        return self.comic_repo.stream_export(with_translations=with_translations)
+
     async def get_translations(
         self,
         comic_id: ComicId,
@@ -12,7 +12,12 @@ from backend.application.common.interfaces import (
 )
 from backend.application.image.exceptions import ImageAlreadyHasOwnerError, ImageNotFoundError
 from backend.application.image.interfaces import ImageRepoInterface
-from backend.domain.entities import ImageLinkType, TranslationStatus
+from backend.domain.entities import (
+    ImageEntity,
+    ImageLinkType,
+    TranslationStatus,
+    build_avif_path,
+)
 from backend.domain.value_objects import (
     ImageId,
     IssueNumber,
@@ -118,7 +123,8 @@ class ProcessTranslationImageMixin:
         link_id: PositiveInt,
         image_ids: Iterable[ImageId],
         path_data: TranslationImagePathData,
-    ) -> None:
+    ) -> list[ImageEntity]:
+        images = []
         for image_id in image_ids:
             image = await self.image_repo.load(image_id)
 
@@ -128,10 +134,11 @@ class ProcessTranslationImageMixin:
             if image.has_another_owner(ImageLinkType.TRANSLATION, link_id):
                 raise ImageAlreadyHasOwnerError(image_id)
 
-            image_file = ImageFileObj(
+            image_file = ImageFileObj.from_metadata(
                 source=self.temp_file_manager.get_abs_path(
                     image.temp_image_id,  # type: ignore[arg-type]
-                )
+                ),
+                metadata=image.metadata,
             )
 
             original_path = RelativeImagePathBuilder(
@@ -146,6 +153,10 @@ class ProcessTranslationImageMixin:
 
             await self.image_file_manager.persist(image_file, original_path)
 
+            images.append(image)
+
+        return images
+
     async def delete_images(self, image_ids: Iterable[ImageId]) -> None:
         for image_id in image_ids:
             image = await self.image_repo.load(image_id)
@@ -186,6 +197,7 @@ class ProcessTranslationImageMixin:
                 "original_path",
                 "converted_path",
                 "converted_2x_path",
+                "thumbnail_path",
             ):
                 old_path = getattr(image, path_attr_name)
                 if old_path is None:
@@ -200,6 +212,12 @@ class ProcessTranslationImageMixin:
                 setattr(image, path_attr_name, new_path)
 
                 await self.image_file_manager.move(old_path, new_path)
+
+                if image.has_avif and path_attr_name != "original_path":
+                    await self.image_file_manager.move(
+                        build_avif_path(old_path),
+                        build_avif_path(new_path),
+                    )
             await self.image_repo.update(image)
 
     async def _separate_images(
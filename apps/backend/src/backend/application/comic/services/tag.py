@@ -1,10 +1,20 @@
-from collections.abc import Sequence
 from dataclasses import dataclass
 
 from backend.application.comic.commands import TagCreateCommand, TagUpdateCommand
 from backend.application.comic.interfaces import TagRepoInterface
-from backend.application.comic.responses import TagResponseData
-from backend.application.common.interfaces import TransactionManagerInterface
+from backend.application.comic.responses import (
+    BulkItemResultData,
+    BulkItemStatus,
+    TagResponseData,
+)
+from backend.application.common.interfaces import (
+    CacheNamespace,
+    InvalidateCacheMessage,
+    PublisherRouterInterface,
+    TransactionManagerInterface,
+)
+from backend.domain.entities import NewTagEntity
+from backend.domain.exceptions import BaseAppError
 from backend.domain.value_objects import TagId, TagName
 
 
@@ -12,10 +22,14 @@ from backend.domain.value_objects import TagId, TagName
 class CreateTagInteractor:
     tag_repo: TagRepoInterface
     transaction: TransactionManagerInterface
+    publisher: PublisherRouterInterface
 
     async def execute(self, command: TagCreateCommand) -> TagId:
         tag_id = await self.tag_repo.create(command.to_entity())
         await self.transaction.commit()
+
+        await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.TAGS]))
+
         return tag_id
 
 
@@ -23,17 +37,44 @@ class CreateTagInteractor:
 class CreateManyTagsInteractor:
     tag_repo: TagRepoInterface
     transaction: TransactionManagerInterface
+    publisher: PublisherRouterInterface
+
+    async def execute(self, commands: list[TagCreateCommand]) -> list[BulkItemResultData]:
+        results: dict[int, BulkItemResultData] = {}
+        new_tags: dict[int, NewTagEntity] = {}
+
+        for index, command in enumerate(commands):
+            try:
+                new_tags[index] = command.to_entity()
+            except BaseAppError as err:  # noqa: PERF203
+                results[index] = BulkItemResultData(
+                    index=index,
+                    id=None,
+                    status=BulkItemStatus.INVALID,
+                    error=err.message,
+                )
+
+        created = await self.tag_repo.create_many(list(new_tags.values()))
+        for index, (tag_id, is_created) in zip(new_tags, created, strict=True):
+            results[index] = BulkItemResultData(
+                index=index,
+                id=tag_id.value,
+                status=BulkItemStatus.CREATED if is_created else BulkItemStatus.UNCHANGED,
+            )
 
-    async def execute(self, commands: list[TagCreateCommand]) -> Sequence[TagId]:
-        tag_ids = await self.tag_repo.create_many([c.to_entity() for c in commands])
         await self.transaction.commit()
-        return tag_ids
+
+        if any(result.status == BulkItemStatus.CREATED for result in results.values()):
+            await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.TAGS]))
+
+        return [results[index] for index in range(len(commands))]
 
 
 @dataclass(slots=True)
 class UpdateTagInteractor:
     tag_repo: TagRepoInterface
     transaction: TransactionManagerInterface
+    publisher: PublisherRouterInterface
 
     async def execute(self, command: TagUpdateCommand) -> None:
         tag = await self.tag_repo.load(tag_id=TagId(command["tag_id"]))
@@ -46,16 +87,25 @@ class UpdateTagInteractor:
         await self.tag_repo.update(tag)
         await self.transaction.commit()
 
+        await self.publisher.publish(
+            InvalidateCacheMessage(namespaces=[CacheNamespace.TAGS, CacheNamespace.COMICS])
+        )
+
 
 @dataclass(slots=True)
 class DeleteTagInteractor:
     tag_repo: TagRepoInterface
     transaction: TransactionManagerInterface
+    publisher: PublisherRouterInterface
 
     async def execute(self, tag_id: TagId) -> None:
         await self.tag_repo.delete(tag_id)
         await self.transaction.commit()
 
+        await self.publisher.publish(
+            InvalidateCacheMessage(namespaces=[CacheNamespace.TAGS, CacheNamespace.COMICS])
+        )
+
 
 @dataclass(slots=True)
 class TagReader:
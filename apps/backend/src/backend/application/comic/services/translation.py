@@ -2,12 +2,17 @@ from dataclasses import dataclass
 
 from backend.application.comic.commands import TranslationCreateCommand, TranslationUpdateCommand
 from backend.application.comic.interfaces import ComicRepoInterface, TranslationRepoInterface
-from backend.application.comic.responses import TranslationResponseData
+from backend.application.comic.responses import ResourceVersionData, TranslationResponseData
 from backend.application.comic.services.mixins import (
     ProcessTranslationImageMixin,
     TranslationImagePathData,
 )
-from backend.application.common.interfaces import TransactionManagerInterface
+from backend.application.common.interfaces import (
+    CacheNamespace,
+    InvalidateCacheMessage,
+    PublisherRouterInterface,
+    TransactionManagerInterface,
+)
 from backend.domain.value_objects.common import ImageId, TranslationId
 
 
@@ -17,13 +22,13 @@ class AddTranslationInteractor(ProcessTranslationImageMixin):
     comic_repo: ComicRepoInterface
     transaction: TransactionManagerInterface
 
-    async def execute(self, command: TranslationCreateCommand) -> TranslationId:
+    async def execute(self, command: TranslationCreateCommand) -> TranslationResponseData:
         new_translation, image_ids = command.unpack()
 
-        translation_id = await self.translation_repo.create(new_translation)
+        new_translation.id = await self.translation_repo.create(new_translation)
         number = await self.comic_repo.get_issue_number_by_id(new_translation.comic_id)
-        await self.create_images(
-            link_id=translation_id,
+        images = await self.create_images(
+            link_id=new_translation.id,
             image_ids=image_ids,
             path_data=TranslationImagePathData(
                 number=number,
@@ -35,9 +40,10 @@ class AddTranslationInteractor(ProcessTranslationImageMixin):
 
         await self.transaction.commit()
 
+        await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]))
         await self.postprocess_images_in_background(image_ids)
 
-        return translation_id
+        return TranslationResponseData.from_entity(new_translation, images)
 
 
 @dataclass(slots=True)
@@ -49,7 +55,7 @@ class UpdateTranslationInteractor(ProcessTranslationImageMixin):
     async def execute(
         self,
         command: TranslationUpdateCommand,
-    ) -> TranslationId:
+    ) -> TranslationResponseData:
         translation_id = TranslationId(command["translation_id"])
         translation = await self.translation_repo.load(translation_id)
 
@@ -84,22 +90,28 @@ class UpdateTranslationInteractor(ProcessTranslationImageMixin):
                 ),
             )
 
+        updated_translation = await self.translation_repo.get_by_id(translation_id)
+
         await self.transaction.commit()
 
+        await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]))
         await self.postprocess_images_in_background(created_image_ids)
 
-        return translation_id
+        return updated_translation
 
 
 @dataclass(slots=True)
 class DeleteTranslationInteractor:
     translation_repo: TranslationRepoInterface
     transaction: TransactionManagerInterface
+    publisher: PublisherRouterInterface
 
     async def execute(self, translation_id: TranslationId) -> None:
         await self.translation_repo.delete(translation_id)
         await self.transaction.commit()
 
+        await self.publisher.publish(InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]))
+
 
 @dataclass(slots=True)
 class TranslationReader:
@@ -107,3 +119,6 @@ class TranslationReader:
 
     async def get_by_id(self, translation_id: TranslationId) -> TranslationResponseData:
         return await self.translation_repo.get_by_id(translation_id)
+
+    async def get_version_by_id(self, translation_id: TranslationId) -> ResourceVersionData:
+        return await self.translation_repo.get_version_by_id(translation_id)
@@ -1,6 +1,8 @@
 from .file_storages import ImageFileManagerInterface as ImageFileManagerInterface
 from .file_storages import StreamReaderProtocol as StreamReaderProtocol
 from .file_storages import TempFileManagerInterface as TempFileManagerInterface
+from .publisher_router import CacheNamespace as CacheNamespace
+from .publisher_router import InvalidateCacheMessage as InvalidateCacheMessage
 from .publisher_router import NewComicMessage as NewComicMessage
 from .publisher_router import PostProcessImageMessage as PostProcessImageMessage
 from .publisher_router import PublisherRouterInterface as PublisherRouterInterface
@@ -18,12 +18,16 @@ class TempFileManagerInterface(Protocol):
 
     def safe_move(self, path: Path) -> TempFileUUID: ...
 
+    def new_path(self) -> Path: ...
+
     def get_abs_path(self, temp_file_id: TempFileUUID) -> Path: ...
 
 
 class ImageFileManagerInterface(Protocol):
     async def persist(self, image: ImageFileObj, save_path: Path) -> None: ...
 
+    async def download(self, path: Path, save_abs_path: Path) -> None: ...
+
     async def move(self, path_from: Path, path_to: Path) -> None: ...
 
     async def delete(self, path: Path) -> None: ...
@@ -1,3 +1,4 @@
+from enum import StrEnum
 from functools import singledispatchmethod
 from typing import Any, NoReturn, Protocol
 
@@ -12,6 +13,15 @@ class NewComicMessage(BaseModel):
     comic_id: int
 
 
+class CacheNamespace(StrEnum):
+    COMICS = "comics"
+    TAGS = "tags"
+
+
+class InvalidateCacheMessage(BaseModel):
+    namespaces: list[CacheNamespace]
+
+
 class PublisherRouterInterface(Protocol):
     @singledispatchmethod
     async def publish(self, msg: Any, **kwargs: Any) -> NoReturn:
@@ -22,3 +32,6 @@ class PublisherRouterInterface(Protocol):
 
     @publish.register  # type: ignore[arg-type]
     async def _(self, msg: NewComicMessage, **kwargs: Any) -> None: ...
+
+    @publish.register  # type: ignore[arg-type]
+    async def _(self, msg: InvalidateCacheMessage, **kwargs: Any) -> None: ...
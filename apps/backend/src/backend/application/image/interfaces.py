@@ -1,12 +1,33 @@
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Sequence
+from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Protocol
 
-from backend.domain.entities import ImageEntity, ImageLinkType, NewImageEntity
+from backend.domain.entities import ImageEntity, ImageLinkType, ImageVariant, NewImageEntity
 from backend.domain.value_objects import ImageFileObj, ImageId, PositiveInt
 
 
+class ConversionPriority(StrEnum):
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+@dataclass(slots=True)
+class ConvertedImage:
+    webp: dict[ImageVariant, ImageFileObj]
+    avif: dict[ImageVariant, ImageFileObj] = field(default_factory=dict)
+
+    def files(self) -> list[ImageFileObj]:
+        return [*self.webp.values(), *self.avif.values()]
+
+
 class ImageConverterInterface(Protocol):
-    def convert_to_webp(self, original: ImageFileObj) -> ImageFileObj: ...
+    async def convert_to_webp(
+        self,
+        original: ImageFileObj,
+        variants: Collection[ImageVariant] | None = None,
+        priority: ConversionPriority = ConversionPriority.INTERACTIVE,
+    ) -> ConvertedImage: ...
 
 
 class ImageRepoInterface(Protocol):
@@ -20,4 +41,14 @@ class ImageRepoInterface(Protocol):
 
     async def update(self, image: ImageEntity) -> None: ...
 
+    async def update_many(self, images: Sequence[ImageEntity]) -> None: ...
+
     async def load(self, image_id: ImageId) -> ImageEntity: ...
+
+    async def load_many(self, image_ids: Sequence[ImageId]) -> dict[ImageId, ImageEntity]: ...
+
+    async def get_without_thumbnail(
+        self,
+        limit: int,
+        after_id: ImageId | None = None,
+    ) -> Sequence[ImageEntity]: ...
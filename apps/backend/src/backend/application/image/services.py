@@ -1,20 +1,42 @@
+import asyncio
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
 from backend.application.common.interfaces import (
+    CacheNamespace,
     ImageFileManagerInterface,
+    InvalidateCacheMessage,
+    PublisherRouterInterface,
     StreamReaderProtocol,
     TempFileManagerInterface,
     TransactionManagerInterface,
 )
 from backend.application.image.exceptions import ImageConversionError
-from backend.application.image.interfaces import ImageConverterInterface, ImageRepoInterface
-from backend.domain.entities.image import ImageProcessStage, NewImageEntity
+from backend.application.image.interfaces import (
+    ConversionPriority,
+    ImageConverterInterface,
+    ImageRepoInterface,
+)
+from backend.domain.entities.image import (
+    ImageEntity,
+    ImageProcessStage,
+    ImageVariant,
+    NewImageEntity,
+    build_avif_path,
+)
 from backend.domain.value_objects import ImageFileObj, ImageId
+from backend.domain.value_objects.image_file import ImageFormat
 
 logger = logging.getLogger(__name__)
 
+VARIANT_MARKS = {
+    ImageVariant.THUMBNAIL: "thumbnail",
+    ImageVariant.X1: "converted",
+    ImageVariant.X2: "converted2x",
+}
+
 
 @dataclass(slots=True)
 class UploadImageInteractor:
@@ -31,7 +53,9 @@ class UploadImageInteractor:
         image_file_obj = ImageFileObj(source=self.temp_file_manager.get_abs_path(temp_image_id))
         image_file_obj.validate_securely()
 
-        image_id = await self.image_repo.create(NewImageEntity(temp_image_id=temp_image_id))
+        image_id = await self.image_repo.create(
+            NewImageEntity(temp_image_id=temp_image_id, metadata=image_file_obj.metadata),
+        )
 
         await self.transaction.commit()
 
@@ -45,36 +69,183 @@ class ProcessImageInteractor:
     image_file_manager: ImageFileManagerInterface
     converter: ImageConverterInterface
     transaction: TransactionManagerInterface
+    publisher: PublisherRouterInterface
+
+    async def execute(self, image_ids: Sequence[ImageId], concurrency: int = 1) -> set[ImageId]:
+        pending = await self._load_pending(image_ids)
+        semaphore = asyncio.Semaphore(concurrency)
 
-    async def execute(self, image_id: ImageId) -> None:
-        image = await self.image_repo.load(image_id)
+        results = await asyncio.gather(
+            *(self._convert(image, semaphore) for image in pending),
+            return_exceptions=True,
+        )
 
-        if image.stage != ImageProcessStage.CREATED:
-            return
+        failed: set[ImageId] = set()
+        converted: list[tuple[ImageEntity, ImageFileObj]] = []
+        for image, result in zip(pending, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error("Image (id=%d) processing failed.", image.id.value, exc_info=result)
+                failed.add(image.id)
+            elif isinstance(result, BaseException):
+                raise result
+            elif result is not None:
+                converted.append((image, result))
+
+        if converted:
+            await self._save([image for image, _ in converted])
+
+            for _, original_image_file in converted:
+                original_image_file.source.unlink()
+
+        return failed
+
+    async def _load_pending(self, image_ids: Sequence[ImageId]) -> list[ImageEntity]:
+        try:
+            images = await self.image_repo.load_many(image_ids)
+        finally:
+            await self.transaction.rollback()
 
-        original_image_file = ImageFileObj(
+        for image_id in set(image_ids) - images.keys():
+            logger.warning("Image (id=%d) not found.", image_id.value)
+
+        return [image for image in images.values() if image.stage == ImageProcessStage.CREATED]
+
+    async def _save(self, images: Sequence[ImageEntity]) -> None:
+        await self.image_repo.update_many(images)
+        await self.transaction.commit()
+
+        await self.publisher.publish(
+            InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]),
+        )
+
+    async def _convert(
+        self,
+        image: ImageEntity,
+        semaphore: asyncio.Semaphore,
+    ) -> ImageFileObj | None:
+        original_image_file = ImageFileObj.from_metadata(
             source=self.temp_file_manager.get_abs_path(
                 image.temp_image_id,  # type: ignore[arg-type]
-            )
+            ),
+            metadata=image.metadata,
         )
 
-        try:
-            converted_image_file = self.converter.convert_to_webp(original_image_file)
-        except ImageConversionError as err:
-            logger.warning(err.message)
-        else:
-            converted_rel_path = image.original_path.with_name(  # type: ignore[union-attr]
-                image.original_path.stem + "_converted"  # type: ignore[union-attr]
-            ).with_suffix(".webp")
+        async with semaphore:
+            try:
+                converted = await self.converter.convert_to_webp(original_image_file)
+            except ImageConversionError as err:
+                logger.warning(err.message)
+                original_image_file.source.unlink()
+                return None
+
+            paths = {
+                variant: build_variant_path(image.original_path, variant)  # type: ignore[arg-type]
+                for variant in converted.webp
+            }
+
+            try:
+                for variant, converted_image_file in converted.webp.items():
+                    await self.image_file_manager.persist(converted_image_file, paths[variant])
+                for variant, converted_image_file in converted.avif.items():
+                    await self.image_file_manager.persist(
+                        converted_image_file,
+                        build_avif_path(paths[variant]),
+                    )
+            finally:
+                for converted_image_file in converted.files():
+                    converted_image_file.source.unlink()
+
+        image.set_converted(
+            converted_path=paths.get(ImageVariant.X1),
+            converted_2x_path=paths.get(ImageVariant.X2),
+            thumbnail_path=paths.get(ImageVariant.THUMBNAIL),
+            has_avif=bool(converted.avif),
+        )
 
-            await self.image_file_manager.persist(converted_image_file, converted_rel_path)
+        return original_image_file
 
-            image.set_converted(converted_rel_path)
 
-            await self.image_repo.update(image)
+@dataclass(slots=True)
+class BackfillThumbnailsInteractor:
+    image_repo: ImageRepoInterface
+    temp_file_manager: TempFileManagerInterface
+    image_file_manager: ImageFileManagerInterface
+    converter: ImageConverterInterface
+    transaction: TransactionManagerInterface
+    publisher: PublisherRouterInterface
+
+    async def execute(
+        self,
+        limit: int,
+        after_id: ImageId | None = None,
+        concurrency: int = 1,
+    ) -> list[ImageId]:
+        try:
+            images = await self.image_repo.get_without_thumbnail(limit, after_id)
+        finally:
+            await self.transaction.rollback()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        results = await asyncio.gather(
+            *(self._generate(image, semaphore) for image in images),
+            return_exceptions=True,
+        )
 
+        updated = []
+        for image, result in zip(images, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error("Image (id=%d) thumbnail failed.", image.id.value, exc_info=result)
+            elif isinstance(result, BaseException):
+                raise result
+            elif result:
+                updated.append(image)
+
+        if updated:
+            await self.image_repo.update_many(updated)
             await self.transaction.commit()
 
-            converted_image_file.source.unlink()
+            await self.publisher.publish(
+                InvalidateCacheMessage(namespaces=[CacheNamespace.COMICS]),
+            )
+
+        return [image.id for image in images]
+
+    async def _generate(self, image: ImageEntity, semaphore: asyncio.Semaphore) -> bool:
+        original_path: Path = image.original_path  # type: ignore[assignment]
+        temp_path = self.temp_file_manager.new_path()
+
+        async with semaphore:
+            try:
+                await self.image_file_manager.download(original_path, temp_path)
+
+                try:
+                    converted = await self.converter.convert_to_webp(
+                        ImageFileObj.from_metadata(source=temp_path, metadata=image.metadata),
+                        variants=[ImageVariant.THUMBNAIL],
+                        priority=ConversionPriority.BACKGROUND,
+                    )
+                except ImageConversionError as err:
+                    logger.warning(err.message)
+                    return False
+
+                thumbnail = converted.webp[ImageVariant.THUMBNAIL]
+                thumbnail_path = build_variant_path(original_path, ImageVariant.THUMBNAIL)
+
+                try:
+                    await self.image_file_manager.persist(thumbnail, thumbnail_path)
+                finally:
+                    for converted_image_file in converted.files():
+                        converted_image_file.source.unlink()
+            finally:
+                temp_path.unlink(missing_ok=True)
+
+        image.set_thumbnail(thumbnail_path)
+
+        return True
+
 
-        original_image_file.source.unlink()
+def build_variant_path(original_path: Path, variant: ImageVariant) -> Path:
+    return original_path.with_name(
+        f"{original_path.stem}_{VARIANT_MARKS[variant]}",
+    ).with_suffix(f".{ImageFormat.WEBP}")
@@ -2,7 +2,9 @@ from .comic import ComicEntity as ComicEntity
 from .comic import NewComicEntity as NewComicEntity
 from .image import ImageEntity as ImageEntity
 from .image import ImageLinkType as ImageLinkType
+from .image import ImageVariant as ImageVariant
 from .image import NewImageEntity as NewImageEntity
+from .image import build_avif_path as build_avif_path
 from .tag import NewTagEntity as NewTagEntity
 from .tag import TagEntity as TagEntity
 from .translation import NewTranslationEntity as NewTranslationEntity
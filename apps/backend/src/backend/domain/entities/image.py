@@ -2,7 +2,8 @@ from dataclasses import dataclass
 from enum import IntEnum, StrEnum
 from pathlib import Path
 
-from backend.domain.value_objects import ImageId, PositiveInt, TempFileUUID
+from backend.domain.value_objects import ImageId, ImageMetadata, PositiveInt, TempFileUUID
+from backend.domain.value_objects.image_file import ImageFormat
 
 
 class ImageLinkType(StrEnum):
@@ -10,6 +11,12 @@ class ImageLinkType(StrEnum):
     USER = "USER"
 
 
+class ImageVariant(StrEnum):
+    THUMBNAIL = "thumbnail"
+    X1 = "1x"
+    X2 = "2x"
+
+
 class ImageProcessStage(IntEnum):
     ORPHAN = 0
     CREATED = 1
@@ -26,6 +33,9 @@ class ImageEntity:
     original_path: Path | None = None
     converted_path: Path | None = None
     converted_2x_path: Path | None = None
+    thumbnail_path: Path | None = None
+    has_avif: bool = False
+    metadata: ImageMetadata | None = None
     is_deleted: bool = False
 
     @property
@@ -60,9 +70,26 @@ class ImageEntity:
         self.link_id = link_id
         self.original_path = original_path
 
-    def set_converted(self, converted_path: Path) -> None:
+    def set_converted(
+        self,
+        converted_path: Path | None,
+        converted_2x_path: Path | None = None,
+        thumbnail_path: Path | None = None,
+        has_avif: bool = False,
+    ) -> None:
         self.temp_image_id = None
         self.converted_path = converted_path
+        self.converted_2x_path = converted_2x_path
+        self.thumbnail_path = thumbnail_path
+        self.has_avif = has_avif
+
+    def avif_path(self, path: Path | None) -> Path | None:
+        if path is None or not self.has_avif:
+            return None
+        return build_avif_path(path)
+
+    def set_thumbnail(self, thumbnail_path: Path) -> None:
+        self.thumbnail_path = thumbnail_path
 
     def mark_deleted(self) -> None:
         self.link_type = None
@@ -70,6 +97,10 @@ class ImageEntity:
         self.is_deleted = True
 
 
+def build_avif_path(path: Path) -> Path:
+    return path.with_suffix(f".{ImageFormat.AVIF}")
+
+
 @dataclass(slots=True, kw_only=True)
 class NewImageEntity(ImageEntity):
     id: ImageId | None = None  # type: ignore[assignment]
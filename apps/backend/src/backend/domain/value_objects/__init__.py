@@ -6,6 +6,7 @@ from .common import TagId as TagId
 from .common import TempFileUUID as TempFileUUID
 from .common import TranslationId as TranslationId
 from .image_file import ImageFileObj as ImageFileObj
+from .image_file import ImageMetadata as ImageMetadata
 from .language import Language as Language
 from .tag_name import TagName as TagName
 from .translation_title import TranslationTitle as TranslationTitle
@@ -1,8 +1,9 @@
+import hashlib
 from dataclasses import dataclass
 from enum import StrEnum
 from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
 import imagesize
 from filetype import filetype
@@ -32,6 +33,7 @@ class ImageFormat(StrEnum):
     JPG = "jpg"
     WEBP = "webp"
     GIF = "gif"
+    AVIF = "avif"
 
     @classmethod
     def _missing_(cls, value: Any) -> "ImageFormat | None":
@@ -40,12 +42,35 @@ class ImageFormat(StrEnum):
         return None
 
 
+@dataclass(frozen=True, slots=True)
+class ImageMetadata:
+    width: int
+    height: int
+    format: ImageFormat
+    mime: str
+    size: int
+    content_hash: str
+
+
 @dataclass(frozen=True)
 class ImageFileObj:
     __slots__ = "source", "__dict__"
 
     source: Path
 
+    @classmethod
+    def from_metadata(cls, source: Path, metadata: ImageMetadata | None) -> Self:
+        image_file = cls(source)
+        if metadata is not None:
+            image_file.__dict__.update(
+                dimensions=(metadata.width, metadata.height),
+                format=metadata.format,
+                mime=metadata.mime,
+                size=metadata.size,
+                content_hash=metadata.content_hash,
+            )
+        return image_file
+
     @cached_property
     def dimensions(self) -> tuple[int, int]:
         w, h = imagesize.get(self.source)
@@ -57,18 +82,35 @@ class ImageFileObj:
     def size(self) -> int:
         return self.source.stat().st_size
 
-    @property
+    @cached_property
     def format(self) -> ImageFormat:
         if kind := self._kind:
             return ImageFormat(kind.extension)
         raise ValueError(f"Unrecognized file format for {self.source}.")
 
-    @property
+    @cached_property
     def mime(self) -> str:
         if kind := self._kind:
             return str(kind.mime)
         raise ValueError(f"Unrecognized MIME type for {self.source}.")
 
+    @cached_property
+    def content_hash(self) -> str:
+        with self.source.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    @property
+    def metadata(self) -> ImageMetadata:
+        width, height = self.dimensions
+        return ImageMetadata(
+            width=width,
+            height=height,
+            format=self.format,
+            mime=self.mime,
+            size=self.size,
+            content_hash=self.content_hash,
+        )
+
     @cached_property
     def _kind(self) -> Any:
         kind = filetype.guess(self.source)
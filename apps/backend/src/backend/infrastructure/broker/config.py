@@ -1,6 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ImageConsumerConfig:
+    batch_size: int = 16
+    batch_timeout: float = 1.0
+    max_concurrency: int = 4
+    in_progress_interval: float = 10.0
 
 
 @dataclass(slots=True)
 class NatsConfig:
     url: str
+    image_consumer: ImageConsumerConfig = field(default_factory=ImageConsumerConfig)
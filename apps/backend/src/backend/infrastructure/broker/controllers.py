@@ -1,23 +1,69 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager, suppress
+from typing import Annotated
+
 from dishka import FromDishka
-from faststream.nats import JStream, NatsRouter
+from faststream import Context
+from faststream.nats import JStream, NatsRouter, PullSub
+from faststream.nats.message import NatsBatchMessage
+from nats.aio.msg import Msg
+from nats.errors import Error as NatsError
 
 from backend.application.common.interfaces import PostProcessImageMessage
 from backend.application.image.services import ProcessImageInteractor
 from backend.domain.value_objects import ImageId
+from backend.infrastructure.broker.config import ImageConsumerConfig
+
+logger = logging.getLogger(__name__)
+
+
+def create_router(config: ImageConsumerConfig) -> NatsRouter:
+    router = NatsRouter()
+
+    @router.subscriber(
+        subject="images.convert",
+        queue="convert_image_queue",
+        stream=JStream(name="stream_name", max_age=60 * 60, declare=True),
+        pull_sub=PullSub(batch_size=config.batch_size, timeout=config.batch_timeout, batch=True),
+        durable="durable_name",
+    )
+    async def process_images(
+        msgs: list[PostProcessImageMessage],
+        message: Annotated[NatsBatchMessage, Context("message")],
+        *,
+        interactor: FromDishka[ProcessImageInteractor],
+    ) -> None:
+        image_ids = [ImageId(msg.image_id) for msg in msgs]
+
+        async with keep_in_progress(message.raw_message, config.in_progress_interval):
+            failed = await interactor.execute(image_ids, concurrency=config.max_concurrency)
+
+        for image_id, raw_message in zip(image_ids, message.raw_message, strict=True):
+            if image_id in failed:
+                await raw_message.nak()
+            else:
+                await raw_message.ack()
+
+    return router
+
+
+@asynccontextmanager
+async def keep_in_progress(messages: Sequence[Msg], interval: float) -> AsyncIterator[None]:
+    async def heartbeat() -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                for msg in messages:
+                    await msg.in_progress()
+            except NatsError:
+                logger.exception("Failed to extend the ack deadline of a batch.")
 
-router = NatsRouter()
-
-
-@router.subscriber(
-    subject="images.convert",
-    queue="convert_image_queue",
-    stream=JStream(name="stream_name", max_age=60 * 60, declare=True),
-    pull_sub=True,
-    durable="durable_name",
-)
-async def process_image(
-    msg: PostProcessImageMessage,
-    *,
-    interactor: FromDishka[ProcessImageInteractor],
-) -> None:
-    await interactor.execute(image_id=ImageId(msg.image_id))
+    task = asyncio.create_task(heartbeat())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
@@ -5,16 +5,19 @@ from typing import Any, NoReturn
 from faststream.nats.publisher.asyncapi import AsyncAPIPublisher
 
 from backend.application.common.interfaces import (
+    InvalidateCacheMessage,
     NewComicMessage,
     PostProcessImageMessage,
     PublisherRouterInterface,
 )
+from backend.infrastructure.metrics import NATS_PUBLISH_DURATION
 
 
 @dataclass(slots=True)
 class PublisherRouter(PublisherRouterInterface):
     converter_publisher: AsyncAPIPublisher
     new_comic_publisher: AsyncAPIPublisher
+    cache_publisher: AsyncAPIPublisher
 
     @singledispatchmethod
     async def publish(self, msg: Any, **kwargs: Any) -> NoReturn:
@@ -22,8 +25,17 @@ class PublisherRouter(PublisherRouterInterface):
 
     @publish.register  # type: ignore[arg-type]
     async def _(self, msg: PostProcessImageMessage, **kwargs: Any) -> None:
-        await self.converter_publisher.publish(msg, **kwargs)
+        await self._publish(self.converter_publisher, msg, **kwargs)
 
     @publish.register  # type: ignore[arg-type]
     async def _(self, msg: NewComicMessage, **kwargs: Any) -> None:
-        await self.new_comic_publisher.publish(msg, **kwargs)
+        await self._publish(self.new_comic_publisher, msg, **kwargs)
+
+    @publish.register  # type: ignore[arg-type]
+    async def _(self, msg: InvalidateCacheMessage, **kwargs: Any) -> None:
+        await self._publish(self.cache_publisher, msg, **kwargs)
+
+    @staticmethod
+    async def _publish(publisher: AsyncAPIPublisher, msg: Any, **kwargs: Any) -> None:
+        with NATS_PUBLISH_DURATION.labels(subject=publisher.subject).time():
+            await publisher.publish(msg, **kwargs)
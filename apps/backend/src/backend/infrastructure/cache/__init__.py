@@ -0,0 +1,9 @@
+from .compression import ContentEncoding as ContentEncoding
+from .compression import compress as compress
+from .compression import is_compressible as is_compressible
+from .compression import negotiate_encoding as negotiate_encoding
+from .response_cache import CachedResponse as CachedResponse
+from .response_cache import ResponseCache as ResponseCache
+from .storages import CacheStorageInterface as CacheStorageInterface
+from .storages import InMemoryCacheStorage as InMemoryCacheStorage
+from .storages import NatsKVCacheStorage as NatsKVCacheStorage
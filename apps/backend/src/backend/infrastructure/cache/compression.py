@@ -0,0 +1,54 @@
+import gzip
+from collections.abc import Collection
+from enum import StrEnum
+
+import brotli  # type: ignore[import-untyped]
+
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSIBLE_MEDIA_TYPES = ("application/json", "application/x-ndjson", "text/")
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+class ContentEncoding(StrEnum):
+    BR = "br"
+    GZIP = "gzip"
+    IDENTITY = "identity"
+
+
+def is_compressible(content_type: str, size: int) -> bool:
+    return size >= COMPRESSION_MIN_SIZE and content_type.startswith(COMPRESSIBLE_MEDIA_TYPES)
+
+
+def compress(body: bytes) -> dict[ContentEncoding, bytes]:
+    return {
+        ContentEncoding.BR: brotli.compress(body, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY),
+        ContentEncoding.GZIP: gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+    }
+
+
+def negotiate_encoding(
+    accept_encoding: str,
+    available: Collection[ContentEncoding],
+) -> ContentEncoding:
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+
+    def weight(encoding: ContentEncoding) -> float:
+        return weights.get(encoding, weights.get("*", 0.0))
+
+    candidates = [
+        encoding
+        for encoding in (ContentEncoding.BR, ContentEncoding.GZIP)
+        if encoding in available and weight(encoding) > 0
+    ]
+
+    return max(candidates, key=weight, default=ContentEncoding.IDENTITY)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class CacheConfig:
+    enabled: bool
+    ttl: int
+    max_entries: int
+    shared_bucket: str | None = None
@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Self
+from urllib.parse import parse_qsl, urlencode
+
+import orjson
+
+from backend.application.common.interfaces import CacheNamespace
+from backend.infrastructure.cache.compression import ContentEncoding
+from backend.infrastructure.cache.storages import CacheStorageInterface
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    encoded_bodies: dict[ContentEncoding, bytes] = field(default_factory=dict)
+
+    def get_body(self, encoding: ContentEncoding) -> bytes:
+        return self.encoded_bodies.get(encoding, self.body)
+
+    def dumps(self) -> bytes:
+        meta = orjson.dumps(
+            [
+                self.status,
+                [(k.decode("latin-1"), v.decode("latin-1")) for k, v in self.headers],
+                [(encoding, len(body)) for encoding, body in self.encoded_bodies.items()],
+            ]
+        )
+        return b"".join([meta, b"\n", *self.encoded_bodies.values(), self.body])
+
+    @classmethod
+    def loads(cls, data: bytes) -> Self:
+        meta, payload = data.split(b"\n", 1)
+        status, headers, sizes = orjson.loads(meta)
+
+        view = memoryview(payload)
+        encoded_bodies: dict[ContentEncoding, bytes] = {}
+        for encoding, size in sizes:
+            encoded_bodies[ContentEncoding(encoding)] = bytes(view[:size])
+            view = view[size:]
+
+        return cls(
+            status=status,
+            headers=[(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+            body=bytes(view),
+            encoded_bodies=encoded_bodies,
+        )
+
+
+@dataclass(slots=True)
+class ResponseCache:
+    local: CacheStorageInterface
+    shared: CacheStorageInterface | None = None
+    enabled: bool = True
+    _generations: dict[CacheNamespace, int] = field(default_factory=dict)
+
+    @staticmethod
+    def build_key(namespace: CacheNamespace, path: str, query_string: str) -> str:
+        query = urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))
+        digest = blake2b(f"{path}?{query}".encode(), digest_size=16).hexdigest()
+        return f"{namespace}.{digest}"
+
+    async def get(self, key: str) -> CachedResponse | None:
+        data = await self.local.get(key)
+
+        if data is None and self.shared is not None:
+            data = await self.shared.get(key)
+            if data is not None:
+                await self.local.set(key, data)
+
+        return CachedResponse.loads(data) if data is not None else None
+
+    def generation(self, namespace: CacheNamespace) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def set(
+        self,
+        key: str,
+        response: CachedResponse,
+        namespace: CacheNamespace,
+        generation: int,
+    ) -> None:
+        """Skip responses read before the namespace was invalidated at `generation`."""
+        if self.generation(namespace) != generation:
+            return
+
+        data = response.dumps()
+        await self.local.set(key, data)
+        if self.shared is not None:
+            await self.shared.set(key, data)
+            if self.generation(namespace) != generation:
+                await self.shared.delete(key)
+
+    async def invalidate(self, namespaces: list[CacheNamespace]) -> None:
+        for namespace in namespaces:
+            self._generations[namespace] = self.generation(namespace) + 1
+
+        for namespace in namespaces:
+            if self.shared is not None:
+                await self.shared.delete_namespace(namespace)
+            await self.local.delete_namespace(namespace)
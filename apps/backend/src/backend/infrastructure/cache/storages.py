@@ -0,0 +1,99 @@
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from nats.errors import Error as NatsError
+from nats.js.errors import KeyNotFoundError
+from nats.js.kv import KeyValue
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStorageInterface(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def delete_namespace(self, namespace: str) -> None: ...
+
+
+@dataclass(slots=True)
+class InMemoryCacheStorage(CacheStorageInterface):
+    max_entries: int
+    ttl: int
+    _entries: OrderedDict[str, tuple[float, bytes]] = field(default_factory=OrderedDict)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def delete_namespace(self, namespace: str) -> None:
+        prefix = f"{namespace}."
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+
+@dataclass(slots=True)
+class NatsKVCacheStorage(CacheStorageInterface):
+    kv: KeyValue
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            entry = await self.kv.get(key)
+        except KeyNotFoundError:
+            return None
+        except NatsError:
+            logger.exception("Failed to read `%s` from the shared cache.", key)
+            return None
+        return entry.value
+
+    async def set(self, key: str, value: bytes) -> None:
+        try:
+            await self.kv.put(key, value)
+        except NatsError:
+            logger.exception("Failed to write `%s` to the shared cache.", key)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.kv.purge(key)
+        except NatsError:
+            logger.exception("Failed to delete `%s` from the shared cache.", key)
+
+    async def delete_namespace(self, namespace: str) -> None:
+        try:
+            watcher = await self.kv.watch(f"{namespace}.>", ignore_deletes=True, meta_only=True)
+
+            keys = []
+            async for entry in watcher:
+                if entry is None:
+                    break
+                keys.append(entry.key)
+            await watcher.stop()  # type: ignore[no-untyped-call]
+
+            for key in keys:
+                await self.kv.purge(key)
+        except NatsError:
+            logger.exception("Failed to invalidate `%s` in the shared cache.", namespace)
@@ -1,4 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from enum import StrEnum
+from typing import Self
+
+
+class DbClient(StrEnum):
+    API = "api"
+    WORKER = "worker"
+    TG_BOT = "tg_bot"
+    CLI = "cli"
 
 
 @dataclass(slots=True)
@@ -10,3 +19,18 @@ class DbConfig:
     dbname: str
     echo: bool
     pool_size: int
+    max_overflow: int = 20
+    max_connections: dict[DbClient, int] = field(default_factory=dict)
+
+    def for_client(self, client: DbClient, processes: int = 1) -> Self:
+        if client not in self.max_connections:
+            return self
+
+        connections_per_process = max(self.max_connections[client] // processes, 1)
+        pool_size = min(self.pool_size, connections_per_process)
+
+        return replace(
+            self,
+            pool_size=pool_size,
+            max_overflow=min(self.max_overflow, connections_per_process - pool_size),
+        )
@@ -1,10 +1,14 @@
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from sqlalchemy import URL, text
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine
 
 from backend.infrastructure.database.config import DbConfig
 
+SessionCallback = Callable[[AsyncSession], Awaitable[None]]
+
 
 def build_postgres_url(config: DbConfig) -> URL:
     return URL.create(
@@ -24,3 +28,29 @@ def create_db_engine(db_url: URL, **kwargs: Any) -> AsyncEngine:
 async def check_db_connection(engine: AsyncEngine) -> None:
     async with engine.connect() as conn:
         await conn.execute(text("SELECT 1"))
+
+
+async def prewarm_pool(
+    engine: AsyncEngine,
+    connections: int,
+    warm_up: SessionCallback | None = None,
+) -> None:
+    conns = [engine.connect() for _ in range(connections)]
+    try:
+        results = await asyncio.gather(*(conn.start() for conn in conns), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        await asyncio.gather(*(_warm_up_connection(conn, warm_up) for conn in conns))
+    finally:
+        await asyncio.gather(
+            *(conn.close() for conn in conns if conn.sync_connection is not None),
+        )
+
+
+async def _warm_up_connection(conn: AsyncConnection, warm_up: SessionCallback | None) -> None:
+    await conn.execute(text("SELECT 1"))
+    if warm_up is not None:
+        async with AsyncSession(bind=conn) as session:
+            await warm_up(session)
+    await conn.rollback()
@@ -1,13 +1,18 @@
+from collections.abc import Sequence
 from copy import copy
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from sqlalchemy import Row
+from sqlalchemy import Row, inspect
 
 from backend.application.comic.responses import (
     ComicCompactResponseData,
+    ComicExportData,
     ComicResponseData,
+    ResourceVersionData,
     TagResponseData,
+    TranslationExportData,
     TranslationImageResponseData,
     TranslationResponseData,
 )
@@ -18,11 +23,13 @@ from backend.domain.entities import (
     TagEntity,
     TranslationEntity,
     TranslationStatus,
+    build_avif_path,
 )
 from backend.domain.utils import cast_or_none
 from backend.domain.value_objects import (
     ComicId,
     ImageId,
+    ImageMetadata,
     IssueNumber,
     Language,
     PositiveInt,
@@ -32,13 +39,17 @@ from backend.domain.value_objects import (
     TranslationId,
     TranslationTitle,
 )
+from backend.domain.value_objects.image_file import ImageFormat
 from backend.infrastructure.database.models import (
+    BaseModel,
     ComicModel,
     ImageModel,
     TagModel,
     TranslationModel,
 )
 
+T = TypeVar("T")
+
 
 class MappingError(Exception):
     _text: str
@@ -57,10 +68,33 @@ def map_image_model_to_entity(image: ImageModel) -> ImageEntity:
         original_path=cast_or_none(Path, image.original_path),
         converted_path=cast_or_none(Path, image.converted_path),
         converted_2x_path=cast_or_none(Path, image.converted_2x_path),
+        thumbnail_path=cast_or_none(Path, image.thumbnail_path),
+        has_avif=image.has_avif,
+        metadata=map_image_model_to_metadata(image),
         is_deleted=image.is_deleted,
     )
 
 
+def map_image_model_to_metadata(image: ImageModel) -> ImageMetadata | None:
+    if (
+        image.width is None
+        or image.height is None
+        or image.format is None
+        or image.mime is None
+        or image.byte_size is None
+        or image.content_hash is None
+    ):
+        return None
+    return ImageMetadata(
+        width=image.width,
+        height=image.height,
+        format=ImageFormat(image.format),
+        mime=image.mime,
+        size=image.byte_size,
+        content_hash=image.content_hash,
+    )
+
+
 def map_translation_model_to_entity(translation: TranslationModel) -> TranslationEntity:
     return TranslationEntity(
         id=TranslationId(translation.translation_id),
@@ -120,9 +154,17 @@ def map_image_model_to_data(image: ImageModel) -> TranslationImageResponseData:
         original=image.original_path,
         converted=image.converted_path,
         converted_2x=image.converted_2x_path,
+        converted_avif=_avif_path(image.converted_path) if image.has_avif else None,
+        converted_2x_avif=_avif_path(image.converted_2x_path) if image.has_avif else None,
+        width=image.width,
+        height=image.height,
     )
 
 
+def _avif_path(path: str | None) -> str | None:
+    return str(build_avif_path(Path(path))) if path else None
+
+
 def map_translation_model_to_data(translation: TranslationModel) -> TranslationResponseData:
     return TranslationResponseData(
         id=translation.translation_id,
@@ -130,15 +172,18 @@ def map_translation_model_to_data(translation: TranslationModel) -> TranslationR
         title=translation.title,
         language=Language(translation.language),
         tooltip=translation.tooltip,
-        transcript=translation.transcript,
-        translator_comment=translation.translator_comment,
+        transcript=_get_loaded(translation, "transcript", ""),
+        translator_comment=_get_loaded(translation, "translator_comment", ""),
         source_url=translation.source_url,
         images=[map_image_model_to_data(image) for image in translation.images],
         status=TranslationStatus(translation.status),
     )
 
 
-def map_comic_model_to_data(comic: ComicModel) -> ComicResponseData:
+def map_comic_model_to_data(
+    comic: ComicModel,
+    has_translations: Sequence[str],
+) -> ComicResponseData:
     original_translation, translations = _separate_translations(copy(comic.translations))
 
     return ComicResponseData(
@@ -154,7 +199,7 @@ def map_comic_model_to_data(comic: ComicModel) -> ComicResponseData:
         is_interactive=comic.is_interactive,
         tags=[map_tag_model_to_data(tag) for tag in comic.tags],
         images=[map_image_model_to_data(image) for image in original_translation.images],
-        has_translations=[Language(tr.language) for tr in translations],
+        has_translations=[Language(language) for language in has_translations],
         translations=[map_translation_model_to_data(translation) for translation in translations],
     )
 
@@ -173,9 +218,55 @@ def map_row_to_compact_data(row: Row[Any]) -> ComicCompactResponseData:
         publication_date=row.publication_date,
         title=row.title,
         image_url=image_url,
+        thumbnail_url=row.thumbnail_path,
     )
 
 
+def map_row_to_export_data(row: Row[Any]) -> ComicExportData:
+    return ComicExportData(
+        id=row.comic_id,
+        number=row.number,
+        slug=row.slug,
+        publication_date=row.publication_date,
+        title=row.title,
+        tooltip=row.tooltip,
+        xkcd_url=row.source_url,
+        explain_url=row.explain_url,
+        click_url=row.click_url,
+        is_interactive=row.is_interactive,
+        image_url=row.image_url,
+        tags=row.tags,
+        translations=[
+            TranslationExportData(
+                id=tr["id"],
+                language=Language(tr["language"]),
+                title=tr["title"],
+                tooltip=tr["tooltip"],
+                source_url=tr["source_url"],
+            )
+            for tr in row.translations
+        ]
+        if row.translations is not None
+        else None,
+    )
+
+
+def map_row_to_version_data(row: Row[Any]) -> ResourceVersionData:
+    timestamps = [value for value in row if isinstance(value, datetime)]
+
+    return ResourceVersionData(
+        last_modified=max(timestamps),
+        fingerprint=":".join(str(value) for value in row),
+    )
+
+
+def _get_loaded(model: BaseModel, attr: str, default: T) -> T:
+    if attr in inspect(model).unloaded:
+        return default
+    value: T = getattr(model, attr)
+    return value
+
+
 def _separate_translations(
     translations: list[TranslationModel],
 ) -> tuple[TranslationModel, list[TranslationModel]]:
@@ -51,6 +51,14 @@ class ImageModel(BaseModel, TimestampMixin):
     original_path: Mapped[str | None] = mapped_column(default=None)
     converted_path: Mapped[str | None] = mapped_column(default=None)
     converted_2x_path: Mapped[str | None] = mapped_column(default=None)
+    thumbnail_path: Mapped[str | None] = mapped_column(default=None)
+    has_avif: Mapped[bool] = mapped_column(default=False)
+    width: Mapped[int | None] = mapped_column(default=None)
+    height: Mapped[int | None] = mapped_column(default=None)
+    format: Mapped[str | None] = mapped_column(String(10), default=None)
+    mime: Mapped[str | None] = mapped_column(String(50), default=None)
+    byte_size: Mapped[int | None] = mapped_column(default=None)
+    content_hash: Mapped[str | None] = mapped_column(String(64), default=None)
     is_deleted: Mapped[bool] = mapped_column(default=False)
 
 
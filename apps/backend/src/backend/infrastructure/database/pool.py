@@ -0,0 +1,61 @@
+import math
+import time
+from typing import Any
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from backend.infrastructure.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_CONNECTIONS
+
+
+class PoolWaitMonitor:
+    def __init__(self, alpha: float = 0.1, decay_window: float = 5.0) -> None:
+        self._alpha = alpha
+        self._decay_window = decay_window
+        self._value = 0.0
+        self._updated_at = time.monotonic()
+
+    def observe(self, wait_time: float) -> None:
+        self._value = self.wait_time * (1 - self._alpha) + wait_time * self._alpha
+        self._updated_at = time.monotonic()
+
+    @property
+    def wait_time(self) -> float:
+        return self._value * math.exp(-(time.monotonic() - self._updated_at) / self._decay_window)
+
+
+class MonitoredAsyncQueuePool(AsyncAdaptedQueuePool):
+    def __init__(
+        self,
+        creator: Any,
+        wait_monitor: PoolWaitMonitor | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(creator, **kwargs)
+        self.wait_monitor = wait_monitor
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            wait_time = time.monotonic() - started_at
+            DB_POOL_CHECKOUT_WAIT.observe(wait_time)
+            if self.wait_monitor is not None:
+                self.wait_monitor.observe(wait_time)
+            self._report_connections()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._report_connections()
+
+    def _report_connections(self) -> None:
+        DB_POOL_CONNECTIONS.labels(state="in_use").set(self.checkedout())
+        DB_POOL_CONNECTIONS.labels(state="idle").set(self.checkedin())
+        DB_POOL_CONNECTIONS.labels(state="overflow").set(max(self.overflow(), 0))
+
+    def recreate(self) -> "MonitoredAsyncQueuePool":
+        pool: MonitoredAsyncQueuePool = super().recreate()  # type: ignore[assignment]
+        pool.wait_monitor = self.wait_monitor
+        return pool
@@ -1,23 +1,31 @@
 import re
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 from datetime import date
 from functools import singledispatchmethod
-from typing import NoReturn
+from typing import Any, NoReturn
 
 from sqlalchemy import (
     ColumnElement,
+    ColumnExpressionArgument,
     Result,
+    Row,
+    Select,
     and_,
     delete,
+    distinct,
     exists,
     false,
     func,
+    literal_column,
+    null,
+    or_,
     select,
+    true,
     update,
 )
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 from sqlalchemy.exc import DBAPIError, IntegrityError
-from sqlalchemy.orm import contains_eager
+from sqlalchemy.orm import QueryableAttribute, aliased, contains_eager, defer
 
 from backend.application.comic.exceptions import (
     ComicNotFoundError,
@@ -25,11 +33,19 @@ from backend.application.comic.exceptions import (
     ExtraComicTitleAlreadyExistsError,
     TagNotFoundError,
 )
-from backend.application.comic.filters import ComicFilters, TagCombination
+from backend.application.comic.filters import (
+    ComicFilters,
+    TagCombination,
+    TranslationField,
+    TranslationProjection,
+)
 from backend.application.comic.interfaces import ComicRepoInterface
 from backend.application.comic.responses import (
     ComicCompactResponseData,
+    ComicExportData,
     ComicResponseData,
+    ResourceVersionData,
+    TagResponseData,
     TranslationResponseData,
 )
 from backend.application.common.pagination import (
@@ -48,6 +64,9 @@ from backend.infrastructure.database.mappers import (
     map_comic_model_to_data,
     map_comic_model_to_entity,
     map_row_to_compact_data,
+    map_row_to_export_data,
+    map_row_to_version_data,
+    map_tag_model_to_data,
     map_translation_model_to_data,
 )
 from backend.infrastructure.database.models import (
@@ -61,6 +80,21 @@ from backend.infrastructure.database.repositories.base import BaseRepo, RepoErro
 
 ComicCompactRow = tuple[int, int, date, str, str | None, str | None]
 
+EXPORT_YIELD_PER = 500
+
+
+def _aggregate_order_by(
+    target: ColumnExpressionArgument[Any],
+    *order_by: ColumnExpressionArgument[Any],
+) -> ColumnElement[Any]:
+    return aggregate_order_by(target, *order_by)  # type: ignore[no-untyped-call, no-any-return]
+
+
+def _by_comic(row: Row[Any]) -> ComicModel:
+    comic: ComicModel = row[0]
+    return comic
+
+
 TAG_ID_PATTERN = re.compile(r"Key \(tag_id\)=\((\d+)\)")
 
 
@@ -138,31 +172,103 @@ class ComicRepo(BaseRepo, ComicRepoInterface):
         raise NotImplementedError
 
     @get_by.register  # type: ignore[arg-type]
-    async def _(self, comic_id: ComicId) -> ComicResponseData:
-        return await self._get_by(comic_id, ComicModel.comic_id == comic_id.value)
+    async def _(
+        self,
+        comic_id: ComicId,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData:
+        return await self._get_by(comic_id, ComicModel.comic_id == comic_id.value, projection)
 
     @get_by.register  # type: ignore[arg-type]
-    async def _(self, issue_number: IssueNumber) -> ComicResponseData:
-        return await self._get_by(issue_number, ComicModel.number == issue_number.value)
+    async def _(
+        self,
+        issue_number: IssueNumber,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData:
+        return await self._get_by(issue_number, ComicModel.number == issue_number.value, projection)
 
     @get_by.register  # type: ignore[arg-type]
-    async def _(self, slug: str) -> ComicResponseData:
-        return await self._get_by(slug, ComicModel.slug == slug)
+    async def _(
+        self,
+        slug: str,
+        projection: TranslationProjection | None = None,
+    ) -> ComicResponseData:
+        return await self._get_by(slug, ComicModel.slug == slug, projection)
 
     async def _get_by(
         self,
         value: ComicId | IssueNumber | str,
         where_clause: ColumnElement[bool],
+        projection: TranslationProjection | None = None,
     ) -> ComicResponseData:
+        stmt = self._build_get_stmt(where_clause, projection)
+
+        row = (await self.session.execute(stmt)).unique(_by_comic).one_or_none()
+
+        if not row:
+            raise ComicNotFoundError(value)
+
+        return map_comic_model_to_data(row.ComicModel, row.has_translations)
+
+    async def get_many(
+        self,
+        comic_ids: Sequence[ComicId],
+        numbers: Sequence[IssueNumber],
+    ) -> list[ComicResponseData]:
+        stmt = self._build_get_stmt(
+            or_(
+                ComicModel.comic_id.in_({comic_id.value for comic_id in comic_ids}),
+                ComicModel.number.in_({number.value for number in numbers}),
+            ),
+        )
+
+        rows = (await self.session.execute(stmt)).unique(_by_comic).all()
+
+        return [map_comic_model_to_data(row.ComicModel, row.has_translations) for row in rows]
+
+    @staticmethod
+    def _build_get_stmt(
+        where_clause: ColumnElement[bool],
+        projection: TranslationProjection | None = None,
+    ) -> Select[tuple[ComicModel, list[str]]]:
+        translation = aliased(TranslationModel)
+        has_translations_subquery = (
+            select(
+                func.coalesce(
+                    func.array_agg(
+                        _aggregate_order_by(translation.language, translation.translation_id)
+                    ),
+                    literal_column("'{}'"),
+                )
+            )
+            .where(
+                translation.comic_id == ComicModel.comic_id,
+                translation.language != Language.EN,
+                translation.status == TranslationStatus.PUBLISHED,
+            )
+            .scalar_subquery()
+        )
+
+        images_relationship: QueryableAttribute[Any] = TranslationModel.images
+        if projection and not projection.includes(TranslationField.IMAGES):
+            images_relationship = TranslationModel.images.and_(
+                TranslationModel.language == Language.EN
+            )
+
+        deferred_columns = [TranslationModel.transcript, TranslationModel.searchable_text]
+        if not projection or not projection.includes(TranslationField.TRANSLATOR_COMMENT):
+            deferred_columns.append(TranslationModel.translator_comment)
+
         stmt = (
-            select(ComicModel)
+            select(ComicModel, has_translations_subquery.label("has_translations"))
             .outerjoin(ComicModel.tags)
             .join(ComicModel.translations)
-            .outerjoin(TranslationModel.images)
+            .outerjoin(images_relationship)
             .options(
                 contains_eager(ComicModel.tags),
                 contains_eager(ComicModel.translations).options(
-                    contains_eager(TranslationModel.images)
+                    contains_eager(TranslationModel.images),
+                    *(defer(column) for column in deferred_columns),
                 ),
             )
             .where(
@@ -171,12 +277,88 @@ class ComicRepo(BaseRepo, ComicRepoInterface):
             )
         )
 
-        comic: ComicModel | None = (await self.session.scalars(stmt)).unique().one_or_none()
+        if projection is None:
+            stmt = stmt.where(TranslationModel.language == Language.EN)
+        elif projection.languages:
+            stmt = stmt.where(TranslationModel.language.in_({Language.EN, *projection.languages}))
+
+        return stmt
+
+    @singledispatchmethod
+    async def get_version_by(self) -> NoReturn:
+        raise NotImplementedError
+
+    @get_version_by.register  # type: ignore[arg-type]
+    async def _(self, comic_id: ComicId) -> ResourceVersionData:
+        return await self._get_version_by(comic_id, ComicModel.comic_id == comic_id.value)
+
+    @get_version_by.register  # type: ignore[arg-type]
+    async def _(self, issue_number: IssueNumber) -> ResourceVersionData:
+        return await self._get_version_by(issue_number, ComicModel.number == issue_number.value)
+
+    @get_version_by.register  # type: ignore[arg-type]
+    async def _(self, slug: str) -> ResourceVersionData:
+        return await self._get_version_by(slug, ComicModel.slug == slug)
+
+    async def _get_version_by(
+        self,
+        value: ComicId | IssueNumber | str,
+        where_clause: ColumnElement[bool],
+    ) -> ResourceVersionData:
+        translations_lateral = (
+            select(
+                func.max(TranslationModel.updated_at).label("translations_updated_at"),
+                func.count(distinct(TranslationModel.translation_id)).label("translations_count"),
+                func.max(ImageModel.updated_at).label("images_updated_at"),
+                func.count(ImageModel.image_id).label("images_count"),
+            )
+            .select_from(TranslationModel)
+            .outerjoin(
+                ImageModel,
+                and_(
+                    ImageModel.link_type == ImageLinkType.TRANSLATION,
+                    ImageModel.link_id == TranslationModel.translation_id,
+                    ImageModel.is_deleted.is_(false()),
+                ),
+            )
+            .where(TranslationModel.comic_id == ComicModel.comic_id)
+            .lateral()
+        )
+
+        tags_lateral = (
+            select(
+                func.md5(
+                    func.string_agg(
+                        func.concat(TagModel.tag_id, ":", TagModel.name, ":", TagModel.is_visible),
+                        _aggregate_order_by(literal_column("','"), TagModel.tag_id),
+                    )
+                ).label("tags_digest"),
+            )
+            .select_from(TagModel)
+            .join(ComicTagAssociation)
+            .where(ComicTagAssociation.comic_id == ComicModel.comic_id)
+            .lateral()
+        )
+
+        stmt = (
+            select(
+                ComicModel.comic_id.label("id"),
+                ComicModel.updated_at,
+                translations_lateral,
+                tags_lateral,
+            )
+            .select_from(ComicModel)
+            .join(translations_lateral, true())
+            .join(tags_lateral, true())
+            .where(where_clause)
+        )
+
+        row = (await self.session.execute(stmt)).one_or_none()
 
-        if not comic:
+        if row is None:
             raise ComicNotFoundError(value)
 
-        return map_comic_model_to_data(comic)
+        return map_row_to_version_data(row)
 
     async def get_list(
         self,
@@ -188,6 +370,7 @@ class ComicRepo(BaseRepo, ComicRepoInterface):
                 ImageModel.image_id,
                 ImageModel.original_path,
                 ImageModel.converted_path,
+                ImageModel.thumbnail_path,
                 ImageModel.link_id,
                 func.row_number()
                 .over(
@@ -212,6 +395,7 @@ class ComicRepo(BaseRepo, ComicRepoInterface):
                 TranslationModel.title,
                 first_image_subquery.c.original_path,
                 first_image_subquery.c.converted_path,
+                first_image_subquery.c.thumbnail_path,
             )
             .join(ComicModel.translations)
             .outerjoin(
@@ -278,6 +462,95 @@ class ComicRepo(BaseRepo, ComicRepoInterface):
 
         return count, results
 
+    async def stream_export(self, *, with_translations: bool) -> AsyncIterator[ComicExportData]:
+        image_url_subquery = (
+            select(func.coalesce(ImageModel.converted_path, ImageModel.original_path))
+            .where(
+                ImageModel.link_type == ImageLinkType.TRANSLATION,
+                ImageModel.link_id == TranslationModel.translation_id,
+                ImageModel.is_deleted.is_(false()),
+            )
+            .order_by(ImageModel.image_id)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        tags_subquery = (
+            select(
+                func.coalesce(
+                    func.array_agg(_aggregate_order_by(TagModel.name, TagModel.name)),
+                    literal_column("'{}'"),
+                )
+            )
+            .select_from(TagModel)
+            .join(ComicTagAssociation)
+            .where(
+                ComicTagAssociation.comic_id == ComicModel.comic_id,
+                TagModel.is_visible.is_(true()),
+            )
+            .scalar_subquery()
+        )
+
+        translations_column: ColumnElement[Any] = null()
+        if with_translations:
+            translation = aliased(TranslationModel)
+            translations_column = (
+                select(
+                    func.coalesce(
+                        func.json_agg(
+                            _aggregate_order_by(
+                                func.json_build_object(
+                                    "id",
+                                    translation.translation_id,
+                                    "language",
+                                    translation.language,
+                                    "title",
+                                    translation.title,
+                                    "tooltip",
+                                    translation.tooltip,
+                                    "source_url",
+                                    translation.source_url,
+                                ),
+                                translation.translation_id,
+                            )
+                        ),
+                        literal_column("'[]'::json"),
+                    )
+                )
+                .where(
+                    translation.comic_id == ComicModel.comic_id,
+                    translation.language != Language.EN,
+                    translation.status == TranslationStatus.PUBLISHED,
+                )
+                .scalar_subquery()
+            )
+
+        stmt = (
+            select(
+                ComicModel.comic_id,
+                ComicModel.number,
+                ComicModel.slug,
+                ComicModel.publication_date,
+                ComicModel.explain_url,
+                ComicModel.click_url,
+                ComicModel.is_interactive,
+                TranslationModel.title,
+                TranslationModel.tooltip,
+                TranslationModel.source_url,
+                image_url_subquery.label("image_url"),
+                tags_subquery.label("tags"),
+                translations_column.label("translations"),
+            )
+            .join(ComicModel.translations)
+            .where(TranslationModel.language == Language.EN)
+            .order_by(ComicModel.number.asc().nulls_last(), ComicModel.comic_id.asc())
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield map_row_to_export_data(row)
+
     async def get_issue_number_by_id(self, comic_id: ComicId) -> IssueNumber | None:
         stmt = select(ComicModel.number).where(ComicModel.comic_id == comic_id.value)
 
@@ -314,38 +587,124 @@ class ComicRepo(BaseRepo, ComicRepoInterface):
 
         return [map_translation_model_to_data(translation) for translation in translations]
 
-    async def relink_tags(self, comic_id: ComicId, tag_ids: Sequence[TagId]) -> None:
+    async def relink_tags(
+        self,
+        comic_id: ComicId,
+        tag_ids: Sequence[TagId],
+    ) -> list[TagResponseData]:
         await self.session.execute(
             delete(ComicTagAssociation).where(ComicTagAssociation.comic_id == comic_id.value)
         )
 
-        if tag_ids:
-            try:
-                await self.session.execute(
-                    insert(ComicTagAssociation).values(
-                        [
-                            {
-                                "comic_id": comic_id.value,
-                                "tag_id": tag_id.value,
-                            }
-                            for tag_id in tag_ids
-                        ]
-                    )
+        if not tag_ids:
+            return []
+
+        inserted = (
+            insert(ComicTagAssociation)
+            .values(
+                [
+                    {
+                        "comic_id": comic_id.value,
+                        "tag_id": tag_id.value,
+                    }
+                    for tag_id in tag_ids
+                ]
+            )
+            .returning(ComicTagAssociation.tag_id)
+            .cte("inserted")
+        )
+
+        try:
+            tags: Sequence[TagModel] = (
+                await self.session.scalars(
+                    select(TagModel)
+                    .where(TagModel.tag_id.in_(select(inserted.c.tag_id)))
+                    .order_by(TagModel.tag_id)
                 )
-            except IntegrityError as err:
-                self._handle_db_error(err)
+            ).all()
+        except IntegrityError as err:
+            self._handle_db_error(err)
 
-    async def load(self, comic_id: ComicId) -> ComicEntity:  # TODO: with_for_update?
-        stmt = (
-            select(ComicModel)
-            .join(TranslationModel)
-            .where(
-                ComicModel.comic_id == comic_id.value,
-                TranslationModel.language == Language.EN,
+        return [map_tag_model_to_data(tag) for tag in tags]
+
+    async def relink_many_tags(self, links: Mapping[ComicId, Sequence[TagId]]) -> None:
+        if not links:
+            return
+
+        await self.session.execute(
+            delete(ComicTagAssociation).where(
+                ComicTagAssociation.comic_id.in_(comic_id.value for comic_id in links)
+            )
+        )
+
+        rows = [
+            {"comic_id": comic_id.value, "tag_id": tag_id}
+            for comic_id, tag_ids in links.items()
+            for tag_id in dict.fromkeys(tag_id.value for tag_id in tag_ids)
+        ]
+
+        if not rows:
+            return
+
+        try:
+            await self.session.execute(insert(ComicTagAssociation).values(rows))
+        except IntegrityError as err:
+            self._handle_db_error(err)
+
+    async def update_many(self, comics: Sequence[ComicEntity]) -> None:
+        if not comics:
+            return
+
+        try:
+            await self.session.execute(
+                update(ComicModel),
+                [
+                    {
+                        "comic_id": comic.id.value,
+                        "number": comic.number.value if comic.number else None,
+                        "slug": comic.slug,
+                        "publication_date": comic.publication_date,
+                        "explain_url": comic.explain_url,
+                        "click_url": comic.click_url,
+                        "is_interactive": comic.is_interactive,
+                    }
+                    for comic in comics
+                ],
+            )
+
+            await self.session.execute(
+                update(TranslationModel),
+                [
+                    {
+                        "translation_id": comic.original_translation_id.value,
+                        "title": comic.title.value,
+                        "tooltip": comic.tooltip,
+                        "transcript": comic.transcript,
+                        "source_url": comic.xkcd_url,
+                        "searchable_text": comic.searchable_text,
+                    }
+                    for comic in comics
+                ],
+            )
+        except IntegrityError as err:
+            self._handle_db_error(err)
+
+    async def get_extra_comic_ids_by_slugs(self, slugs: Sequence[str]) -> dict[str, ComicId]:
+        if not slugs:
+            return {}
+
+        rows = await self.session.execute(
+            select(ComicModel.slug, ComicModel.comic_id).where(
+                ComicModel.number.is_(None),
+                ComicModel.slug.in_(slugs),
             )
-            .options(contains_eager(ComicModel.translations))
         )
 
+        return {slug: ComicId(comic_id) for slug, comic_id in rows}
+
+    async def load(self, comic_id: ComicId) -> ComicEntity:  # TODO: with_for_update?
+        stmt = self._build_load_stmt(ComicModel.comic_id == comic_id.value)
+
         comic: ComicModel | None = (await self.session.scalars(stmt)).unique().one_or_none()
 
         if comic is None:
@@ -353,6 +712,27 @@ class ComicRepo(BaseRepo, ComicRepoInterface):
 
         return map_comic_model_to_entity(comic)
 
+    async def load_many(self, comic_ids: Sequence[ComicId]) -> dict[ComicId, ComicEntity]:
+        if not comic_ids:
+            return {}
+
+        stmt = self._build_load_stmt(
+            ComicModel.comic_id.in_(comic_id.value for comic_id in comic_ids)
+        )
+
+        comics: Sequence[ComicModel] = (await self.session.scalars(stmt)).unique().all()
+
+        return {ComicId(comic.comic_id): map_comic_model_to_entity(comic) for comic in comics}
+
+    @staticmethod
+    def _build_load_stmt(where_clause: ColumnElement[bool]) -> Select[tuple[ComicModel]]:
+        return (
+            select(ComicModel)
+            .join(TranslationModel)
+            .where(where_clause, TranslationModel.language == Language.EN)
+            .options(contains_eager(ComicModel.translations))
+        )
+
     def _handle_db_error(
         self,
         err: DBAPIError,
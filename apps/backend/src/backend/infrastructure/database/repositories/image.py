@@ -1,13 +1,14 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import false, select, update
 from sqlalchemy.dialects.postgresql import insert
 
 from backend.application.image.exceptions import ImageNotFoundError
 from backend.application.image.interfaces import ImageRepoInterface
 from backend.domain.entities import ImageEntity, ImageLinkType, NewImageEntity
 from backend.domain.utils import cast_or_none
-from backend.domain.value_objects import ImageId, PositiveInt
+from backend.domain.value_objects import ImageId, ImageMetadata, PositiveInt
 from backend.infrastructure.database.mappers import map_image_model_to_entity
 from backend.infrastructure.database.models import ImageModel
 from backend.infrastructure.database.repositories import BaseRepo
@@ -24,7 +25,10 @@ class ImageRepo(BaseRepo, ImageRepoInterface):
                 original_path=cast_or_none(str, image.original_path),
                 converted_path=cast_or_none(str, image.converted_path),
                 converted_2x_path=cast_or_none(str, image.converted_2x_path),
+                thumbnail_path=cast_or_none(str, image.thumbnail_path),
+                has_avif=image.has_avif,
                 is_deleted=image.is_deleted,
+                **self._build_metadata_values(image.metadata),
             )
             .returning(ImageModel.image_id)
         )
@@ -34,15 +38,16 @@ class ImageRepo(BaseRepo, ImageRepoInterface):
         await self.session.execute(
             update(ImageModel)
             .where(ImageModel.image_id == image.id.value)
-            .values(
-                temp_image_id=image.temp_image_id.value if image.temp_image_id else None,
-                link_type=image.link_type,
-                link_id=image.link_id.value if image.link_id else None,
-                original_path=cast_or_none(str, image.original_path),
-                converted_path=cast_or_none(str, image.converted_path),
-                converted_2x_path=cast_or_none(str, image.converted_2x_path),
-                is_deleted=image.is_deleted,
-            )
+            .values(**self._build_values(image))
+        )
+
+    async def update_many(self, images: Sequence[ImageEntity]) -> None:
+        if not images:
+            return
+
+        await self.session.execute(
+            update(ImageModel),
+            [{"image_id": image.id.value, **self._build_values(image)} for image in images],
         )
 
     async def get_linked_image_ids(
@@ -66,3 +71,66 @@ class ImageRepo(BaseRepo, ImageRepoInterface):
             raise ImageNotFoundError(image_id)
 
         return map_image_model_to_entity(image)
+
+    async def load_many(self, image_ids: Sequence[ImageId]) -> dict[ImageId, ImageEntity]:
+        if not image_ids:
+            return {}
+
+        images: Iterable[ImageModel] = await self.session.scalars(
+            select(ImageModel).where(
+                ImageModel.image_id.in_(image_id.value for image_id in image_ids)
+            )
+        )
+
+        return {ImageId(image.image_id): map_image_model_to_entity(image) for image in images}
+
+    async def get_without_thumbnail(
+        self,
+        limit: int,
+        after_id: ImageId | None = None,
+    ) -> Sequence[ImageEntity]:
+        stmt = (
+            select(ImageModel)
+            .where(
+                ImageModel.original_path.is_not(None),
+                ImageModel.temp_image_id.is_(None),
+                ImageModel.thumbnail_path.is_(None),
+                ImageModel.is_deleted.is_(false()),
+            )
+            .order_by(ImageModel.image_id)
+            .limit(limit)
+        )
+
+        if after_id is not None:
+            stmt = stmt.where(ImageModel.image_id > after_id.value)
+
+        images: Iterable[ImageModel] = await self.session.scalars(stmt)
+
+        return [map_image_model_to_entity(image) for image in images]
+
+    @staticmethod
+    def _build_values(image: ImageEntity) -> dict[str, Any]:
+        return {
+            "temp_image_id": image.temp_image_id.value if image.temp_image_id else None,
+            "link_type": image.link_type,
+            "link_id": image.link_id.value if image.link_id else None,
+            "original_path": cast_or_none(str, image.original_path),
+            "converted_path": cast_or_none(str, image.converted_path),
+            "converted_2x_path": cast_or_none(str, image.converted_2x_path),
+            "thumbnail_path": cast_or_none(str, image.thumbnail_path),
+            "has_avif": image.has_avif,
+            "is_deleted": image.is_deleted,
+        }
+
+    @staticmethod
+    def _build_metadata_values(metadata: ImageMetadata | None) -> dict[str, Any]:
+        if metadata is None:
+            return {}
+        return {
+            "width": metadata.width,
+            "height": metadata.height,
+            "format": metadata.format,
+            "mime": metadata.mime,
+            "byte_size": metadata.size,
+            "content_hash": metadata.content_hash,
+        }
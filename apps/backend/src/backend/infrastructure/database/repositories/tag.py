@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Sequence
 from typing import NoReturn
 
 from sqlalchemy import delete, select, update
@@ -35,39 +35,46 @@ class TagRepo(BaseRepo, TagRepoInterface):
 
         return TagId(tag_id)
 
-    async def create_many(self, tags: Sequence[NewTagEntity]) -> Sequence[TagId]:
+    async def create_many(self, tags: Sequence[NewTagEntity]) -> Sequence[tuple[TagId, bool]]:
         if not tags:
             return []
 
-        stmt = select(TagModel).where(TagModel.slug.in_(t.slug for t in tags))
-
-        existing_db_tags: Iterable[TagModel] = (await self.session.scalars(stmt)).all()
-
-        db_tag_slugs = {t.slug for t in existing_db_tags}
-        new_tags = [t for t in tags if t.slug not in db_tag_slugs]
-
-        if new_tags:
-            await self.session.execute(
-                insert(TagModel)
-                .values(
-                    [
-                        {
-                            "name": tag.name.value,
-                            "slug": tag.name.slug,
-                            "is_visible": tag.is_visible,
-                            "from_explainxkcd": tag.from_explainxkcd,
-                        }
-                        for tag in new_tags
-                    ]
-                )
-                .on_conflict_do_nothing(constraint="uq_tags_slug")
+        unique_tags = {tag.slug: tag for tag in reversed(tags)}
+
+        inserted = await self.session.execute(
+            insert(TagModel)
+            .values(
+                [
+                    {
+                        "name": tag.name.value,
+                        "slug": tag.slug,
+                        "is_visible": tag.is_visible,
+                        "from_explainxkcd": tag.from_explainxkcd,
+                    }
+                    for tag in unique_tags.values()
+                ]
             )
+            .on_conflict_do_nothing(constraint="uq_tags_slug")
+            .returning(TagModel.slug, TagModel.tag_id)
+        )
+        created: dict[str, int] = dict(inserted.tuples().all())
 
-            new_db_tags: Iterable[TagModel] = (await self.session.scalars(stmt)).all()
+        existing: dict[str, int] = {}
+        if missing_slugs := unique_tags.keys() - created.keys():
+            selected = await self.session.execute(
+                select(TagModel.slug, TagModel.tag_id).where(TagModel.slug.in_(missing_slugs))
+            )
+            existing = dict(selected.tuples().all())
 
-            return [TagId(tag.tag_id) for tag in new_db_tags]
+        results = []
+        for tag in tags:
+            if tag_id := created.pop(tag.slug, None):
+                results.append((TagId(tag_id), True))
+                existing[tag.slug] = tag_id
+            else:
+                results.append((TagId(existing[tag.slug]), False))
 
-        return [TagId(tag.tag_id) for tag in existing_db_tags]
+        return results
 
     async def update(self, tag: TagEntity) -> None:
         stmt = (
@@ -95,6 +102,16 @@ class TagRepo(BaseRepo, TagRepoInterface):
     async def load(self, tag_id: TagId) -> TagEntity:
         return map_tag_model_to_entity(tag=await self._get_by_id(tag_id))  # TODO: with_for_update?
 
+    async def get_existing_ids(self, tag_ids: Sequence[TagId]) -> set[TagId]:
+        if not tag_ids:
+            return set()
+
+        existing_ids = await self.session.scalars(
+            select(TagModel.tag_id).where(TagModel.tag_id.in_(tag_id.value for tag_id in tag_ids))
+        )
+
+        return {TagId(tag_id) for tag_id in existing_ids}
+
     async def _get_by_id(self, tag_id: TagId) -> TagModel:
         tag = await self.session.get(TagModel, tag_id.value)
         if tag is None:
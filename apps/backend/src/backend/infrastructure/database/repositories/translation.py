@@ -1,6 +1,6 @@
 from typing import NoReturn
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import and_, delete, false, func, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.orm import contains_eager
@@ -11,18 +11,20 @@ from backend.application.comic.exceptions import (
     TranslationNotFoundError,
 )
 from backend.application.comic.interfaces import TranslationRepoInterface
-from backend.application.comic.responses import TranslationResponseData
+from backend.application.comic.responses import ResourceVersionData, TranslationResponseData
 from backend.domain.entities import (
+    ImageLinkType,
     NewTranslationEntity,
     TranslationEntity,
 )
 from backend.domain.value_objects import ComicId, Language
 from backend.domain.value_objects.common import TranslationId
 from backend.infrastructure.database.mappers import (
+    map_row_to_version_data,
     map_translation_model_to_data,
     map_translation_model_to_entity,
 )
-from backend.infrastructure.database.models import TranslationModel
+from backend.infrastructure.database.models import ImageModel, TranslationModel
 from backend.infrastructure.database.repositories import BaseRepo, RepoError
 
 
@@ -100,6 +102,33 @@ class TranslationRepo(BaseRepo, TranslationRepoInterface):
 
         return map_translation_model_to_data(translation)
 
+    async def get_version_by_id(self, translation_id: TranslationId) -> ResourceVersionData:
+        stmt = (
+            select(
+                TranslationModel.translation_id.label("id"),
+                TranslationModel.updated_at,
+                func.max(ImageModel.updated_at).label("images_updated_at"),
+                func.count(ImageModel.image_id).label("images_count"),
+            )
+            .outerjoin(
+                ImageModel,
+                and_(
+                    ImageModel.link_type == ImageLinkType.TRANSLATION,
+                    ImageModel.link_id == TranslationModel.translation_id,
+                    ImageModel.is_deleted.is_(false()),
+                ),
+            )
+            .where(TranslationModel.translation_id == translation_id.value)
+            .group_by(TranslationModel.translation_id)
+        )
+
+        row = (await self.session.execute(stmt)).one_or_none()
+
+        if row is None:
+            raise TranslationNotFoundError(translation_id)
+
+        return map_row_to_version_data(row)
+
     async def load(self, translation_id: TranslationId) -> TranslationEntity:
         translation = await self.session.get(TranslationModel, translation_id.value)
 
@@ -15,6 +15,9 @@ class ImageFSFileManager(ImageFileManagerInterface):
         save_abs_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copyfile(image.source, save_abs_path)
 
+    async def download(self, path: Path, save_abs_path: Path) -> None:
+        shutil.copyfile(self.root_dir / path, save_abs_path)
+
     async def move(self, path_from: Path, path_to: Path) -> None:
         old_abs_path, new_abs_path = self.root_dir / path_from, self.root_dir / path_to
         new_abs_path.parent.mkdir(parents=True, exist_ok=True)
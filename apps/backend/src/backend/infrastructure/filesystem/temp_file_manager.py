@@ -56,6 +56,9 @@ class TempFileManager(TempFileManagerInterface):
 
         return temp_file_id
 
+    def new_path(self) -> Path:
+        return self.temp_dir / str(uuid4())
+
     def get_abs_path(self, temp_file_id: TempFileUUID) -> Path:
         if not (abs_path := self.temp_dir / str(temp_file_id.value)).exists():
             raise TempFileNotFoundError(temp_file_id)
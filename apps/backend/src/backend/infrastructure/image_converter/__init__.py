@@ -0,0 +1,4 @@
+from .budget import MemoryBudget as MemoryBudget
+from .config import ImageConverterConfig as ImageConverterConfig
+from .converter import ConversionOptions as ConversionOptions
+from .converter import ImageConverter as ImageConverter
@@ -0,0 +1,31 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from backend.infrastructure.metrics import IMAGE_DECODE_MEMORY
+
+
+class MemoryBudget:
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._reserved = 0
+        self._condition = asyncio.Condition()
+
+        IMAGE_DECODE_MEMORY.labels(state="limit").set(limit)
+
+    @asynccontextmanager
+    async def reserve(self, amount: int) -> AsyncIterator[None]:
+        amount = min(amount, self._limit)
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._reserved + amount <= self._limit)
+            self._reserved += amount
+            IMAGE_DECODE_MEMORY.labels(state="reserved").set(self._reserved)
+
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._reserved -= amount
+                IMAGE_DECODE_MEMORY.labels(state="reserved").set(self._reserved)
+                self._condition.notify_all()
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class EncodingEffort:
+    method: int = 4
+    search_method: int = 2
+    max_attempts: int = 3
+
+
+@dataclass(slots=True)
+class ImageConverterConfig:
+    processes: int | None = None
+    max_tasks_per_child: int = 20
+    memory_budget: int = 1024 * 1024 * 1024
+    thumbnail_width: int = 300
+    width_1x: int = 740
+    avif: bool = False
+    avif_quality: int = 75
+    avif_min_saving: float = 0.1
+    max_animation_frames: int = 300
+    max_animation_duration: float = 60.0
+    min_quality: int = 60
+    max_quality: int = 95
+    min_ssim: float | None = 0.98
+    max_size_ratio: float = 1.0
+    interactive: EncodingEffort = field(default_factory=EncodingEffort)
+    background: EncodingEffort = field(
+        default_factory=lambda: EncodingEffort(method=6, search_method=4, max_attempts=6),
+    )
@@ -0,0 +1,334 @@
+import asyncio
+import time
+import warnings
+from collections.abc import Collection
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pillow_avif  # type: ignore[import-untyped] # noqa: F401
+from PIL import Image, ImageSequence
+from PIL.Image import Image as PILImage
+
+from backend.application.image.exceptions import ImageConversionError
+from backend.application.image.interfaces import (
+    ConversionPriority,
+    ConvertedImage,
+    ImageConverterInterface,
+)
+from backend.domain.entities import ImageVariant
+from backend.domain.value_objects.image_file import ImageFileObj, ImageFormat
+from backend.infrastructure.image_converter.budget import MemoryBudget
+from backend.infrastructure.image_converter.config import EncodingEffort
+from backend.infrastructure.image_converter.encoding import (
+    encode_lossless,
+    encode_lossy,
+    is_lossless_candidate,
+    predicts_no_gain,
+)
+from backend.infrastructure.metrics import IMAGE_CONVERSION_DURATION
+
+warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+
+MAX_IMAGE_PIXELS = int(1024 * 1024 * 1024 // 4 // 3)
+MAX_WEBP_SIDE_SIZE = 16383
+AVIF_SPEED = 6
+REDUCING_GAP = 3.0
+DECODE_BYTES_PER_PIXEL = 4
+DECODE_COPIES = 2
+
+
+@dataclass(slots=True)
+class ConversionResult:
+    paths: dict[ImageVariant, Path] = field(default_factory=dict)
+    avif_paths: dict[ImageVariant, Path] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ConversionOptions:
+    avif_quality: int | None = None
+    avif_min_saving: float = 0.0
+    max_animation_frames: int = 300
+    max_animation_duration: float = 60.0
+    min_quality: int = 60
+    max_quality: int = 95
+    min_ssim: float | None = None
+    max_size_ratio: float = 1.0
+    efforts: dict[ConversionPriority, EncodingEffort] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ImageConverter(ImageConverterInterface):
+    executor: Executor
+    variant_widths: dict[ImageVariant, int]
+    options: ConversionOptions = field(default_factory=ConversionOptions)
+    memory_budget: MemoryBudget | None = None
+
+    async def convert_to_webp(
+        self,
+        original: ImageFileObj,
+        variants: Collection[ImageVariant] | None = None,
+        priority: ConversionPriority = ConversionPriority.INTERACTIVE,
+    ) -> ConvertedImage:
+        source_format = original.format
+
+        reservation = (
+            self.memory_budget.reserve(_estimate_decode_memory(original))
+            if self.memory_budget
+            else nullcontext()
+        )
+
+        async with reservation:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                convert_to_webp,
+                original.source,
+                source_format,
+                variants if variants is not None else tuple(ImageVariant),
+                self.variant_widths,
+                self.options,
+                self.options.efforts.get(priority, EncodingEffort()),
+            )
+
+        for stage, duration in result.timings.items():
+            IMAGE_CONVERSION_DURATION.labels(stage=stage, format=str(source_format)).observe(
+                duration
+            )
+
+        return ConvertedImage(
+            webp={variant: ImageFileObj(path) for variant, path in result.paths.items()},
+            avif={variant: ImageFileObj(path) for variant, path in result.avif_paths.items()},
+        )
+
+
+def _estimate_decode_memory(original: ImageFileObj) -> int:
+    width, height = original.dimensions
+    return width * height * DECODE_BYTES_PER_PIXEL * DECODE_COPIES
+
+
+def convert_to_webp(
+    source: Path,
+    source_format: ImageFormat,
+    variants: Collection[ImageVariant],
+    variant_widths: dict[ImageVariant, int],
+    options: ConversionOptions,
+    effort: EncodingEffort,
+) -> ConversionResult:
+    result = ConversionResult()
+    max_size = source.stat().st_size * options.max_size_ratio
+
+    with Image.open(source) as image:
+        started_at = time.perf_counter()
+
+        source_width, source_height = image.size
+        widths, durations = _inspect(
+            image, source, source_format, variants, variant_widths, options
+        )
+
+        if widths and source_width not in widths.values() and not durations:
+            largest_width = max(widths.values())
+            image.draft(None, (largest_width, _scaled_height(image.size, largest_width)))
+
+        result.timings["inspect"] = time.perf_counter() - started_at
+        started_at = time.perf_counter()
+
+        resizable: PILImage | None = None
+        lossy_images: dict[ImageVariant, PILImage] = {}
+        for variant, width in widths.items():
+            path = source.with_name(f"{source.stem}_{variant}")
+
+            if durations and variant != ImageVariant.THUMBNAIL:
+                lossless = source_format in {ImageFormat.PNG, ImageFormat.GIF}
+                _save_animation(image, path, durations, lossless, effort)
+            elif width == source_width:
+                variant_image = image
+                lossless = is_lossless_candidate(image, source_format)
+                path.write_bytes(_encode_still(variant_image, lossless, max_size, options, effort))
+            else:
+                resizable = resizable or _to_resizable(image)
+                variant_image = resizable.resize(
+                    (width, _scaled_height((source_width, source_height), width)),
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=REDUCING_GAP,
+                )
+                lossless = False
+                path.write_bytes(_encode_still(variant_image, lossless, max_size, options, effort))
+
+            if path.stat().st_size > max_size:
+                path.unlink()
+                continue
+
+            result.paths[variant] = path
+            if not lossless and not durations:
+                lossy_images[variant] = variant_image
+
+        result.timings["encode"] = time.perf_counter() - started_at
+
+        if options.avif_quality is not None and not durations:
+            started_at = time.perf_counter()
+            _encode_avif(result, lossy_images, options.avif_quality, options.avif_min_saving)
+            result.timings["encode_avif"] = time.perf_counter() - started_at
+
+    if not result.paths:
+        raise ImageConversionError(
+            path=source,
+            reason="Converted image file size is larger than original image file size.",
+        )
+
+    return result
+
+
+def _inspect(
+    image: PILImage,
+    source: Path,
+    source_format: ImageFormat,
+    variants: Collection[ImageVariant],
+    variant_widths: dict[ImageVariant, int],
+    options: ConversionOptions,
+) -> tuple[dict[ImageVariant, int], list[int]]:
+    if _has_too_large_side_sizes(image):
+        raise ImageConversionError(source, "Image is too large.")
+
+    durations: list[int] = []
+    if getattr(image, "is_animated", False):
+        durations = _read_frame_durations(image, source, options)
+        image.seek(0)
+
+    widths = _plan_widths(image.width, variants, variant_widths, animated=bool(durations))
+
+    if image.width in widths.values() and predicts_no_gain(
+        image,
+        source_format,
+        source.stat().st_size,
+    ):
+        widths = {variant: width for variant, width in widths.items() if width != image.width}
+
+    if not widths:
+        raise ImageConversionError(source, "WebP is not expected to beat the original.")
+
+    return widths, durations
+
+
+def _encode_still(
+    image: PILImage,
+    lossless: bool,
+    max_size: float | None,
+    options: ConversionOptions,
+    effort: EncodingEffort,
+) -> bytes:
+    if lossless:
+        return encode_lossless(image, effort)
+    return encode_lossy(
+        image,
+        effort,
+        min_quality=options.min_quality,
+        max_quality=options.max_quality,
+        min_ssim=options.min_ssim,
+        max_size=max_size,
+    )
+
+
+def _encode_avif(
+    result: ConversionResult,
+    lossy_images: dict[ImageVariant, PILImage],
+    quality: int,
+    min_saving: float,
+) -> None:
+    for variant, variant_image in lossy_images.items():
+        path = result.paths[variant].with_name(f"{result.paths[variant].name}_avif")
+        variant_image.save(
+            fp=path,
+            format="AVIF",
+            quality=quality,
+            speed=AVIF_SPEED,
+            subsampling="4:4:4",
+        )
+        result.avif_paths[variant] = path
+
+    webp_size = sum(result.paths[variant].stat().st_size for variant in result.avif_paths)
+    avif_size = sum(path.stat().st_size for path in result.avif_paths.values())
+
+    if avif_size > webp_size * (1 - min_saving):
+        for path in result.avif_paths.values():
+            path.unlink()
+        result.avif_paths.clear()
+
+
+def _read_frame_durations(
+    image: PILImage,
+    source: Path,
+    options: ConversionOptions,
+) -> list[int]:
+    durations = []
+    for frame in ImageSequence.Iterator(image):
+        durations.append(frame.info.get("duration", 0))
+
+        if len(durations) > options.max_animation_frames:
+            raise ImageConversionError(source, "Animation has too many frames.")
+        if sum(durations) > options.max_animation_duration * 1000:
+            raise ImageConversionError(source, "Animation is too long.")
+
+    return durations
+
+
+def _save_animation(
+    image: PILImage,
+    path: Path,
+    durations: list[int],
+    lossless: bool,
+    effort: EncodingEffort,
+) -> None:
+    image.save(
+        fp=path,
+        format=ImageFormat.WEBP,
+        save_all=True,
+        duration=durations,
+        loop=image.info.get("loop", 0),
+        lossless=lossless,
+        quality=100 if lossless else 85,
+        method=effort.method,
+        minimize_size=True,
+    )
+
+
+def _plan_widths(
+    source_width: int,
+    variants: Collection[ImageVariant],
+    variant_widths: dict[ImageVariant, int],
+    animated: bool = False,
+) -> dict[ImageVariant, int]:
+    widths = {
+        variant: min(variant_widths[variant], source_width)
+        for variant in (ImageVariant.THUMBNAIL, ImageVariant.X1)
+        if variant in variants
+    }
+
+    if animated:
+        if ImageVariant.X1 in widths:
+            widths[ImageVariant.X1] = source_width
+    elif ImageVariant.X2 in variants and source_width > variant_widths[ImageVariant.X1]:
+        widths[ImageVariant.X2] = source_width
+
+    return widths
+
+
+def _scaled_height(size: tuple[int, int], width: int) -> int:
+    return max(round(size[1] * width / size[0]), 1)
+
+
+def _to_resizable(image: PILImage) -> PILImage:
+    if image.mode in {"RGB", "RGBA", "L", "LA"}:
+        return image
+    return image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+
+def _has_too_large_side_sizes(image: PILImage) -> bool:
+    return any(
+        [
+            (image.height * image.width) > MAX_IMAGE_PIXELS,
+            image.width > MAX_WEBP_SIDE_SIZE,
+            image.height > MAX_WEBP_SIDE_SIZE,
+        ]
+    )
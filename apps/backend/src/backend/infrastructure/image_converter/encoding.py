@@ -0,0 +1,144 @@
+from collections.abc import Callable
+from io import BytesIO
+
+from PIL import Image
+from PIL.Image import Image as PILImage
+
+from backend.domain.value_objects.image_file import ImageFormat
+from backend.infrastructure.image_converter.config import EncodingEffort
+
+LOSSLESS_MAX_COLORS = 4096
+MIN_BITS_PER_PIXEL = 0.02
+MIN_JPEG_QUALITY = 30
+SSIM_SIZE = 512
+SSIM_BLOCK = 8
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+JPEG_STD_LUMINANCE_TABLE_SUM = 3688
+JPEG_BASE_SCALE = 100
+
+
+def is_lossless_candidate(image: PILImage, source_format: ImageFormat) -> bool:
+    if source_format not in {ImageFormat.PNG, ImageFormat.GIF}:
+        return False
+    return image.mode == "P" or image.getcolors(LOSSLESS_MAX_COLORS) is not None
+
+
+def predicts_no_gain(image: PILImage, source_format: ImageFormat, source_size: int) -> bool:
+    if source_size * 8 / (image.width * image.height) < MIN_BITS_PER_PIXEL:
+        return True
+
+    if source_format == ImageFormat.JPG and (tables := getattr(image, "quantization", None)):
+        return _estimate_jpeg_quality(tables[0]) < MIN_JPEG_QUALITY
+
+    return False
+
+
+def encode_lossless(image: PILImage, effort: EncodingEffort) -> bytes:
+    return _encode(image, quality=100, method=effort.method, lossless=True)
+
+
+def encode_lossy(
+    image: PILImage,
+    effort: EncodingEffort,
+    min_quality: int,
+    max_quality: int,
+    min_ssim: float | None = None,
+    max_size: float | None = None,
+) -> bytes:
+    attempts: dict[int, bytes] = {}
+
+    def encode(quality: int) -> bytes:
+        if quality not in attempts:
+            attempts[quality] = _encode(image, quality=quality, method=effort.search_method)
+        return attempts[quality]
+
+    quality = max_quality
+
+    if min_ssim is not None:
+        reference = _ssim_samples(image)
+        quality = _bisect_quality(
+            min_quality,
+            max_quality,
+            lambda q: _ssim(reference, _ssim_samples(_decode(encode(q)))) >= min_ssim,
+            effort.max_attempts,
+        )
+
+    if max_size is not None and len(encode(quality)) > max_size:
+        too_large_from = _bisect_quality(
+            min_quality,
+            quality,
+            lambda q: len(encode(q)) > max_size,
+            effort.max_attempts,
+        )
+        quality = max(too_large_from - 1, min_quality)
+
+    if effort.method == effort.search_method:
+        return encode(quality)
+    return _encode(image, quality=quality, method=effort.method)
+
+
+def _bisect_quality(low: int, high: int, passes: Callable[[int], bool], attempts: int) -> int:
+    found = high
+    while low <= high and attempts > 0:
+        attempts -= 1
+        middle = (low + high) // 2
+        if passes(middle):
+            found, high = middle, middle - 1
+        else:
+            low = middle + 1
+    return found
+
+
+def _encode(image: PILImage, quality: int, method: int, lossless: bool = False) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format=ImageFormat.WEBP, quality=quality, method=method, lossless=lossless)
+    return buffer.getvalue()
+
+
+def _decode(data: bytes) -> PILImage:
+    image: PILImage = Image.open(BytesIO(data))
+    image.load()
+    return image
+
+
+def _ssim_samples(image: PILImage) -> tuple[int, list[int]]:
+    gray = image.convert("L")
+    gray.thumbnail((SSIM_SIZE, SSIM_SIZE), Image.Resampling.BOX)
+    return gray.width, list(gray.getdata())
+
+
+def _ssim(reference: tuple[int, list[int]], candidate: tuple[int, list[int]]) -> float:
+    width, x = reference
+    _, y = candidate
+    height = len(x) // width
+    n = SSIM_BLOCK * SSIM_BLOCK
+
+    scores = []
+    for top in range(0, height - SSIM_BLOCK + 1, SSIM_BLOCK):
+        for left in range(0, width - SSIM_BLOCK + 1, SSIM_BLOCK):
+            rows = [
+                slice(row * width + left, row * width + left + SSIM_BLOCK)
+                for row in range(top, top + SSIM_BLOCK)
+            ]
+            xs = [value for row in rows for value in x[row]]
+            ys = [value for row in rows for value in y[row]]
+
+            mean_x, mean_y = sum(xs) / n, sum(ys) / n
+            var_x = sum(value * value for value in xs) / n - mean_x * mean_x
+            var_y = sum(value * value for value in ys) / n - mean_y * mean_y
+            cov = sum(a * b for a, b in zip(xs, ys, strict=True)) / n - mean_x * mean_y
+
+            scores.append(
+                ((2 * mean_x * mean_y + SSIM_C1) * (2 * cov + SSIM_C2))
+                / ((mean_x**2 + mean_y**2 + SSIM_C1) * (var_x + var_y + SSIM_C2))
+            )
+
+    return sum(scores) / len(scores) if scores else 1.0
+
+
+def _estimate_jpeg_quality(table: list[int]) -> float:
+    scale = sum(table) * JPEG_BASE_SCALE / JPEG_STD_LUMINANCE_TABLE_SUM
+    if scale <= JPEG_BASE_SCALE:
+        return (2 * JPEG_BASE_SCALE - scale) / 2
+    return JPEG_BASE_SCALE * JPEG_BASE_SCALE / 2 / scale
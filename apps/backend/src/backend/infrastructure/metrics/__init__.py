@@ -0,0 +1,13 @@
+from prometheus_client import REGISTRY as REGISTRY
+
+from .config import MetricsConfig as MetricsConfig
+from .metrics import BOT_HANDLER_DURATION as BOT_HANDLER_DURATION
+from .metrics import DB_POOL_CHECKOUT_WAIT as DB_POOL_CHECKOUT_WAIT
+from .metrics import DB_POOL_CONNECTIONS as DB_POOL_CONNECTIONS
+from .metrics import HTTP_REQUEST_DURATION as HTTP_REQUEST_DURATION
+from .metrics import IMAGE_CONVERSION_DURATION as IMAGE_CONVERSION_DURATION
+from .metrics import IMAGE_DECODE_MEMORY as IMAGE_DECODE_MEMORY
+from .metrics import NATS_PUBLISH_DURATION as NATS_PUBLISH_DURATION
+from .metrics import RESPONSE_CACHE_REQUESTS as RESPONSE_CACHE_REQUESTS
+from .multiprocess import create_aggregating_registry as create_aggregating_registry
+from .server import MetricsServer as MetricsServer
@@ -0,0 +1,45 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Database pool connections by state.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+RESPONSE_CACHE_REQUESTS = Counter(
+    "response_cache_requests",
+    "Response cache lookups by namespace and result.",
+    ["namespace", "result"],
+)
+NATS_PUBLISH_DURATION = Histogram(
+    "nats_publish_duration_seconds",
+    "Latency of publishing a message to NATS.",
+    ["subject"],
+)
+IMAGE_CONVERSION_DURATION = Histogram(
+    "image_conversion_duration_seconds",
+    "Image conversion time by stage and source format.",
+    ["stage", "format"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+IMAGE_DECODE_MEMORY = Gauge(
+    "image_decode_memory_bytes",
+    "Estimated memory reserved for image decoding and its limit.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+BOT_HANDLER_DURATION = Histogram(
+    "bot_handler_duration_seconds",
+    "Telegram bot handler latency.",
+    ["event", "handler"],
+)
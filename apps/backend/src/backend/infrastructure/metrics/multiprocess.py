@@ -0,0 +1,58 @@
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from prometheus_client import REGISTRY, CollectorRegistry, Metric
+from prometheus_client.multiprocess import MultiProcessCollector, mark_process_dead
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def _file_pid(path: Path) -> int:
+    return int(path.stem.rsplit("_", 1)[1])
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class LiveProcessCollector:
+    """Collect the multiprocess files, dropping live gauges of exited processes."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._collector = MultiProcessCollector(None, str(path))  # type: ignore[no-untyped-call]
+
+    def collect(self) -> Iterable[Metric]:
+        for pid in {_file_pid(file) for file in self._path.glob("gauge_live*.db")}:
+            if not _is_alive(pid):
+                mark_process_dead(pid, str(self._path))  # type: ignore[no-untyped-call]
+        return self._collector.collect()  # type: ignore[no-untyped-call, no-any-return]
+
+
+def create_aggregating_registry() -> CollectorRegistry:
+    """
+    Sum the metrics of every process sharing PROMETHEUS_MULTIPROC_DIR.
+
+    Files left by earlier runs are removed. The current process keeps its own,
+    since its metrics are already mapped and it may serve requests itself.
+    Without the variable the process keeps its own in-memory registry.
+    """
+    path = os.environ.get(MULTIPROC_DIR_ENV)
+    if not path:
+        return REGISTRY
+
+    Path(path).mkdir(parents=True, exist_ok=True)
+    for stale in Path(path).glob("*.db"):
+        if _file_pid(stale) != os.getpid():
+            stale.unlink()
+
+    registry = CollectorRegistry()
+    registry.register(LiveProcessCollector(Path(path)))
+    return registry
@@ -25,6 +25,13 @@ class ImageS3FileManager(ImageFileManagerInterface):
                 ExtraArgs={"ContentType": image.mime},
             )
 
+    async def download(self, path: Path, save_abs_path: Path) -> None:
+        await self.client.download_file(
+            Bucket=self.bucket,
+            Key=str(path),
+            Filename=str(save_abs_path),
+        )
+
     async def move(self, path_from: Path, path_to: Path) -> None:
         await self.client.copy(
             CopySource={
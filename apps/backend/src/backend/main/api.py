@@ -6,20 +6,29 @@ from dishka import make_async_container
 from dishka.integrations.fastapi import setup_dishka as setup_ioc
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
+from prometheus_client import start_http_server
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from backend.application.comic.services import ComicReader
+from backend.infrastructure.cache import ResponseCache
 from backend.infrastructure.config_loader import load_config
-from backend.infrastructure.database.main import check_db_connection
+from backend.infrastructure.database.config import DbClient, DbConfig
+from backend.infrastructure.database.main import check_db_connection, prewarm_pool
+from backend.infrastructure.metrics import MetricsConfig, create_aggregating_registry
 from backend.main.ioc.providers import (
     APIConfigProvider,
     AppConfigProvider,
+    AuthProvider,
     BrokerConfigProvider,
+    CacheConfigProvider,
     ComicServicesProvider,
     DatabaseConfigProvider,
     FileManagersProvider,
     ImageServiceProvider,
     PublisherRouterProvider,
+    RateLimitProvider,
     RepositoriesProvider,
+    ResponseCacheProvider,
     TagServicesProvider,
     TransactionManagerProvider,
     TranslationServicesProvider,
@@ -27,25 +36,50 @@ from backend.main.ioc.providers import (
 from backend.presentation.api.config import APIConfig
 from backend.presentation.api.middlewares import register_middlewares
 from backend.presentation.api.routers import register_routers
+from backend.presentation.api.warmup import build_warmup_paths, warm_up, warm_up_statements
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    app.state.ready = False
+
     engine = await app.state.dishka_container.get(AsyncEngine)
     await check_db_connection(engine)  # TODO: handle
+    await app.state.dishka_container.get(ResponseCache)
+
+    config = await app.state.dishka_container.get(APIConfig)
+    db_config = await app.state.dishka_container.get(DbConfig)
+    await prewarm_pool(
+        engine,
+        connections=min(config.warmup_connections, db_config.pool_size),
+        warm_up=warm_up_statements,
+    )
+
+    async with app.state.dishka_container() as request_container:
+        reader = await request_container.get(ComicReader)
+        paths = await build_warmup_paths(reader, config.warmup_latest, config.warmup_paths)
+    await warm_up(app, paths)
+
+    app.state.ready = True
     yield
+    app.state.ready = False
     await app.state.dishka_container.close()
 
 
 def create_app() -> FastAPI:
+    config = load_config(APIConfig, scope="api")
     container = make_async_container(
         AppConfigProvider(),
-        DatabaseConfigProvider(),
+        DatabaseConfigProvider(DbClient.API, processes=config.workers),
         BrokerConfigProvider(),
+        CacheConfigProvider(),
         APIConfigProvider(),
+        RateLimitProvider(),
+        AuthProvider(),
         TransactionManagerProvider(),
         FileManagersProvider(),
         PublisherRouterProvider(),
+        ResponseCacheProvider(),
         RepositoriesProvider(),
         ComicServicesProvider(),
         ImageServiceProvider(),
@@ -69,11 +103,23 @@ def create_app() -> FastAPI:
 
 def main() -> None:
     config = load_config(APIConfig, scope="api")
+
+    metrics_config = load_config(MetricsConfig, scope="metrics")
+    if metrics_config.enabled:
+        start_http_server(
+            metrics_config.api_port,
+            metrics_config.host,
+            registry=create_aggregating_registry(),
+        )
+
     uvicorn.run(
         "backend.main.api:create_app",
         factory=True,
         host=config.host,
         port=config.port,
+        workers=config.workers,
+        proxy_headers=True,
+        forwarded_allow_ips=config.forwarded_allow_ips,
     )
 
 
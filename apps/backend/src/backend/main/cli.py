@@ -4,6 +4,7 @@ import click
 import uvloop
 from dishka import make_async_container
 
+from backend.infrastructure.database.config import DbClient
 from backend.main.ioc.providers import (
     APIConfigProvider,
     AppConfigProvider,
@@ -21,6 +22,7 @@ from backend.main.ioc.providers import (
     TransactionManagerProvider,
     TranslationServicesProvider,
 )
+from backend.presentation.cli.commands.backfill_thumbnails import backfill_thumbnails_command
 from backend.presentation.cli.commands.extract_and_upload_prescraped_translations import (
     extract_and_upload_prescraped_translations_command,
 )
@@ -39,7 +41,7 @@ def main(ctx: click.Context) -> None:
 
     container = make_async_container(
         AppConfigProvider(),
-        DatabaseConfigProvider(),
+        DatabaseConfigProvider(DbClient.CLI),
         BrokerConfigProvider(),
         APIConfigProvider(),
         CLIConfigProvider(),
@@ -70,3 +72,7 @@ main.add_command(
     extract_and_upload_prescraped_translations_command,
     name="extract_and_upload_prescraped_translations",
 )
+main.add_command(
+    backfill_thumbnails_command,
+    name="backfill_thumbnails",
+)
@@ -1,8 +1,10 @@
 import importlib.resources
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import aioboto3
+from argon2 import PasswordHasher
 from dishka import Provider, Scope, alias, provide
 from faststream.nats import JStream, NatsBroker
 from sqlalchemy.ext.asyncio import (
@@ -17,6 +19,7 @@ from backend.application.comic.interfaces import (
 )
 from backend.application.comic.services import (
     AddTranslationInteractor,
+    BulkUpdateComicsInteractor,
     ComicReader,
     CreateComicInteractor,
     CreateManyTagsInteractor,
@@ -32,18 +35,31 @@ from backend.application.comic.services import (
 )
 from backend.application.common.interfaces import (
     ImageFileManagerInterface,
+    InvalidateCacheMessage,
     PublisherRouterInterface,
     TempFileManagerInterface,
     TransactionManagerInterface,
 )
 from backend.application.config import AppConfig, FileStorageType
-from backend.application.image.interfaces import ImageConverterInterface, ImageRepoInterface
-from backend.application.image.services import ProcessImageInteractor, UploadImageInteractor
+from backend.application.image.interfaces import (
+    ConversionPriority,
+    ImageConverterInterface,
+    ImageRepoInterface,
+)
+from backend.application.image.services import (
+    BackfillThumbnailsInteractor,
+    ProcessImageInteractor,
+    UploadImageInteractor,
+)
+from backend.domain.entities import ImageVariant
 from backend.infrastructure.broker.config import NatsConfig
 from backend.infrastructure.broker.publisher_router import PublisherRouter
+from backend.infrastructure.cache import InMemoryCacheStorage, NatsKVCacheStorage, ResponseCache
+from backend.infrastructure.cache.config import CacheConfig
 from backend.infrastructure.config_loader import load_config
-from backend.infrastructure.database.config import DbConfig
+from backend.infrastructure.database.config import DbClient, DbConfig
 from backend.infrastructure.database.main import build_postgres_url, create_db_engine
+from backend.infrastructure.database.pool import MonitoredAsyncQueuePool, PoolWaitMonitor
 from backend.infrastructure.database.repositories import (
     ComicRepo,
     ImageRepo,
@@ -55,7 +71,12 @@ from backend.infrastructure.downloader import Downloader
 from backend.infrastructure.filesystem import ImageFSFileManager, TempFileManager
 from backend.infrastructure.filesystem.config import FSConfig
 from backend.infrastructure.http_client import AsyncHttpClient
-from backend.infrastructure.image_converter import ImageConverter
+from backend.infrastructure.image_converter import (
+    ConversionOptions,
+    ImageConverter,
+    ImageConverterConfig,
+    MemoryBudget,
+)
 from backend.infrastructure.s3.config import S3Config
 from backend.infrastructure.s3.manager import ImageS3FileManager
 from backend.infrastructure.xkcd import (
@@ -67,7 +88,9 @@ from backend.infrastructure.xkcd import (
     XkcdRUScraper,
     XkcdZHScraper,
 )
+from backend.presentation.api.auth import Argon2Hasher, SessionStore
 from backend.presentation.api.config import APIConfig
+from backend.presentation.api.rate_limit import LoadShedder, RateLimiter
 from backend.presentation.cli.config import CLIConfig
 from backend.presentation.tg_bot.config import BotConfig
 
@@ -82,9 +105,14 @@ class AppConfigProvider(Provider):
 
 
 class DatabaseConfigProvider(Provider):
+    def __init__(self, client: DbClient, processes: int = 1) -> None:
+        super().__init__()
+        self.client = client
+        self.processes = processes
+
     @provide(scope=Scope.APP)
     def provide_db_config(self) -> DbConfig:
-        return load_config(DbConfig, scope="db")
+        return load_config(DbConfig, scope="db").for_client(self.client, self.processes)
 
 
 class BrokerConfigProvider(Provider):
@@ -93,6 +121,12 @@ class BrokerConfigProvider(Provider):
         return load_config(NatsConfig, scope="nats")
 
 
+class CacheConfigProvider(Provider):
+    @provide(scope=Scope.APP)
+    def provide_cache_config(self) -> CacheConfig:
+        return load_config(CacheConfig, scope="cache")
+
+
 class CLIConfigProvider(Provider):
     @provide(scope=Scope.APP)
     def provide_cli_config(self) -> CLIConfig:
@@ -111,15 +145,75 @@ class BotConfigProvider(Provider):
         return load_config(BotConfig, scope="bot")
 
 
+class RateLimitProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def provide_rate_limiter(self, config: APIConfig) -> RateLimiter:
+        return RateLimiter(config.rate_limit)
+
+    @provide
+    def provide_load_shedder(
+        self,
+        config: APIConfig,
+        pool_wait_monitor: PoolWaitMonitor,
+    ) -> LoadShedder:
+        return LoadShedder(config.rate_limit, pool_wait_monitor)
+
+
+class AuthProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def provide_password_hasher(self, config: APIConfig) -> Iterable[Argon2Hasher]:
+        workers = config.auth.hash_workers
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="argon2") as executor:
+            yield Argon2Hasher(PasswordHasher(), executor, max_concurrency=workers)
+
+    @provide
+    async def provide_session_store(
+        self,
+        config: APIConfig,
+        nats_config: NatsConfig,
+    ) -> AsyncIterable[SessionStore]:
+        auth_config = config.auth
+
+        if not auth_config.sessions_bucket:
+            yield SessionStore(
+                InMemoryCacheStorage(
+                    max_entries=auth_config.max_sessions,
+                    ttl=auth_config.session_ttl,
+                )
+            )
+            return
+
+        broker = NatsBroker(nats_config.url)
+        await broker.connect()
+
+        kv = await broker.key_value(auth_config.sessions_bucket, ttl=auth_config.session_ttl)
+        yield SessionStore(NatsKVCacheStorage(kv))
+        await broker.close()
+
+
 class TransactionManagerProvider(Provider):
     @provide(scope=Scope.APP)
-    async def provide_db_engine(self, config: DbConfig) -> AsyncIterable[AsyncEngine]:
+    def provide_pool_wait_monitor(self) -> PoolWaitMonitor:
+        return PoolWaitMonitor()
+
+    @provide(scope=Scope.APP)
+    async def provide_db_engine(
+        self,
+        config: DbConfig,
+        pool_wait_monitor: PoolWaitMonitor,
+    ) -> AsyncIterable[AsyncEngine]:
         engine = create_db_engine(
             build_postgres_url(config),
             echo=config.echo,
             echo_pool=config.echo,
             pool_size=config.pool_size,
-            max_overflow=20,
+            max_overflow=config.max_overflow,
+            poolclass=MonitoredAsyncQueuePool,
+            wait_monitor=pool_wait_monitor,
         )
         yield engine
         await engine.dispose()
@@ -178,7 +272,37 @@ class FileManagersProvider(Provider):
                 ) as s3:  # type: S3Client
                     yield ImageS3FileManager(client=s3, bucket=s3_config.bucket)
 
-    image_converter = provide(ImageConverter, scope=Scope.APP)
+    @provide(scope=Scope.APP)
+    def provide_image_converter(self) -> Iterable[ImageConverter]:
+        config = load_config(ImageConverterConfig, scope="image_converter")
+
+        with ProcessPoolExecutor(
+            max_workers=config.processes,
+            max_tasks_per_child=config.max_tasks_per_child,
+        ) as executor:
+            yield ImageConverter(
+                executor=executor,
+                variant_widths={
+                    ImageVariant.THUMBNAIL: config.thumbnail_width,
+                    ImageVariant.X1: config.width_1x,
+                },
+                memory_budget=MemoryBudget(config.memory_budget),
+                options=ConversionOptions(
+                    avif_quality=config.avif_quality if config.avif else None,
+                    avif_min_saving=config.avif_min_saving,
+                    max_animation_frames=config.max_animation_frames,
+                    max_animation_duration=config.max_animation_duration,
+                    min_quality=config.min_quality,
+                    max_quality=config.max_quality,
+                    min_ssim=config.min_ssim,
+                    max_size_ratio=config.max_size_ratio,
+                    efforts={
+                        ConversionPriority.INTERACTIVE: config.interactive,
+                        ConversionPriority.BACKGROUND: config.background,
+                    },
+                ),
+            )
+
     image_converter_interface = alias(source=ImageConverter, provides=ImageConverterInterface)
 
 
@@ -194,17 +318,51 @@ class PublisherRouterProvider(Provider):
 
         converter_publisher = broker.publisher(subject="images.convert", stream=stream)
         new_comic_publisher = broker.publisher(subject="comics.new", stream=stream)
+        cache_publisher = broker.publisher(subject="cache.invalidate")
 
         broker.setup_publisher(converter_publisher)
         broker.setup_publisher(new_comic_publisher)
+        broker.setup_publisher(cache_publisher)
 
         await broker.start()
-        yield PublisherRouter(converter_publisher, new_comic_publisher)
+        yield PublisherRouter(converter_publisher, new_comic_publisher, cache_publisher)
         await broker.close()
 
     publisher_router_interface = alias(source=PublisherRouter, provides=PublisherRouterInterface)
 
 
+class ResponseCacheProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def provide_response_cache(
+        self,
+        config: CacheConfig,
+        nats_config: NatsConfig,
+    ) -> AsyncIterable[ResponseCache]:
+        cache = ResponseCache(
+            local=InMemoryCacheStorage(max_entries=config.max_entries, ttl=config.ttl),
+            enabled=config.enabled,
+        )
+
+        if not config.enabled:
+            yield cache
+            return
+
+        broker = NatsBroker(nats_config.url)
+
+        @broker.subscriber(subject="cache.invalidate")
+        async def invalidate(msg: InvalidateCacheMessage) -> None:
+            await cache.invalidate(msg.namespaces)
+
+        await broker.start()
+
+        if config.shared_bucket:
+            kv = await broker.key_value(config.shared_bucket, ttl=config.ttl)
+            cache.shared = NatsKVCacheStorage(kv)
+
+        yield cache
+        await broker.close()
+
+
 class RepositoriesProvider(Provider):
     scope = Scope.REQUEST
 
@@ -235,6 +393,7 @@ class ImageServiceProvider(Provider):
 
     upload_image_interactor = provide(UploadImageInteractor)
     process_image_interactor = provide(ProcessImageInteractor)
+    backfill_thumbnails_interactor = provide(BackfillThumbnailsInteractor)
 
 
 class TranslationServicesProvider(Provider):
@@ -252,6 +411,7 @@ class ComicServicesProvider(Provider):
 
     create_comic_interactor = provide(CreateComicInteractor)
     full_update_comic_interactor = provide(UpdateComicInteractor)
+    bulk_update_comics_interactor = provide(BulkUpdateComicsInteractor)
     delete_comic_interactor = provide(DeleteComicInteractor)
 
     comic_reader = provide(ComicReader)
@@ -14,6 +14,8 @@ from dishka import AsyncContainer, make_async_container
 from dishka.integrations.aiogram import setup_dishka
 
 from backend.infrastructure.config_loader import load_config
+from backend.infrastructure.database.config import DbClient
+from backend.infrastructure.metrics import REGISTRY, MetricsConfig, MetricsServer
 from backend.main.ioc.providers import (
     AppConfigProvider,
     BotConfigProvider,
@@ -29,6 +31,7 @@ from backend.main.ioc.providers import (
 from backend.presentation.tg_bot.config import BotAppConfig, BotConfig, BotRunMode, WebhookConfig
 from backend.presentation.tg_bot.controllers.comic import router as comic_router
 from backend.presentation.tg_bot.controllers.start import router as start_router
+from backend.presentation.tg_bot.middlewares import HandlerMetricsMiddleware
 
 logger = logging.getLogger(__name__)
 
@@ -88,7 +91,7 @@ async def polling_run(bot: Bot, dp: Dispatcher) -> None:
 def main() -> None:
     container = make_async_container(
         AppConfigProvider(),
-        DatabaseConfigProvider(),
+        DatabaseConfigProvider(DbClient.TG_BOT),
         BotConfigProvider(),
         BrokerConfigProvider(),
         TransactionManagerProvider(),
@@ -107,11 +110,19 @@ def main() -> None:
     )
 
     dp = Dispatcher(storage=MemoryStorage())
+    dp.message.middleware(HandlerMetricsMiddleware())
+    dp.callback_query.middleware(HandlerMetricsMiddleware())
     dp.include_router(start_router)
     dp.include_router(comic_router)
     dp.startup.register(partial(on_startup))
     dp.shutdown.register(partial(on_shutdown, container=container))
 
+    metrics_config = load_config(MetricsConfig, scope="metrics")
+    if metrics_config.enabled:
+        metrics_server = MetricsServer(REGISTRY, metrics_config.host, metrics_config.bot_port)
+        dp.startup.register(metrics_server.start)
+        dp.shutdown.register(metrics_server.stop)
+
     setup_dishka(container=container, router=dp, auto_inject=True)
 
     match config.run_method:
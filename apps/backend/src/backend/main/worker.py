@@ -6,37 +6,47 @@ from faststream import FastStream
 from faststream.nats import NatsBroker
 
 from backend.infrastructure.broker.config import NatsConfig
-from backend.infrastructure.broker.controllers import router
+from backend.infrastructure.broker.controllers import create_router
 from backend.infrastructure.config_loader import load_config
+from backend.infrastructure.database.config import DbClient
+from backend.infrastructure.metrics import REGISTRY, MetricsConfig, MetricsServer
 from backend.main.ioc.providers import (
     AppConfigProvider,
     BrokerConfigProvider,
     DatabaseConfigProvider,
     FileManagersProvider,
     ImageServiceProvider,
+    PublisherRouterProvider,
     RepositoriesProvider,
     TransactionManagerProvider,
 )
 
 
-def register_routers(broker: NatsBroker) -> None:
-    broker.include_router(router)
+def register_routers(broker: NatsBroker, config: NatsConfig) -> None:
+    broker.include_router(create_router(config.image_consumer))
 
 
 def create_app() -> FastStream:
     config = load_config(NatsConfig, scope="nats")
     broker = NatsBroker(config.url)
 
-    register_routers(broker)
+    register_routers(broker, config)
 
     app = FastStream(broker)
 
+    metrics_config = load_config(MetricsConfig, scope="metrics")
+    if metrics_config.enabled:
+        metrics_server = MetricsServer(REGISTRY, metrics_config.host, metrics_config.worker_port)
+        app.after_startup(metrics_server.start)
+        app.on_shutdown(metrics_server.stop)
+
     container = make_async_container(
         AppConfigProvider(),
-        DatabaseConfigProvider(),
+        DatabaseConfigProvider(DbClient.WORKER),
         BrokerConfigProvider(),
         TransactionManagerProvider(),
         FileManagersProvider(),
+        PublisherRouterProvider(),
         RepositoriesProvider(),
         ImageServiceProvider(),
         FastStreamProvider(),
@@ -0,0 +1,74 @@
+import asyncio
+import secrets
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from typing import Self, TypeVar
+
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+
+from backend.application.user.exceptions import InvalidCredentialsError
+from backend.infrastructure.cache import CacheStorageInterface
+
+SESSIONS_NAMESPACE = "sessions"
+
+T = TypeVar("T")
+
+
+class Argon2Hasher:
+    def __init__(self, hasher: PasswordHasher, executor: Executor, max_concurrency: int) -> None:
+        self._hasher = hasher
+        self._executor = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def hash_password(self, raw_password: str) -> str:
+        return await self._run(partial(self._hasher.hash, raw_password))
+
+    async def verify(self, hashed_password: str, raw_password: str) -> None:
+        try:
+            await self._run(partial(self._hasher.verify, hashed_password, raw_password))
+        except VerifyMismatchError as err:
+            raise InvalidCredentialsError from err
+
+    async def _run(self, func: partial[T]) -> T:
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+
+@dataclass(slots=True)
+class SessionData:
+    username: str
+    login_at: float
+
+    def dumps(self) -> bytes:
+        return orjson.dumps([self.username, self.login_at])
+
+    @classmethod
+    def loads(cls, data: bytes) -> Self:
+        username, login_at = orjson.loads(data)
+        return cls(username=username, login_at=login_at)
+
+
+@dataclass(slots=True)
+class SessionStore:
+    storage: CacheStorageInterface
+
+    async def create(self, username: str) -> str:
+        session_id = secrets.token_hex(32)
+        session = SessionData(username=username, login_at=time.time())
+        await self.storage.set(self._build_key(session_id), session.dumps())
+        return session_id
+
+    async def get(self, session_id: str) -> SessionData | None:
+        data = await self.storage.get(self._build_key(session_id))
+        return SessionData.loads(data) if data is not None else None
+
+    async def delete(self, session_id: str) -> None:
+        await self.storage.delete(self._build_key(session_id))
+
+    @staticmethod
+    def _build_key(session_id: str) -> str:
+        return f"{SESSIONS_NAMESPACE}.{session_id}"
@@ -0,0 +1,66 @@
+import datetime as dt
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+
+from fastapi import HTTPException
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from backend.application.comic.responses import ResourceVersionData
+
+
+def build_etag(request: Request, version: ResourceVersionData) -> str:
+    digest = blake2b(digest_size=16)
+    digest.update(version.fingerprint.encode())
+    digest.update(request.url.path.encode())
+    digest.update(request.url.query.encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    version: ResourceVersionData,
+) -> None:
+    etag = build_etag(request, version)
+    last_modified = version.last_modified.astimezone(dt.UTC).replace(microsecond=0)
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+    if _etag_matches(request, etag) or _not_modified_since(request, last_modified):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def _not_modified_since(request: Request, last_modified: dt.datetime) -> bool:
+    if "if-none-match" in request.headers:
+        return False
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=dt.UTC)
+
+    return last_modified <= since
@@ -1,7 +1,36 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class RateLimitConfig:
+    enabled: bool = False
+    ip_rate: float = 10.0
+    ip_burst: int = 40
+    key_rate: float = 50.0
+    key_burst: int = 200
+    api_keys: list[str] = field(default_factory=list)
+    max_clients: int = 100_000
+    max_in_flight: int = 100
+    max_pool_wait: float = 0.25
+    retry_after: int = 1
+
+
+@dataclass(slots=True)
+class AuthConfig:
+    hash_workers: int = 2
+    session_ttl: int = 7 * 24 * 60 * 60
+    max_sessions: int = 100_000
+    sessions_bucket: str | None = None
 
 
 @dataclass
 class APIConfig:
     host: str
     port: int
+    workers: int = 1
+    forwarded_allow_ips: list[str] = field(default_factory=lambda: ["127.0.0.1"])
+    warmup_latest: int = 10
+    warmup_connections: int = 10
+    warmup_paths: list[str] = field(default_factory=lambda: ["/comics"])
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    auth: AuthConfig = field(default_factory=AuthConfig)
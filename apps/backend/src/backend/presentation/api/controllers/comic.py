@@ -1,11 +1,15 @@
 import datetime
+from typing import Annotated
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Query
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
 
 from backend.application.comic.exceptions import (
+    ComicBatchLimitExceededError,
     ComicNotFoundError,
     ComicNumberAlreadyExistsError,
     ExtraComicTitleAlreadyExistsError,
@@ -13,6 +17,7 @@ from backend.application.comic.exceptions import (
 )
 from backend.application.comic.filters import ComicFilters, DateRange, TagCombination
 from backend.application.comic.services import (
+    BulkUpdateComicsInteractor,
     ComicReader,
     CreateComicInteractor,
     DeleteComicInteractor,
@@ -27,12 +32,17 @@ from backend.application.image.exceptions import ImageAlreadyHasOwnerError, Imag
 from backend.domain.entities import TranslationStatus
 from backend.domain.value_objects import ComicId, IssueNumber, Language, TagName
 from backend.domain.value_objects.translation_title import TranslationTitleLengthError
+from backend.presentation.api.conditional import check_not_modified
 from backend.presentation.api.controllers.schemas import (
+    BulkItemResultSchema,
+    ComicBatchItemResponseSchema,
+    ComicBulkUpdateSchema,
     ComicCreateSchema,
     ComicResponseSchema,
     ComicsWPaginationSchema,
     ComicWTranslationsResponseSchema,
     PaginationSchema,
+    TranslationProjectionSchema,
     TranslationResponseSchema,
 )
 from backend.presentation.api.controllers.schemas.requests import ComicUpdateSchema
@@ -40,6 +50,8 @@ from backend.presentation.api.controllers.schemas.responses import ComicCompactR
 
 router = APIRouter(tags=["Comics"], route_class=DishkaRoute)
 
+MAX_PAGE_SIZE = 500
+
 
 @router.post(
     "/comics",
@@ -60,10 +72,8 @@ async def create_comic(
     schema: ComicCreateSchema,
     *,
     interactor: FromDishka[CreateComicInteractor],
-    reader: FromDishka[ComicReader],
 ) -> ComicResponseSchema:
-    comic_id = await interactor.execute(schema.to_command())
-    return ComicResponseSchema.from_data(data=await reader.get_by_id(comic_id))
+    return ComicResponseSchema.from_data(data=await interactor.execute(schema.to_command()))
 
 
 @router.patch(
@@ -84,10 +94,26 @@ async def update_comic(
     schema: ComicUpdateSchema,
     *,
     interactor: FromDishka[UpdateComicInteractor],
-    reader: FromDishka[ComicReader],
 ) -> ComicResponseSchema:
-    await interactor.execute(schema.to_command(comic_id))
-    return ComicResponseSchema.from_data(data=await reader.get_by_id(ComicId(comic_id)))
+    return ComicResponseSchema.from_data(
+        data=await interactor.execute(schema.to_command(comic_id)),
+    )
+
+
+@router.patch(
+    "/comics/bulk",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": ComicBatchLimitExceededError},
+    },
+)
+async def bulk_update_comics(
+    schema: ComicBulkUpdateSchema,
+    *,
+    interactor: FromDishka[BulkUpdateComicsInteractor],
+) -> list[BulkItemResultSchema]:
+    results = await interactor.execute(schema.to_commands())
+    return [BulkItemResultSchema.from_data(result) for result in results]
 
 
 @router.delete(
@@ -114,9 +140,12 @@ async def delete_comic(
 )
 async def get_comic_by_id(
     comic_id: int,
+    request: Request,
+    response: Response,
     *,
     reader: FromDishka[ComicReader],
 ) -> ComicResponseSchema:
+    check_not_modified(request, response, await reader.get_version_by_id(ComicId(comic_id)))
     return ComicResponseSchema.from_data(data=await reader.get_by_id(ComicId(comic_id)))
 
 
@@ -129,12 +158,37 @@ async def get_comic_by_id(
 )
 async def get_comic_by_issue_number(
     number: int,
+    request: Request,
+    response: Response,
     *,
     reader: FromDishka[ComicReader],
 ) -> ComicResponseSchema:
+    check_not_modified(
+        request, response, await reader.get_version_by_issue_number(IssueNumber(number))
+    )
     return ComicResponseSchema.from_data(data=await reader.get_by_issue_number(IssueNumber(number)))
 
 
+@router.get(
+    "/comics/batch",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": ComicBatchLimitExceededError},
+    },
+)
+async def get_comics_batch(
+    comic_ids: list[int] = Query(default_factory=list, alias="ids"),
+    numbers: list[int] = Query(default_factory=list),
+    *,
+    reader: FromDishka[ComicReader],
+) -> list[ComicBatchItemResponseSchema]:
+    datas = await reader.get_many(
+        comic_ids=[ComicId(comic_id) for comic_id in comic_ids],
+        numbers=[IssueNumber(number) for number in numbers],
+    )
+    return [ComicBatchItemResponseSchema.from_data(data) for data in datas]
+
+
 @router.get(
     "/comics/{slug:str}",
     status_code=status.HTTP_200_OK,
@@ -144,59 +198,87 @@ async def get_comic_by_issue_number(
 )
 async def get_extra_comic_by_slug(
     slug: str,
+    request: Request,
+    response: Response,
     *,
     reader: FromDishka[ComicReader],
 ) -> ComicResponseSchema:
+    check_not_modified(request, response, await reader.get_version_by_slug(slug))
     return ComicResponseSchema.from_data(data=await reader.get_by_slug(slug))
 
 
 @router.get(
     "/comics-with-translations/id:{comic_id}",
     status_code=status.HTTP_200_OK,
+    response_model_exclude_unset=True,
     responses={
         status.HTTP_404_NOT_FOUND: {"model": ComicNotFoundError},
     },
 )
 async def get_comic_with_translations_by_id(
     comic_id: int,
+    request: Request,
+    response: Response,
+    projection: Annotated[TranslationProjectionSchema, Query()],
     *,
     reader: FromDishka[ComicReader],
 ) -> ComicWTranslationsResponseSchema:
+    check_not_modified(request, response, await reader.get_version_by_id(ComicId(comic_id)))
+    translation_projection = projection.to_projection()
     return ComicWTranslationsResponseSchema.from_data(
-        data=await reader.get_by_id(ComicId(comic_id)),
+        data=await reader.get_by_id(ComicId(comic_id), translation_projection),
+        projection=translation_projection,
     )
 
 
 @router.get(
     "/comics-with-translations/{number:int}",
     status_code=status.HTTP_200_OK,
+    response_model_exclude_unset=True,
     responses={
         status.HTTP_404_NOT_FOUND: {"model": ComicNotFoundError},
     },
 )
 async def get_comic_with_translations_by_issue_number(
     number: int,
+    request: Request,
+    response: Response,
+    projection: Annotated[TranslationProjectionSchema, Query()],
     *,
     reader: FromDishka[ComicReader],
 ) -> ComicWTranslationsResponseSchema:
+    check_not_modified(
+        request, response, await reader.get_version_by_issue_number(IssueNumber(number))
+    )
+    translation_projection = projection.to_projection()
     return ComicWTranslationsResponseSchema.from_data(
-        data=await reader.get_by_issue_number(IssueNumber(number)),
+        data=await reader.get_by_issue_number(IssueNumber(number), translation_projection),
+        projection=translation_projection,
     )
 
 
 @router.get(
     "/comics-with-translations/{slug:str}",
     status_code=status.HTTP_200_OK,
+    response_model_exclude_unset=True,
     responses={
         status.HTTP_404_NOT_FOUND: {"model": ComicNotFoundError},
     },
 )
 async def get_comic_with_translations_by_slug(
     slug: str,
+    request: Request,
+    response: Response,
+    projection: Annotated[TranslationProjectionSchema, Query()],
     *,
     reader: FromDishka[ComicReader],
 ) -> ComicWTranslationsResponseSchema:
-    return ComicWTranslationsResponseSchema.from_data(data=await reader.get_by_slug(slug))
+    check_not_modified(request, response, await reader.get_version_by_slug(slug))
+    translation_projection = projection.to_projection()
+    return ComicWTranslationsResponseSchema.from_data(
+        data=await reader.get_by_slug(slug, translation_projection),
+        projection=translation_projection,
+    )
 
 
 @router.get("/comics", status_code=status.HTTP_200_OK)
@@ -207,7 +289,7 @@ async def get_comics(
     date_to: datetime.date | None = Query(default=None),
     tags: list[str] = Query(default_factory=list, alias="tag"),
     tag_combination: TagCombination = Query(default=TagCombination.AND, alias="tag_mode"),
-    page_size: int = Query(default=100, ge=1, alias="psize"),
+    page_size: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE, alias="psize"),
     page_num: int = Query(default=1, ge=1, alias="pnum"),
     order: SortOrder = Query(default=SortOrder.ASC),
     *,
@@ -242,10 +324,13 @@ async def get_comics(
 )
 async def get_comic_translations(
     comic_id: int,
+    request: Request,
+    response: Response,
     filter_language: Language | None = Query(default=None, alias="lg"),
     publication_status: TranslationStatus | None = Query(default=None, alias="status"),
     *,
     reader: FromDishka[ComicReader],
 ) -> list[TranslationResponseSchema]:
+    check_not_modified(request, response, await reader.get_version_by_id(ComicId(comic_id)))
     datas = await reader.get_translations(ComicId(comic_id), publication_status, filter_language)
     return [TranslationResponseSchema.from_data(data) for data in datas]
@@ -1,10 +1,20 @@
-from fastapi import APIRouter
+import asyncio
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette import status
 from starlette.responses import RedirectResponse
 
+from backend.infrastructure.database.main import check_db_connection
 from backend.presentation.api.controllers.schemas import OKResponseSchema
 
-router = APIRouter(prefix="")
+READINESS_DB_TIMEOUT = 1.0
+
+router = APIRouter(prefix="", route_class=DishkaRoute)
 
 
 @router.get("/", include_in_schema=False)
@@ -22,3 +32,33 @@ async def default_redirect() -> RedirectResponse:
 )
 async def healthcheck() -> OKResponseSchema:
     return OKResponseSchema(message="API is available.")
+
+
+@router.get(
+    "/healthcheck/ready",
+    tags=["Healthcheck"],
+    status_code=status.HTTP_200_OK,
+    response_model=OKResponseSchema,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {}},
+)
+async def readiness(
+    request: Request,
+    engine: FromDishka[AsyncEngine],
+) -> OKResponseSchema | ORJSONResponse:
+    if not getattr(request.app.state, "ready", False):
+        return _not_ready("API is warming up.")
+
+    try:
+        async with asyncio.timeout(READINESS_DB_TIMEOUT):
+            await check_db_connection(engine)
+    except (TimeoutError, DBAPIError, OSError):
+        return _not_ready("Database is unavailable.")
+
+    return OKResponseSchema(message="API is ready.")
+
+
+def _not_ready(reason: str) -> ORJSONResponse:
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"error": reason},
+    )
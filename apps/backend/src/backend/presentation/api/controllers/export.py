@@ -0,0 +1,34 @@
+from collections.abc import AsyncIterator
+
+import orjson
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Query
+from starlette import status
+from starlette.responses import StreamingResponse
+
+from backend.application.comic.responses import ComicExportData
+from backend.application.comic.services import ComicReader
+
+router = APIRouter(tags=["Export"], route_class=DishkaRoute)
+
+
+async def encode_ndjson(datas: AsyncIterator[ComicExportData]) -> AsyncIterator[bytes]:
+    async for data in datas:
+        yield orjson.dumps(data) + b"\n"
+
+
+@router.get(
+    "/export/comics.ndjson",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export_comics(
+    with_translations: bool = Query(default=False),
+    *,
+    reader: FromDishka[ComicReader],
+) -> StreamingResponse:
+    return StreamingResponse(
+        encode_ndjson(reader.export(with_translations=with_translations)),
+        media_type="application/x-ndjson",
+    )
@@ -1,9 +1,14 @@
+from .requests import ComicBulkUpdateSchema as ComicBulkUpdateSchema
 from .requests import ComicCreateSchema as ComicCreateSchema
 from .requests import ComicUpdateSchema as ComicUpdateSchema
+from .requests import TagBulkCreateSchema as TagBulkCreateSchema
 from .requests import TagCreateSchema as TagCreateSchema
 from .requests import TagUpdateSchema as TagUpdateSchema
 from .requests import TranslationCreateSchema as TranslationCreateSchema
+from .requests import TranslationProjectionSchema as TranslationProjectionSchema
 from .requests import TranslationUpdateSchema as TranslationUpdateSchema
+from .responses import BulkItemResultSchema as BulkItemResultSchema
+from .responses import ComicBatchItemResponseSchema as ComicBatchItemResponseSchema
 from .responses import ComicResponseSchema as ComicResponseSchema
 from .responses import ComicsWPaginationSchema as ComicsWPaginationSchema
 from .responses import ComicWTranslationsResponseSchema as ComicWTranslationsResponseSchema
@@ -1,6 +1,7 @@
 import datetime as dt
+from typing import Any
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 
 from backend.application.comic.commands import (
     ComicCreateCommand,
@@ -10,10 +11,13 @@ from backend.application.comic.commands import (
     TranslationCreateCommand,
     TranslationUpdateCommand,
 )
+from backend.application.comic.filters import TranslationField, TranslationProjection
 from backend.domain.entities import TranslationStatus
 from backend.domain.utils import cast_or_none
 from backend.domain.value_objects import Language
 
+TAG_BULK_LIMIT = 300
+
 
 class ComicCreateSchema(BaseModel):
     number: int | None
@@ -61,6 +65,29 @@ class ComicUpdateSchema(BaseModel):
         )
 
 
+class ComicBulkUpdateItemSchema(BaseModel):
+    comic_id: int
+    title: str | None = None
+    tooltip: str | None = None
+    click_url: HttpUrl | None = None
+    explain_url: HttpUrl | None = None
+    is_interactive: bool | None = None
+    transcript: str | None = None
+    tag_ids: list[int] = Field(default_factory=list)
+
+    def to_command(self) -> ComicUpdateCommand:
+        return ComicUpdateCommand(  # type: ignore[no-any-return]
+            **self.model_dump(mode="json", exclude_unset=True),  # type: ignore[typeddict-item]
+        )
+
+
+class ComicBulkUpdateSchema(BaseModel):
+    items: list[ComicBulkUpdateItemSchema]
+
+    def to_commands(self) -> list[ComicUpdateCommand]:
+        return [item.to_command() for item in self.items]
+
+
 class TranslationCreateSchema(BaseModel):
     language: str
     title: str
@@ -113,6 +140,13 @@ class TagCreateSchema(BaseModel):
         )
 
 
+class TagBulkCreateSchema(BaseModel):
+    items: list[TagCreateSchema] = Field(max_length=TAG_BULK_LIMIT)
+
+    def to_commands(self) -> list[TagCreateCommand]:
+        return [item.to_command() for item in self.items]
+
+
 class TagUpdateSchema(BaseModel):
     name: str | None = None
     is_visible: bool | None = None
@@ -122,3 +156,18 @@ class TagUpdateSchema(BaseModel):
             tag_id=tag_id,
             **self.model_dump(exclude_unset=True),  # type: ignore[typeddict-item]
         )
+
+
+class TranslationProjectionSchema(BaseModel):
+    lg: list[Language] = Field(default_factory=list)
+    fields: list[TranslationField] = Field(default_factory=list)
+
+    @field_validator("lg", "fields", mode="before")
+    @classmethod
+    def split_comma_separated(cls, value: Any) -> Any:
+        if isinstance(value, list):
+            return [part.strip() for item in value for part in str(item).split(",") if part]
+        return value
+
+    def to_projection(self) -> TranslationProjection:
+        return TranslationProjection(languages=self.lg, fields=self.fields)
@@ -1,14 +1,18 @@
 import datetime as dt
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Any, Self
 
 from pydantic import BaseModel, HttpUrl
 
+from backend.application.comic.filters import TranslationField, TranslationProjection
+from backend.application.comic.responses import BulkItemStatus
 from backend.domain.entities import TranslationStatus
 from backend.domain.utils import cast_or_none
 from backend.domain.value_objects import Language
 
 if TYPE_CHECKING:
     from backend.application.comic.responses import (
+        BulkItemResultData,
+        ComicBatchItemData,
         ComicCompactResponseData,
         ComicResponseData,
         TagResponseData,
@@ -25,6 +29,17 @@ class TempImageSchema(BaseModel):
     image_id: int
 
 
+class BulkItemResultSchema(BaseModel):
+    index: int
+    id: int | None
+    status: BulkItemStatus
+    error: str | None
+
+    @classmethod
+    def from_data(cls, data: "BulkItemResultData") -> Self:
+        return cls(index=data.index, id=data.id, status=data.status, error=data.error)
+
+
 class PaginationSchema(BaseModel):
     total: int
     limit: int | None
@@ -53,6 +68,10 @@ class TranslationImageResponseSchema(BaseModel):
     original: str | None
     converted: str | None
     converted_2x: str | None
+    converted_avif: str | None
+    converted_2x_avif: str | None
+    width: int | None
+    height: int | None
 
     @classmethod
     def from_data(
@@ -65,6 +84,10 @@ class TranslationImageResponseSchema(BaseModel):
             original=data.original,
             converted=data.converted,
             converted_2x=data.converted_2x,
+            converted_avif=data.converted_avif,
+            converted_2x_avif=data.converted_2x_avif,
+            width=data.width,
+            height=data.height,
         )
 
 
@@ -102,12 +125,29 @@ class ComicResponseSchema(BaseModel):
         )
 
 
+class ComicBatchItemResponseSchema(BaseModel):
+    id: int | None
+    number: int | None
+    found: bool
+    comic: ComicResponseSchema | None
+
+    @classmethod
+    def from_data(cls, data: "ComicBatchItemData") -> Self:
+        return cls(
+            id=data.comic_id,
+            number=data.number,
+            found=data.comic is not None,
+            comic=ComicResponseSchema.from_data(data.comic) if data.comic else None,
+        )
+
+
 class ComicCompactResponseSchema(BaseModel):
     id: int
     number: int | None
     title: str
     publication_date: dt.date
     image_url: str | None
+    thumbnail_url: str | None
 
     @classmethod
     def from_data(cls, data: "ComicCompactResponseData") -> Self:
@@ -117,6 +157,7 @@ class ComicCompactResponseSchema(BaseModel):
             title=data.title,
             publication_date=data.publication_date,
             image_url=data.image_url,
+            thumbnail_url=data.thumbnail_url,
         )
 
 
@@ -149,11 +190,56 @@ class TranslationResponseSchema(BaseModel):
         )
 
 
+class TranslationPartialResponseSchema(BaseModel):
+    id: int
+    comic_id: int
+    language: Language
+    status: TranslationStatus
+    title: str | None = None
+    tooltip: str | None = None
+    translator_comment: str | None = None
+    source_url: HttpUrl | None = None
+    images: list[TranslationImageResponseSchema] | None = None
+
+    @classmethod
+    def from_data(
+        cls,
+        data: "TranslationResponseData",
+        projection: TranslationProjection,
+    ) -> Self:
+        fields: dict[str, Any] = {}
+        if projection.includes(TranslationField.TITLE):
+            fields["title"] = data.title
+        if projection.includes(TranslationField.TOOLTIP):
+            fields["tooltip"] = data.tooltip
+        if projection.includes(TranslationField.TRANSLATOR_COMMENT):
+            fields["translator_comment"] = data.translator_comment
+        if projection.includes(TranslationField.SOURCE_URL):
+            fields["source_url"] = cast_or_none(HttpUrl, data.source_url)
+        if projection.includes(TranslationField.IMAGES):
+            fields["images"] = [
+                TranslationImageResponseSchema.from_data(image) for image in data.images
+            ]
+
+        return cls(
+            id=data.id,
+            comic_id=data.comic_id,
+            language=data.language,
+            status=data.status,
+            **fields,
+        )
+
+
 class ComicWTranslationsResponseSchema(ComicResponseSchema):
-    translations: list[TranslationResponseSchema]
+    translations: list[TranslationPartialResponseSchema]
 
     @classmethod
-    def from_data(cls, data: "ComicResponseData") -> Self:
+    def from_data(
+        cls,
+        data: "ComicResponseData",
+        projection: TranslationProjection | None = None,
+    ) -> Self:
+        projection = projection or TranslationProjection()
         return cls(
             id=data.id,
             number=data.number if data.number else None,
@@ -168,7 +254,10 @@ class ComicWTranslationsResponseSchema(ComicResponseSchema):
             tags=[TagResponseSchema.from_data(data) for data in data.tags],
             images=[TranslationImageResponseSchema.from_data(image) for image in data.images],
             has_translations=data.has_translations,
-            translations=[TranslationResponseSchema.from_data(tr) for tr in data.translations],
+            translations=[
+                TranslationPartialResponseSchema.from_data(tr, projection)
+                for tr in data.translations
+            ],
         )
 
 
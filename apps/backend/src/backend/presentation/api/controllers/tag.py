@@ -5,6 +5,7 @@ from starlette import status
 
 from backend.application.comic.exceptions import TagNameAlreadyExistsError, TagNotFoundError
 from backend.application.comic.services import (
+    CreateManyTagsInteractor,
     CreateTagInteractor,
     DeleteTagInteractor,
     TagReader,
@@ -13,6 +14,8 @@ from backend.application.comic.services import (
 from backend.domain.value_objects import TagId
 from backend.domain.value_objects.tag_name import TagNameLengthError
 from backend.presentation.api.controllers.schemas import (
+    BulkItemResultSchema,
+    TagBulkCreateSchema,
     TagCreateSchema,
     TagResponseSchema,
     TagUpdateSchema,
@@ -39,6 +42,19 @@ async def create_tag(
     return TagResponseSchema.from_data(data=await reader.get_by_id(tag_id))
 
 
+@router.post(
+    "/tags/bulk",
+    status_code=status.HTTP_200_OK,
+)
+async def bulk_create_tags(
+    schema: TagBulkCreateSchema,
+    *,
+    interactor: FromDishka[CreateManyTagsInteractor],
+) -> list[BulkItemResultSchema]:
+    results = await interactor.execute(schema.to_commands())
+    return [BulkItemResultSchema.from_data(result) for result in results]
+
+
 @router.patch(
     "/tags/{tag_id}",
     status_code=status.HTTP_200_OK,
@@ -2,6 +2,8 @@ from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
 
 from backend.application.comic.exceptions import (
     ComicNotFoundError,
@@ -18,6 +20,7 @@ from backend.application.common.exceptions import TempFileNotFoundError
 from backend.domain.entities.translation import OriginalTranslationOperationForbiddenError
 from backend.domain.value_objects.common import TranslationId
 from backend.domain.value_objects.translation_title import TranslationTitleLengthError
+from backend.presentation.api.conditional import check_not_modified
 from backend.presentation.api.controllers.schemas import (
     TranslationCreateSchema,
     TranslationResponseSchema,
@@ -43,10 +46,10 @@ async def add_translation(
     schema: TranslationCreateSchema,
     *,
     interactor: FromDishka[AddTranslationInteractor],
-    reader: FromDishka[TranslationReader],
 ) -> TranslationResponseSchema:
-    translation_id = await interactor.execute(schema.to_command(comic_id))
-    return TranslationResponseSchema.from_data(data=await reader.get_by_id(translation_id))
+    return TranslationResponseSchema.from_data(
+        data=await interactor.execute(schema.to_command(comic_id)),
+    )
 
 
 @router.patch(
@@ -66,11 +69,9 @@ async def update_translation(
     schema: TranslationUpdateSchema,
     *,
     interactor: FromDishka[UpdateTranslationInteractor],
-    reader: FromDishka[TranslationReader],
 ) -> TranslationResponseSchema:
-    await interactor.execute(command=schema.to_command(translation_id))
     return TranslationResponseSchema.from_data(
-        data=await reader.get_by_id(TranslationId(translation_id))
+        data=await interactor.execute(command=schema.to_command(translation_id)),
     )
 
 
@@ -99,9 +100,16 @@ async def delete_translation(
 )
 async def get_translation_by_id(
     translation_id: int,
+    request: Request,
+    response: Response,
     *,
     interactor: FromDishka[TranslationReader],
 ) -> TranslationResponseSchema:
+    check_not_modified(
+        request,
+        response,
+        await interactor.get_version_by_id(TranslationId(translation_id)),
+    )
     return TranslationResponseSchema.from_data(
         data=await interactor.get_by_id(TranslationId(translation_id))
     )
@@ -116,8 +124,15 @@ async def get_translation_by_id(
 )
 async def get_translation_transcript(
     translation_id: int,
+    request: Request,
+    response: Response,
     *,
     reader: FromDishka[TranslationReader],
 ) -> str:
+    check_not_modified(
+        request,
+        response,
+        await reader.get_version_by_id(TranslationId(translation_id)),
+    )
     data = await reader.get_by_id(TranslationId(translation_id))
     return data.transcript
@@ -2,21 +2,20 @@
 
 """EXPERIMENT"""
 
-import time
 from dataclasses import dataclass
-from typing import Annotated, Literal
-from uuid import uuid4
+from typing import Annotated
 
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Cookie, Depends
+from fastapi import APIRouter, Cookie
 from pydantic import BaseModel, SecretStr
 from pydantic.types import SecretType
 from starlette import status
 from starlette.responses import Response
 
 from backend.application.user.exceptions import InvalidCredentialsError, UsernameAlreadyExistsError
+from backend.presentation.api.auth import Argon2Hasher, SessionStore
+from backend.presentation.api.config import APIConfig
 
 
 class UserRequestSchema(BaseModel):
@@ -38,33 +37,6 @@ class UserDBModel:
 router = APIRouter(tags=["Users"], route_class=DishkaRoute)
 
 MOCK_DB = {}
-SESSION_IDS = {}
-
-
-class Argon2Hasher:
-    def __init__(
-        self,
-        hasher: PasswordHasher,
-        salt: bytes = bytes("SomeSalt", "UTF-8"),
-    ) -> None:
-        self._hasher = hasher
-        self._salt = salt
-
-    def hash_password(self, raw_password: str) -> str:
-        return self._hasher.hash(
-            password=raw_password,
-            salt=self._salt,
-        )
-
-    def verify(self, hashed_password: str, raw_password: str) -> Literal[True]:
-        try:
-            return self._hasher.verify(hashed_password, raw_password)
-        except VerifyMismatchError as err:
-            raise InvalidCredentialsError from err
-
-
-def get_hasher() -> Argon2Hasher:
-    return Argon2Hasher()
 
 
 def check_username(username: str) -> None:
@@ -101,21 +73,6 @@ def get_user_by_username(username: str) -> UserDBModel | None:
     return None
 
 
-def set_session_id(username: str) -> str:
-    session_id = uuid4().hex
-
-    SESSION_IDS[session_id] = {
-        "username": username,
-        "login_at": time.time(),
-    }
-
-    return session_id
-
-
-def delete_session_id(session_id: str) -> None:
-    SESSION_IDS.pop(session_id, None)
-
-
 @router.post(
     "/users",
     status_code=status.HTTP_201_CREATED,
@@ -123,12 +80,12 @@ def delete_session_id(session_id: str) -> None:
 )
 async def register_user(
     user: UserRequestSchema,
-    hasher: Argon2Hasher = Depends(get_hasher),
+    hasher: FromDishka[Argon2Hasher],
 ) -> dict:
     # TODO: check password strength
 
     check_username(user.username)
-    user_id = insert_user(user.username, hasher.hash_password(user.secret))
+    user_id = insert_user(user.username, await hasher.hash_password(user.secret))
 
     return {"user_id": user_id}
 
@@ -141,17 +98,24 @@ async def register_user(
 async def login_user(
     response: Response,
     user: UserRequestSchema,
-    hasher: Argon2Hasher = Depends(get_hasher),
+    hasher: FromDishka[Argon2Hasher],
+    sessions: FromDishka[SessionStore],
+    config: FromDishka[APIConfig],
 ) -> dict:
     db_user = get_user_by_username(user.username)
     if not db_user:
         raise InvalidCredentialsError
 
-    hasher.verify(db_user.hashed_password, user.secret)
+    await hasher.verify(db_user.hashed_password, user.secret)
 
-    session_id = set_session_id(db_user.username)
+    session_id = await sessions.create(db_user.username)
 
-    response.set_cookie("session_id", session_id, httponly=True)
+    response.set_cookie(
+        "session_id",
+        session_id,
+        max_age=config.auth.session_ttl,
+        httponly=True,
+    )
 
     return {"result": "Success"}
 
@@ -163,10 +127,12 @@ async def login_user(
 )
 async def logout_user(
     response: Response,
+    sessions: FromDishka[SessionStore],
     session_id: Annotated[str | None, Cookie()] = None,
 ) -> dict:
-    delete_session_id(session_id)
+    if session_id:
+        await sessions.delete(session_id)
 
-    response.delete_cookie(session_id)
+    response.delete_cookie("session_id")
 
     return {"result": "Success"}
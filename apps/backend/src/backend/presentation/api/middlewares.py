@@ -1,17 +1,22 @@
 import logging
+import math
+import time
 from dataclasses import dataclass
 from types import MappingProxyType
 
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 from starlette import status
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.cors import CORSMiddleware
-from starlette.requests import Request
 from starlette.responses import Response
+from starlette.routing import Match
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.application.comic.exceptions import (
+    ComicBatchLimitExceededError,
     ComicNotFoundError,
     ComicNumberAlreadyExistsError,
     ExtraComicTitleAlreadyExistsError,
@@ -21,6 +26,7 @@ from backend.application.comic.exceptions import (
     TranslationNotFoundError,
 )
 from backend.application.common.exceptions import TempFileNotFoundError
+from backend.application.common.interfaces import CacheNamespace
 from backend.application.image.exceptions import (
     ImageAlreadyHasOwnerError,
     ImageIsEmptyError,
@@ -32,6 +38,16 @@ from backend.domain.exceptions import BaseAppError
 from backend.domain.value_objects.image_file import ImageReadError, UnsupportedImageFormatError
 from backend.domain.value_objects.tag_name import TagNameLengthError
 from backend.domain.value_objects.translation_title import TranslationTitleLengthError
+from backend.infrastructure.cache import (
+    CachedResponse,
+    ContentEncoding,
+    ResponseCache,
+    compress,
+    is_compressible,
+    negotiate_encoding,
+)
+from backend.infrastructure.metrics import HTTP_REQUEST_DURATION, RESPONSE_CACHE_REQUESTS
+from backend.presentation.api.rate_limit import LoadShedder, RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +68,7 @@ ERROR_TO_STATUS_MAP = MappingProxyType(
         ImageSizeExceededLimitError: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
         UnsupportedImageFormatError: status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
         ComicNotFoundError: status.HTTP_404_NOT_FOUND,
+        ComicBatchLimitExceededError: status.HTTP_400_BAD_REQUEST,
         ComicNumberAlreadyExistsError: status.HTTP_409_CONFLICT,
         ExtraComicTitleAlreadyExistsError: status.HTTP_409_CONFLICT,
         TempFileNotFoundError: status.HTTP_404_NOT_FOUND,
@@ -68,41 +85,269 @@ ERROR_TO_STATUS_MAP = MappingProxyType(
 )
 
 
-class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+class ExceptionHandlerMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            try:
-                return await call_next(request)
-            except BaseAppError as err:
-                err_status = ERROR_TO_STATUS_MAP.get(err.__class__)
+            await self.app(scope, receive, send_wrapper)
+        except Exception as err:
+            if response_started:
+                raise
+            response = self._build_error_response(err)
+            await response(scope, receive, send)
 
-                if err_status is None:
-                    raise AppErrorIsNotRegisteredError(err.__class__.__name__) from None
+    @staticmethod
+    def _build_error_response(err: Exception) -> Response:
+        if isinstance(err, BaseAppError):
+            err_status = ERROR_TO_STATUS_MAP.get(err.__class__)
 
+            if err_status is not None:
                 return ORJSONResponse(
                     status_code=err_status,
                     content={"error": err.message},
                 )
-        except AppErrorIsNotRegisteredError as err:
-            logger.exception(err.message)
-            return ORJSONResponse(
-                status_code=HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "error": "An unexpected error occurred.",
-                },
-            )
-        except Exception:
+
+            logger.exception(AppErrorIsNotRegisteredError(err.__class__.__name__).message)
+        else:
             logger.exception("Unexpected error occurred")
-            return ORJSONResponse(
-                status_code=HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "error": "An unexpected error occurred.",
-                },
+
+        return ORJSONResponse(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "error": "An unexpected error occurred.",
+            },
+        )
+
+
+CACHED_ROUTE_NAMESPACES = MappingProxyType(
+    {
+        "comics": CacheNamespace.COMICS,
+        "comics-with-translations": CacheNamespace.COMICS,
+        "translations": CacheNamespace.COMICS,
+        "tags": CacheNamespace.TAGS,
+    },
+)
+
+
+class ResponseCacheMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        path = self._get_route_path(scope)
+        namespace = CACHED_ROUTE_NAMESPACES.get(path.strip("/").split("/", 1)[0])
+        headers = Headers(scope=scope)
+
+        if namespace is None or "if-none-match" in headers or "if-modified-since" in headers:
+            await self.app(scope, receive, send)
+            return
+
+        cache = await scope["app"].state.dishka_container.get(ResponseCache)
+        if not cache.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        key = cache.build_key(namespace, path, scope["query_string"].decode("latin-1"))
+        generation = cache.generation(namespace)
+
+        cached = await cache.get(key)
+        RESPONSE_CACHE_REQUESTS.labels(
+            namespace=namespace,
+            result="hit" if cached is not None else "miss",
+        ).inc()
+        if cached is not None:
+            await self._send_cached(cached, headers, send)
+            return
+
+        response: CachedResponse | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(raw=list(message["headers"]))
+                response_headers.add_vary_header("Accept-Encoding")
+                if message["status"] == status.HTTP_200_OK:
+                    response = CachedResponse(message["status"], list(response_headers.raw), b"")
+                response_headers["x-cache"] = "MISS"
+                message["headers"] = response_headers.raw
+            elif message["type"] == "http.response.body" and response is not None:
+                response.body += message.get("body", b"")
+                if not message.get("more_body", False):
+                    await send(message)
+                    await self._store(cache, key, response, namespace, generation)
+                    return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    async def _send_cached(cached: CachedResponse, headers: Headers, send: Send) -> None:
+        encoding = negotiate_encoding(
+            headers.get("accept-encoding", ""),
+            cached.encoded_bodies.keys(),
+        )
+        body = cached.get_body(encoding)
+
+        response_headers = MutableHeaders(raw=list(cached.headers))
+        response_headers["content-length"] = str(len(body))
+        if encoding != ContentEncoding.IDENTITY:
+            response_headers["content-encoding"] = encoding
+        response_headers["x-cache"] = "HIT"
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": cached.status,
+                "headers": response_headers.raw,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _store(
+        cache: ResponseCache,
+        key: str,
+        response: CachedResponse,
+        namespace: CacheNamespace,
+        generation: int,
+    ) -> None:
+        response_headers = Headers(raw=response.headers)
+        if "content-encoding" not in response_headers and is_compressible(
+            response_headers.get("content-type", ""), len(response.body)
+        ):
+            response.encoded_bodies = await run_in_threadpool(compress, response.body)
+        await cache.set(key, response, namespace, generation)
+
+    @staticmethod
+    def _get_route_path(scope: Scope) -> str:
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            return path[len(root_path) :]
+        return path
+
+
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = await scope["app"].state.dishka_container.get(RateLimiter)
+        if not limiter.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = scope["client"][0] if scope.get("client") else ""
+        retry_after = limiter.acquire(client_ip, Headers(scope=scope).get("x-api-key"))
+
+        if retry_after > 0:
+            response = ORJSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"error": "Too many requests."},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+class LoadSheddingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        shedder = await scope["app"].state.dishka_container.get(LoadShedder)
+        if not shedder.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        if not shedder.try_acquire():
+            response = ORJSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"error": "The service is overloaded, try again later."},
+                headers={"Retry-After": str(shedder.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            shedder.release()
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=self._get_route_template(scope),
+                status=str(status_code),
+            ).observe(time.perf_counter() - started_at)
+
+    @staticmethod
+    def _get_route_template(scope: Scope) -> str:
+        route = scope.get("route")
+        if route is None:
+            # Responses served before routing (cache hits, rejections) still need a template.
+            route = next(
+                (r for r in scope["app"].router.routes if r.matches(scope)[0] == Match.FULL),
+                None,
             )
+        return getattr(route, "path", "unmatched")
 
 
 def register_middlewares(app: FastAPI) -> None:
     app.add_middleware(ExceptionHandlerMiddleware)
+    app.add_middleware(LoadSheddingMiddleware)
+    app.add_middleware(ResponseCacheMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(MetricsMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
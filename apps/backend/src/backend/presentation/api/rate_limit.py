@@ -0,0 +1,71 @@
+import random
+import time
+from collections import OrderedDict
+
+from backend.infrastructure.database.pool import PoolWaitMonitor
+from backend.presentation.api.config import RateLimitConfig
+
+
+class TokenBucketLimiter:
+    def __init__(self, rate: float, burst: int, max_keys: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, key: str) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated_at) * self._rate)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / self._rate
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+
+        return retry_after
+
+
+class RateLimiter:
+    def __init__(self, config: RateLimitConfig) -> None:
+        self.enabled = config.enabled
+        self._api_keys = frozenset(config.api_keys)
+        self._ip_buckets = TokenBucketLimiter(config.ip_rate, config.ip_burst, config.max_clients)
+        self._key_buckets = TokenBucketLimiter(
+            config.key_rate,
+            config.key_burst,
+            max(len(self._api_keys), 1),
+        )
+
+    def acquire(self, client_ip: str, api_key: str | None) -> float:
+        if api_key is not None and api_key in self._api_keys:
+            return self._key_buckets.acquire(api_key)
+        return self._ip_buckets.acquire(client_ip)
+
+
+class LoadShedder:
+    def __init__(self, config: RateLimitConfig, pool_monitor: PoolWaitMonitor) -> None:
+        self.enabled = config.enabled
+        self.retry_after = config.retry_after
+        self._max_in_flight = config.max_in_flight
+        self._max_pool_wait = config.max_pool_wait
+        self._pool_monitor = pool_monitor
+        self._in_flight = 0
+
+    def try_acquire(self) -> bool:
+        if self._in_flight >= self._max_in_flight or self._is_pool_overloaded():
+            return False
+        self._in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self._in_flight -= 1
+
+    def _is_pool_overloaded(self) -> bool:
+        excess = self._pool_monitor.wait_time / self._max_pool_wait - 1
+        return excess > 0 and random.random() < excess  # noqa: S311
@@ -2,6 +2,7 @@ from fastapi import FastAPI
 
 from backend.presentation.api.controllers.comic import router as comic_router
 from backend.presentation.api.controllers.default import router as default_router
+from backend.presentation.api.controllers.export import router as export_router
 from backend.presentation.api.controllers.tag import router as tag_router
 from backend.presentation.api.controllers.translation import router as translation_router
 from backend.presentation.api.controllers.upload_image import router as image_router
@@ -13,3 +14,4 @@ def register_routers(app: FastAPI) -> None:
     app.include_router(translation_router)
     app.include_router(image_router)
     app.include_router(tag_router)
+    app.include_router(export_router)
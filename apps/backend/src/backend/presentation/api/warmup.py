@@ -0,0 +1,78 @@
+import logging
+from collections.abc import Iterable
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from starlette.types import Message
+
+from backend.application.comic.filters import ComicFilters, TranslationProjection
+from backend.application.comic.services import ComicReader
+from backend.application.common.pagination import Pagination
+from backend.infrastructure.database.repositories import ComicRepo
+
+logger = logging.getLogger(__name__)
+
+WARMUP_PAGE_SIZE = 100
+
+
+async def build_warmup_paths(reader: ComicReader, latest: int, paths: Iterable[str]) -> list[str]:
+    warmup_paths = list(paths)
+
+    latest_number = await reader.get_latest_issue_number()
+    if latest_number is not None:
+        first = max(latest_number.value - latest + 1, 1)
+        warmup_paths.extend(
+            f"/comics/{number}" for number in range(latest_number.value, first - 1, -1)
+        )
+
+    return warmup_paths
+
+
+async def warm_up_statements(session: AsyncSession) -> None:
+    repo = ComicRepo(session)
+
+    latest_number = await repo.get_latest_issue_number()
+    if latest_number is not None:
+        await repo.get_by(latest_number)
+        await repo.get_by(latest_number, TranslationProjection())
+    await repo.get_list(ComicFilters(), Pagination(limit=WARMUP_PAGE_SIZE))
+
+
+async def warm_up(app: FastAPI, paths: Iterable[str]) -> None:
+    warmed = 0
+    for path in paths:
+        if await _get(app, path) == status.HTTP_200_OK:
+            warmed += 1
+    logger.info("Warmed up %d responses.", warmed)
+
+
+async def _get(app: FastAPI, path: str) -> int | None:
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"localhost")],
+        "client": None,
+        "server": None,
+    }
+    response_status: int | None = None
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal response_status
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+
+    await app(scope, receive, send)
+
+    return response_status
@@ -0,0 +1,40 @@
+import click
+
+from backend.application.image.services import BackfillThumbnailsInteractor
+from backend.domain.value_objects import ImageId
+from backend.presentation.cli.common import async_command, clean_up, positive_number
+from backend.presentation.cli.progress import ProgressBar, progress_factory
+
+
+@click.command()
+@click.option("--batch_size", type=int, default=50, callback=positive_number)
+@click.option("--concurrency", type=int, default=4, callback=positive_number)
+@click.pass_context
+@clean_up
+@async_command
+async def backfill_thumbnails_command(
+    ctx: click.Context,
+    batch_size: int,
+    concurrency: int,
+) -> None:
+    container = ctx.meta["container"]
+    after_id: ImageId | None = None
+
+    with progress_factory() as progress:
+        progress_bar = ProgressBar(progress, "Thumbnails backfilling:")
+
+        while True:
+            async with container() as request_container:
+                interactor: BackfillThumbnailsInteractor = await request_container.get(
+                    BackfillThumbnailsInteractor
+                )
+                image_ids = await interactor.execute(batch_size, after_id, concurrency)
+
+            if not image_ids:
+                break
+
+            for _ in image_ids:
+                progress_bar.advance()
+            after_id = image_ids[-1]
+
+        progress_bar.finish()
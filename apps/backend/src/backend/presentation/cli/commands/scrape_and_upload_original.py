@@ -83,7 +83,7 @@ async def upload_one(
                 CreateManyTagsInteractor
             )
 
-            tag_ids = await create_many_tags_interactor.execute(
+            results = await create_many_tags_interactor.execute(
                 commands=[
                     TagCreateCommand(
                         name=name,
@@ -93,11 +93,12 @@ async def upload_one(
                     for name in explain_data.tags
                 ]
             )
+            tag_ids = [TagId(result.id) for result in results if result.id is not None]
 
         create_comic_interactor: CreateComicInteractor = await request_container.get(
             CreateComicInteractor
         )
-        return await create_comic_interactor.execute(
+        comic = await create_comic_interactor.execute(
             command=ComicCreateCommand(
                 number=original_data.number,
                 title=original_data.title,
@@ -115,6 +116,8 @@ async def upload_one(
             )
         )
 
+        return ComicId(comic.id)
+
 
 @click.command()
 @click.option("--start", type=int, default=1, callback=positive_number)
@@ -94,7 +94,7 @@ async def upload_one_translation(
         add_translation_interactor: AddTranslationInteractor = await request_container.get(
             AddTranslationInteractor
         )
-        return await add_translation_interactor.execute(
+        translation = await add_translation_interactor.execute(
             command=TranslationCreateCommand(
                 comic_id=number_comic_id_map[data.number],
                 language=Language(data.language),
@@ -107,3 +107,5 @@ async def upload_one_translation(
                 image_ids=image_ids,
             ),
         )
+
+        return TranslationId(translation.id)
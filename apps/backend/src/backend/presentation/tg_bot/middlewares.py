@@ -0,0 +1,26 @@
+# type: ignore
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from backend.infrastructure.metrics import BOT_HANDLER_DURATION
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        handler_object = data.get("handler")
+        handler_name = handler_object.callback.__name__ if handler_object else "unknown"
+
+        with BOT_HANDLER_DURATION.labels(
+            event=type(event).__name__,
+            handler=handler_name,
+        ).time():
+            return await handler(event, data)
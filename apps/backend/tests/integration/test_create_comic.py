@@ -44,9 +44,9 @@ async def test_create_comic_success(
         image_ids=[],
     )
 
-    assert await comic_interactor.execute(request) == ComicId(1)
+    created = await comic_interactor.execute(request)
 
-    assert await comic_reader.get_by_id(ComicId(1)) == ComicResponseData(
+    expected = ComicResponseData(
         id=1,
         number=request.number,
         translation_id=1,
@@ -62,3 +62,6 @@ async def test_create_comic_success(
         images=[],
         translations=[],
     )
+
+    assert created == expected
+    assert await comic_reader.get_by_id(ComicId(1)) == expected
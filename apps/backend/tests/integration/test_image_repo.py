@@ -0,0 +1,49 @@
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+import pytest
+from dishka import AsyncContainer
+
+from backend.application.common.interfaces import TransactionManagerInterface
+from backend.application.image.interfaces import ImageRepoInterface
+from backend.domain.entities import NewImageEntity
+from backend.domain.value_objects import ImageMetadata, TempFileUUID
+from backend.domain.value_objects.image_file import ImageFormat
+
+
+@pytest.fixture(scope="function")
+async def request_container(
+    container: AsyncContainer,
+) -> AsyncGenerator[AsyncContainer, None]:
+    async with container() as request_container:
+        yield request_container
+
+
+async def test_image_metadata_round_trip(request_container: AsyncContainer) -> None:
+    image_repo = await request_container.get(ImageRepoInterface)
+    transaction = await request_container.get(TransactionManagerInterface)
+    metadata = ImageMetadata(
+        width=740,
+        height=320,
+        format=ImageFormat.PNG,
+        mime="image/png",
+        size=48213,
+        content_hash="a" * 64,
+    )
+
+    image_id = await image_repo.create(
+        NewImageEntity(temp_image_id=TempFileUUID(uuid4()), metadata=metadata),
+    )
+    await transaction.commit()
+
+    assert (await image_repo.load(image_id)).metadata == metadata
+
+
+async def test_image_without_metadata_round_trip(request_container: AsyncContainer) -> None:
+    image_repo = await request_container.get(ImageRepoInterface)
+    transaction = await request_container.get(TransactionManagerInterface)
+
+    image_id = await image_repo.create(NewImageEntity(temp_image_id=TempFileUUID(uuid4())))
+    await transaction.commit()
+
+    assert (await image_repo.load(image_id)).metadata is None
@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from argon2 import PasswordHasher
+
+from backend.application.user.exceptions import InvalidCredentialsError
+from backend.infrastructure.cache import InMemoryCacheStorage
+from backend.presentation.api.auth import Argon2Hasher, SessionStore
+
+
+async def test_hasher_runs_in_executor() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        hasher = Argon2Hasher(PasswordHasher(), executor, max_concurrency=1)
+        hashed = await hasher.hash_password("password")
+
+        await hasher.verify(hashed, "password")
+        with pytest.raises(InvalidCredentialsError):
+            await hasher.verify(hashed, "wrong")
+
+
+async def test_session_store_expires_sessions() -> None:
+    store = SessionStore(InMemoryCacheStorage(max_entries=10, ttl=-1))
+    assert await store.get(await store.create("user")) is None
+
+    store = SessionStore(InMemoryCacheStorage(max_entries=10, ttl=60))
+    session_id = await store.create("user")
+    session = await store.get(session_id)
+    assert session is not None
+    assert session.username == "user"
+
+    await store.delete(session_id)
+    assert await store.get(session_id) is None
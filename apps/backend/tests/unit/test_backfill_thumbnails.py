@@ -0,0 +1,120 @@
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from backend.application.image.exceptions import ImageConversionError
+from backend.application.image.interfaces import ConversionPriority, ConvertedImage
+from backend.application.image.services import BackfillThumbnailsInteractor
+from backend.domain.entities import ImageEntity, ImageVariant
+from backend.domain.value_objects import ImageFileObj, ImageId
+
+UNCONVERTIBLE_IMAGE_ID = 2
+BROKEN_IMAGE_ID = 3
+
+
+@dataclass(slots=True)
+class FakeImageRepo:
+    images: list[ImageEntity]
+    updated: list[ImageEntity] = field(default_factory=list)
+
+    async def get_without_thumbnail(
+        self,
+        limit: int,
+        after_id: ImageId | None = None,
+    ) -> Sequence[ImageEntity]:
+        after = after_id.value if after_id else 0
+        return [image for image in self.images if image.id.value > after][:limit]
+
+    async def update_many(self, images: Sequence[ImageEntity]) -> None:
+        self.updated.extend(images)
+
+
+@dataclass(slots=True)
+class FakeTempFileManager:
+    root: Path
+    created: int = 0
+
+    def new_path(self) -> Path:
+        self.created += 1
+        return self.root / f"temp_{self.created}"
+
+
+@dataclass(slots=True)
+class FakeImageFileManager:
+    persisted: list[Path] = field(default_factory=list)
+
+    async def download(self, path: Path, save_abs_path: Path) -> None:
+        save_abs_path.write_text(path.stem)
+
+    async def persist(self, image: ImageFileObj, save_path: Path) -> None:  # noqa: ARG002
+        self.persisted.append(save_path)
+
+
+@dataclass(slots=True)
+class FakeConverter:
+    async def convert_to_webp(
+        self,
+        original: ImageFileObj,
+        variants: Collection[ImageVariant] | None = None,  # noqa: ARG002
+        priority: ConversionPriority = ConversionPriority.INTERACTIVE,  # noqa: ARG002
+    ) -> ConvertedImage:
+        image_id = int(original.source.read_text())
+        if image_id == UNCONVERTIBLE_IMAGE_ID:
+            raise ImageConversionError(original.source, "Image is too large.")
+        if image_id == BROKEN_IMAGE_ID:
+            raise RuntimeError
+
+        thumbnail = original.source.with_name(f"{original.source.name}_thumbnail")
+        thumbnail.write_bytes(b"")
+        return ConvertedImage(webp={ImageVariant.THUMBNAIL: ImageFileObj(thumbnail)})
+
+
+@dataclass(slots=True)
+class FakeTransaction:
+    commits: int = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
+@dataclass(slots=True)
+class FakePublisher:
+    messages: list[Any] = field(default_factory=list)
+
+    async def publish(self, msg: Any, **_: Any) -> None:
+        self.messages.append(msg)
+
+
+async def test_backfill_advances_past_failures(tmp_path: Path) -> None:
+    images = [
+        ImageEntity(id=ImageId(image_id), temp_image_id=None, original_path=Path(f"{image_id}.png"))
+        for image_id in range(1, 5)
+    ]
+    image_repo = FakeImageRepo(images)
+    image_file_manager = FakeImageFileManager()
+    interactor = BackfillThumbnailsInteractor(
+        image_repo=image_repo,
+        temp_file_manager=FakeTempFileManager(tmp_path),
+        image_file_manager=image_file_manager,
+        converter=FakeConverter(),
+        transaction=FakeTransaction(),
+        publisher=FakePublisher(),
+    )
+
+    processed = await interactor.execute(limit=3)
+    processed += await interactor.execute(limit=3, after_id=processed[-1])
+
+    assert [image_id.value for image_id in processed] == [1, 2, 3, 4]
+    assert [image.id.value for image in image_repo.updated] == [1, 4]
+    assert all(image.thumbnail_path for image in image_repo.updated)
+    assert images[UNCONVERTIBLE_IMAGE_ID - 1].thumbnail_path is None
+    assert images[BROKEN_IMAGE_ID - 1].thumbnail_path is None
+    assert image_file_manager.persisted == [
+        Path("1_thumbnail.webp"),
+        Path("4_thumbnail.webp"),
+    ]
+    assert not list(tmp_path.iterdir())
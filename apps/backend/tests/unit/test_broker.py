@@ -0,0 +1,112 @@
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.faststream import FastStreamProvider, setup_dishka
+from faststream import FastStream
+from faststream.nats import NatsBroker, TestNatsBroker
+from faststream.nats.testing import PatchedMessage
+
+from backend.application.common.interfaces import PostProcessImageMessage
+from backend.application.image.services import ProcessImageInteractor
+from backend.domain.value_objects import ImageId
+from backend.infrastructure.broker.config import ImageConsumerConfig
+from backend.infrastructure.broker.controllers import create_router
+
+FAILED_IMAGE_ID = 2
+MAX_CONCURRENCY = 3
+HEARTBEAT_INTERVAL = 0.01
+MIN_HEARTBEATS = 2
+
+
+@dataclass(slots=True)
+class FakeProcessImageInteractor:
+    processed: list[ImageId] = field(default_factory=list)
+    concurrency: int | None = None
+    duration: float = 0
+
+    async def execute(self, image_ids: Sequence[ImageId], concurrency: int = 1) -> set[ImageId]:
+        self.processed.extend(image_ids)
+        self.concurrency = concurrency
+        await asyncio.sleep(self.duration)
+        return {image_id for image_id in image_ids if image_id.value == FAILED_IMAGE_ID}
+
+
+async def test_process_images_naks_only_failed_messages(monkeypatch: pytest.MonkeyPatch) -> None:
+    settled: list[tuple[int, str]] = []
+
+    def settle(outcome: str) -> Any:
+        async def record(message: PatchedMessage, *_: Any) -> None:
+            image_id = PostProcessImageMessage.model_validate_json(message.data).image_id
+            settled.append((image_id, outcome))
+            message._ackd = True  # noqa: SLF001
+
+        return record
+
+    monkeypatch.setattr(PatchedMessage, "ack", settle("ack"))
+    monkeypatch.setattr(PatchedMessage, "nak", settle("nak"))
+
+    interactor = FakeProcessImageInteractor()
+    provider = Provider(scope=Scope.REQUEST)
+    provider.provide(lambda: interactor, provides=ProcessImageInteractor)
+
+    broker = NatsBroker()
+    broker.include_router(create_router(ImageConsumerConfig(max_concurrency=MAX_CONCURRENCY)))
+    setup_dishka(
+        make_async_container(provider, FastStreamProvider()),
+        FastStream(broker),
+        auto_inject=True,
+    )
+
+    async with TestNatsBroker(broker) as test_broker:
+        for image_id in (1, FAILED_IMAGE_ID, 3):
+            await test_broker.publish(
+                PostProcessImageMessage(image_id=image_id),
+                subject="images.convert",
+                stream="stream_name",
+            )
+
+    assert [image_id.value for image_id in interactor.processed] == [1, FAILED_IMAGE_ID, 3]
+    assert interactor.concurrency == MAX_CONCURRENCY
+    assert settled == [(1, "ack"), (FAILED_IMAGE_ID, "nak"), (3, "ack")]
+
+
+async def test_process_images_keeps_slow_batches_in_progress(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    heartbeats: list[int] = []
+
+    async def in_progress(message: PatchedMessage) -> None:
+        heartbeats.append(PostProcessImageMessage.model_validate_json(message.data).image_id)
+
+    monkeypatch.setattr(PatchedMessage, "in_progress", in_progress)
+
+    interactor = FakeProcessImageInteractor(duration=HEARTBEAT_INTERVAL * 5)
+    provider = Provider(scope=Scope.REQUEST)
+    provider.provide(lambda: interactor, provides=ProcessImageInteractor)
+
+    broker = NatsBroker()
+    broker.include_router(
+        create_router(ImageConsumerConfig(in_progress_interval=HEARTBEAT_INTERVAL)),
+    )
+    setup_dishka(
+        make_async_container(provider, FastStreamProvider()),
+        FastStream(broker),
+        auto_inject=True,
+    )
+
+    async with TestNatsBroker(broker) as test_broker:
+        await test_broker.publish(
+            PostProcessImageMessage(image_id=1),
+            subject="images.convert",
+            stream="stream_name",
+        )
+        heartbeats_after_batch = len(heartbeats)
+        await asyncio.sleep(HEARTBEAT_INTERVAL * 3)
+
+    assert heartbeats_after_batch >= MIN_HEARTBEATS
+    assert set(heartbeats) == {1}
+    assert len(heartbeats) == heartbeats_after_batch
@@ -0,0 +1,114 @@
+import datetime as dt
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from backend.application.comic.commands import ComicUpdateCommand
+from backend.application.comic.responses import BulkItemStatus
+from backend.application.comic.services import BulkUpdateComicsInteractor
+from backend.domain.entities import ComicEntity
+from backend.domain.value_objects import (
+    ComicId,
+    IssueNumber,
+    TagId,
+    TranslationId,
+    TranslationTitle,
+)
+
+NUMBERED_COMIC_ID = 5
+
+
+def build_comic(comic_id: int, title: str, number: int | None = None) -> ComicEntity:
+    return ComicEntity(
+        id=ComicId(comic_id),
+        number=IssueNumber(number) if number else None,
+        title=TranslationTitle(title),
+        tooltip="",
+        publication_date=dt.date(2024, 1, 1),
+        xkcd_url=None,
+        explain_url=None,
+        click_url=None,
+        is_interactive=False,
+        original_translation_id=TranslationId(comic_id),
+        transcript="",
+    )
+
+
+@dataclass(slots=True)
+class FakeComicRepo:
+    comics: dict[ComicId, ComicEntity]
+    updated: list[ComicEntity] = field(default_factory=list)
+    tag_links: Mapping[ComicId, Sequence[TagId]] = field(default_factory=dict)
+
+    async def load_many(self, comic_ids: Sequence[ComicId]) -> dict[ComicId, ComicEntity]:
+        return {
+            comic_id: replace(comic)
+            for comic_id, comic in self.comics.items()
+            if comic_id in comic_ids
+        }
+
+    async def get_extra_comic_ids_by_slugs(self, slugs: Sequence[str]) -> dict[str, ComicId]:
+        return {comic.slug: comic.id for comic in self.comics.values() if comic.slug in slugs}
+
+    async def update_many(self, comics: Sequence[ComicEntity]) -> None:
+        self.updated.extend(comics)
+
+    async def relink_many_tags(self, links: Mapping[ComicId, Sequence[TagId]]) -> None:
+        self.tag_links = links
+
+
+@dataclass(slots=True)
+class FakeTagRepo:
+    async def get_existing_ids(self, tag_ids: Sequence[TagId]) -> set[TagId]:
+        return set(tag_ids)
+
+
+@dataclass(slots=True)
+class FakeTransaction:
+    async def commit(self) -> None:
+        pass
+
+
+@dataclass(slots=True)
+class FakePublisher:
+    async def publish(self, msg: Any, **_: Any) -> None:
+        pass
+
+
+async def test_bulk_update_reports_slug_conflicts_per_item() -> None:
+    comic_repo = FakeComicRepo(
+        {
+            comic.id: comic
+            for comic in (
+                build_comic(1, "Alpha"),
+                build_comic(2, "Beta"),
+                build_comic(3, "Gamma"),
+                build_comic(4, "Epsilon"),
+                build_comic(NUMBERED_COMIC_ID, "Zeta", number=1),
+            )
+        }
+    )
+    interactor = BulkUpdateComicsInteractor(
+        comic_repo=comic_repo,
+        tag_repo=FakeTagRepo(),
+        transaction=FakeTransaction(),
+        publisher=FakePublisher(),
+    )
+    commands: list[ComicUpdateCommand] = [
+        {"comic_id": 1, "title": "Beta", "tag_ids": [1]},
+        {"comic_id": 3, "title": "Delta", "tag_ids": [1]},
+        {"comic_id": 4, "title": "Delta"},
+        {"comic_id": NUMBERED_COMIC_ID, "title": "Beta"},
+    ]
+
+    results = await interactor.execute(commands)
+
+    assert [(result.id, result.status) for result in results] == [
+        (1, BulkItemStatus.CONFLICT),
+        (3, BulkItemStatus.UPDATED),
+        (4, BulkItemStatus.CONFLICT),
+        (NUMBERED_COMIC_ID, BulkItemStatus.UPDATED),
+    ]
+    assert results[0].error
+    assert [comic.id.value for comic in comic_repo.updated] == [3, NUMBERED_COMIC_ID]
+    assert list(comic_repo.tag_links) == [ComicId(3)]
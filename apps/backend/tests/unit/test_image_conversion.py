@@ -1,18 +1,31 @@
+import asyncio
 from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pytest
 from filetype import filetype
 from PIL import Image
 
-from backend.domain.value_objects import ImageFileObj
+from backend.domain.entities import ImageVariant
+from backend.domain.value_objects import ImageFileObj, ImageMetadata
 from backend.domain.value_objects.image_file import ImageFormat
-from backend.infrastructure.image_converter import ImageConverter
+from backend.infrastructure.image_converter import ConversionOptions, ImageConverter, MemoryBudget
+
+THUMBNAIL_WIDTH = 300
+WIDTH_1X = 740
+MEMORY_LIMIT = 100
+LARGE_IMAGE_SIZE = (2000, 400)
+LOW_JPEG_QUALITY = 20
 
 
 @pytest.fixture(scope="session")
-def converter() -> ImageConverter:
-    return ImageConverter()
+def converter() -> Generator[ImageConverter, None, None]:
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=2) as executor:
+        yield ImageConverter(
+            executor=executor,
+            variant_widths={ImageVariant.THUMBNAIL: THUMBNAIL_WIDTH, ImageVariant.X1: WIDTH_1X},
+        )
 
 
 @pytest.fixture(scope="session")
@@ -37,22 +50,160 @@ def clean_up(test_images_dir: Path) -> Generator[None, None, None]:
         "dummy.webp",
     ],
 )
-def test_convert_image_to_webp_success(
+async def test_convert_image_to_webp_success(
     converter: ImageConverter,
     test_images_dir: Path,
     image_filename: str,
     clean_up: None,  # noqa: ARG001
 ) -> None:
     original = ImageFileObj(test_images_dir / image_filename)
-    converted = converter.convert_to_webp(original)
+    result = await converter.convert_to_webp(original)
+    variants = result.webp
+    converted = variants[ImageVariant.X1]
 
-    assert str(converted.source).endswith("_converted")
-    assert original.source.parent == original.source.parent
+    assert variants.keys() == {ImageVariant.THUMBNAIL, ImageVariant.X1}
+    assert not result.avif
+    assert str(converted.source).endswith("_1x")
     assert filetype.guess_extension(converted.source) == ImageFormat.WEBP
     assert converted.size < original.size
 
     with (
         Image.open(original.source) as original_image,
         Image.open(converted.source) as converted_image,
+        Image.open(variants[ImageVariant.THUMBNAIL].source) as thumbnail_image,
     ):
         assert original_image.size == converted_image.size
+        assert thumbnail_image.width == THUMBNAIL_WIDTH
+
+
+async def test_convert_animated_gif_to_animated_webp(
+    converter: ImageConverter,
+    tmp_path: Path,
+) -> None:
+    frames = [Image.new("RGB", (400, 200), (red, 0, 0)) for red in (0, 64, 128, 255)]
+    source = tmp_path / "animated.gif"
+    frames[0].save(source, save_all=True, append_images=frames[1:], duration=100, loop=0)
+
+    variants = (await converter.convert_to_webp(ImageFileObj(source))).webp
+
+    assert variants.keys() == {ImageVariant.THUMBNAIL, ImageVariant.X1}
+
+    with (
+        Image.open(variants[ImageVariant.X1].source) as converted_image,
+        Image.open(variants[ImageVariant.THUMBNAIL].source) as thumbnail_image,
+    ):
+        assert converted_image.n_frames == len(frames)
+        assert converted_image.size == (400, 200)
+        assert not getattr(thumbnail_image, "is_animated", False)
+        assert thumbnail_image.width == THUMBNAIL_WIDTH
+
+
+async def test_large_image_is_kept_as_2x_variant(
+    converter: ImageConverter,
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "large.jpeg"
+    Image.linear_gradient("L").resize(LARGE_IMAGE_SIZE).convert("RGB").save(source, quality=95)
+
+    variants = (await converter.convert_to_webp(ImageFileObj(source))).webp
+
+    assert variants.keys() == {ImageVariant.THUMBNAIL, ImageVariant.X1, ImageVariant.X2}
+
+    with (
+        Image.open(variants[ImageVariant.X2].source) as converted_2x_image,
+        Image.open(variants[ImageVariant.X1].source) as converted_image,
+        Image.open(variants[ImageVariant.THUMBNAIL].source) as thumbnail_image,
+    ):
+        assert converted_2x_image.size == LARGE_IMAGE_SIZE
+        assert converted_image.width == WIDTH_1X
+        assert thumbnail_image.width == THUMBNAIL_WIDTH
+
+
+async def test_no_gain_prediction_skips_only_full_size_variant(
+    converter: ImageConverter,
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "low_quality.jpeg"
+    Image.linear_gradient("L").resize(LARGE_IMAGE_SIZE).save(source, quality=LOW_JPEG_QUALITY)
+
+    variants = (await converter.convert_to_webp(ImageFileObj(source))).webp
+
+    assert variants.keys() == {ImageVariant.THUMBNAIL, ImageVariant.X1}
+
+
+async def test_variant_larger_than_allowed_is_dropped(
+    converter: ImageConverter,
+    test_images_dir: Path,
+    clean_up: None,  # noqa: ARG001
+) -> None:
+    original = ImageFileObj(test_images_dir / "dummy.jpeg")
+    strict_converter = ImageConverter(
+        executor=converter.executor,
+        variant_widths=converter.variant_widths,
+        options=ConversionOptions(max_size_ratio=0.5),
+    )
+
+    variants = (await strict_converter.convert_to_webp(original)).webp
+
+    assert variants.keys() == {ImageVariant.THUMBNAIL}
+    assert variants[ImageVariant.THUMBNAIL].size <= original.size * 0.5
+
+
+async def test_avif_is_only_encoded_for_lossy_variants(
+    converter: ImageConverter,
+    test_images_dir: Path,
+    clean_up: None,  # noqa: ARG001
+) -> None:
+    avif_converter = ImageConverter(
+        executor=converter.executor,
+        variant_widths=converter.variant_widths,
+        options=ConversionOptions(avif_quality=75, avif_min_saving=-1.0),
+    )
+
+    result = await avif_converter.convert_to_webp(ImageFileObj(test_images_dir / "dummy.png"))
+
+    assert result.avif.keys() == {ImageVariant.THUMBNAIL}
+    assert filetype.guess_mime(result.avif[ImageVariant.THUMBNAIL].source) == "image/avif"
+
+
+def test_image_file_obj_from_metadata_skips_reading_the_file(tmp_path: Path) -> None:
+    metadata = ImageMetadata(
+        width=740,
+        height=320,
+        format=ImageFormat.PNG,
+        mime="image/png",
+        size=48213,
+        content_hash="a" * 64,
+    )
+
+    image_file = ImageFileObj.from_metadata(tmp_path / "missing.png", metadata)
+
+    assert image_file.metadata == metadata
+    assert image_file.dimensions == (metadata.width, metadata.height)
+
+
+def test_image_file_obj_without_metadata_reads_the_file(test_images_dir: Path) -> None:
+    source = test_images_dir / "dummy.png"
+
+    image_file = ImageFileObj.from_metadata(source, None)
+
+    assert image_file.metadata == ImageFileObj(source).metadata
+    assert image_file.format == ImageFormat.PNG
+
+
+async def test_memory_budget_limits_concurrent_reservations() -> None:
+    budget = MemoryBudget(limit=MEMORY_LIMIT)
+    active: list[int] = []
+    peak = 0
+
+    async def decode(amount: int) -> None:
+        nonlocal peak
+        async with budget.reserve(amount):
+            active.append(amount)
+            peak = max(peak, sum(active))
+            await asyncio.sleep(0.01)
+            active.remove(amount)
+
+    await asyncio.gather(decode(60), decode(60), decode(30), decode(MEMORY_LIMIT))
+
+    assert peak <= MEMORY_LIMIT
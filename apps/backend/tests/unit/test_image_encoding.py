@@ -0,0 +1,77 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from PIL.Image import Image as PILImage
+
+from backend.infrastructure.image_converter.config import EncodingEffort
+from backend.infrastructure.image_converter.encoding import (
+    _bisect_quality,
+    _decode,
+    _estimate_jpeg_quality,
+    _ssim,
+    _ssim_samples,
+    encode_lossy,
+)
+
+EFFORT = EncodingEffort(method=4, search_method=4, max_attempts=6)
+MIN_QUALITY = 60
+MAX_QUALITY = 95
+THRESHOLD = 73
+MAX_ATTEMPTS = 10
+MIN_SSIM = 0.9
+JPEG_QUALITY_TOLERANCE = 1
+
+
+@pytest.fixture(scope="module")
+def image() -> PILImage:
+    gradient = Image.radial_gradient("L").resize((256, 256)).convert("RGB")
+    noise = Image.effect_noise((256, 256), 40).convert("RGB")
+    return Image.blend(gradient, noise, 0.3)
+
+
+def test_bisect_quality_finds_lowest_passing_value() -> None:
+    calls: list[int] = []
+
+    def passes(quality: int) -> bool:
+        calls.append(quality)
+        return quality >= THRESHOLD
+
+    assert _bisect_quality(0, 100, passes, MAX_ATTEMPTS) == THRESHOLD
+    assert len(calls) <= MAX_ATTEMPTS
+
+
+def test_bisect_quality_returns_passing_value_when_attempts_run_out() -> None:
+    assert _bisect_quality(0, 100, lambda q: q >= THRESHOLD, attempts=2) >= THRESHOLD
+
+
+def test_bisect_quality_falls_back_to_high() -> None:
+    assert _bisect_quality(MIN_QUALITY, MAX_QUALITY, lambda _: False, MAX_ATTEMPTS) == MAX_QUALITY
+
+
+def test_encode_lossy_meets_size_target(image: PILImage) -> None:
+    max_size = len(encode_lossy(image, EFFORT, MIN_QUALITY, MAX_QUALITY)) * 0.6
+
+    encoded = encode_lossy(image, EFFORT, MIN_QUALITY, MAX_QUALITY, max_size=max_size)
+
+    assert len(encoded) <= max_size
+
+
+def test_encode_lossy_meets_ssim_target(image: PILImage) -> None:
+    full_quality = encode_lossy(image, EFFORT, MIN_QUALITY, MAX_QUALITY)
+
+    encoded = encode_lossy(image, EFFORT, MIN_QUALITY, MAX_QUALITY, min_ssim=MIN_SSIM)
+
+    assert len(encoded) < len(full_quality)
+    assert _ssim(_ssim_samples(image), _ssim_samples(_decode(encoded))) >= MIN_SSIM
+
+
+@pytest.mark.parametrize("quality", [20, 50, 75, 90])
+def test_estimate_jpeg_quality(quality: int) -> None:
+    buffer = BytesIO()
+    Image.effect_noise((64, 64), 50).convert("RGB").save(buffer, "JPEG", quality=quality)
+
+    with Image.open(buffer) as jpeg:
+        estimated = _estimate_jpeg_quality(jpeg.quantization[0])
+
+    assert estimated == pytest.approx(quality, abs=JPEG_QUALITY_TOLERANCE)
@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from backend.infrastructure.metrics import create_aggregating_registry
+from backend.infrastructure.metrics.multiprocess import MULTIPROC_DIR_ENV
+
+EXITED_WORKERS = 3
+IN_USE_CONNECTIONS = 2
+RECORD_METRICS = """
+import sys
+
+from backend.infrastructure.metrics import DB_POOL_CONNECTIONS, RESPONSE_CACHE_REQUESTS
+
+RESPONSE_CACHE_REQUESTS.labels(namespace="comics", result="hit").inc()
+DB_POOL_CONNECTIONS.labels(state="in_use").set(2)
+print("recorded", flush=True)
+sys.stdin.read()
+"""
+
+
+def _start_worker() -> subprocess.Popen[str]:
+    worker = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", RECORD_METRICS],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert worker.stdout is not None
+    assert worker.stdout.readline() == "recorded\n"
+    return worker
+
+
+def _stop_worker(worker: subprocess.Popen[str]) -> None:
+    worker.communicate("")
+
+
+def test_registry_keeps_only_files_of_current_process(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stale = tmp_path / "histogram_1.db"
+    own = tmp_path / f"histogram_{os.getpid()}.db"
+    stale.write_bytes(b"")
+    own.write_bytes(b"")
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+
+    create_aggregating_registry()
+
+    assert list(tmp_path.iterdir()) == [own]
+
+
+def test_registry_sums_counters_and_live_gauges_only(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+    registry = create_aggregating_registry()
+
+    for _ in range(EXITED_WORKERS):
+        _stop_worker(_start_worker())
+    live_worker = _start_worker()
+
+    try:
+        assert (
+            registry.get_sample_value(
+                "response_cache_requests_total",
+                {"namespace": "comics", "result": "hit"},
+            )
+            == EXITED_WORKERS + 1
+        )
+        assert (
+            registry.get_sample_value("db_pool_connections", {"state": "in_use"})
+            == IN_USE_CONNECTIONS
+        )
+    finally:
+        _stop_worker(live_worker)
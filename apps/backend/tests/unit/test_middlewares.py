@@ -0,0 +1,127 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette import status
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from backend.application.comic.exceptions import ComicNotFoundError
+from backend.domain.exceptions import BaseAppError
+from backend.domain.value_objects import ComicId
+from backend.infrastructure.database.pool import PoolWaitMonitor
+from backend.presentation.api.config import RateLimitConfig
+from backend.presentation.api.middlewares import register_middlewares
+from backend.presentation.api.rate_limit import LoadShedder, RateLimiter
+
+
+class UnregisteredError(BaseAppError): ...
+
+
+def build_app(config: RateLimitConfig, pool_monitor: PoolWaitMonitor) -> FastAPI:
+    provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: RateLimiter(config), provides=RateLimiter)
+    provider.provide(lambda: LoadShedder(config, pool_monitor), provides=LoadShedder)
+
+    app = FastAPI(default_response_class=ORJSONResponse)
+    register_middlewares(app)
+    setup_dishka(make_async_container(provider), app)
+
+    @app.get("/ok")
+    async def ok() -> None:
+        return None
+
+    return app
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    app = build_app(RateLimitConfig(), PoolWaitMonitor())
+
+    @app.get("/not_found")
+    async def not_found() -> None:
+        raise ComicNotFoundError(ComicId(1))
+
+    @app.get("/unregistered")
+    async def unregistered() -> None:
+        raise UnregisteredError
+
+    @app.get("/unexpected")
+    async def unexpected() -> None:
+        raise RuntimeError
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def content() -> AsyncIterator[bytes]:
+            for chunk in (b"1\n", b"2\n", b"3\n"):
+                yield chunk
+
+        return StreamingResponse(content(), media_type="application/x-ndjson")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_app_error_is_mapped_to_status(client: TestClient) -> None:
+    response = client.get("/not_found")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"error": "A comic (id=1) not found."}
+
+
+@pytest.mark.parametrize("path", ["/unregistered", "/unexpected"])
+def test_unknown_error_is_hidden(client: TestClient, path: str) -> None:
+    response = client.get(path)
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert response.json() == {"error": "An unexpected error occurred."}
+
+
+def test_streaming_response_passes_through(client: TestClient) -> None:
+    response = client.get("/stream")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == b"1\n2\n3\n"
+
+
+def test_client_is_rate_limited_per_ip_and_per_key() -> None:
+    config = RateLimitConfig(enabled=True, ip_rate=0.01, ip_burst=2, api_keys=["secret"])
+    client = TestClient(build_app(config, PoolWaitMonitor()))
+
+    statuses = [client.get("/ok").status_code for _ in range(3)]
+    limited = client.get("/ok")
+
+    assert statuses == [status.HTTP_200_OK, status.HTTP_200_OK, status.HTTP_429_TOO_MANY_REQUESTS]
+    assert int(limited.headers["retry-after"]) > 0
+    assert client.get("/ok", headers={"X-API-Key": "secret"}).status_code == status.HTTP_200_OK
+
+
+def test_forwarded_client_is_rate_limited_only_behind_trusted_proxy() -> None:
+    config = RateLimitConfig(enabled=True, ip_rate=0.01, ip_burst=1)
+    trusted = TestClient(ProxyHeadersMiddleware(build_app(config, PoolWaitMonitor()), "testclient"))
+    untrusted = TestClient(ProxyHeadersMiddleware(build_app(config, PoolWaitMonitor()), "10.0.0.1"))
+
+    trusted_statuses = [
+        trusted.get("/ok", headers={"X-Forwarded-For": ip}).status_code
+        for ip in ("203.0.113.1", "203.0.113.2")
+    ]
+    untrusted_statuses = [
+        untrusted.get("/ok", headers={"X-Forwarded-For": ip}).status_code
+        for ip in ("203.0.113.1", "203.0.113.2")
+    ]
+
+    assert trusted_statuses == [status.HTTP_200_OK, status.HTTP_200_OK]
+    assert untrusted_statuses == [status.HTTP_200_OK, status.HTTP_429_TOO_MANY_REQUESTS]
+
+
+def test_request_is_shed_when_pool_wait_is_high() -> None:
+    pool_monitor = PoolWaitMonitor(alpha=1)
+    pool_monitor.observe(10)
+    client = TestClient(build_app(RateLimitConfig(enabled=True), pool_monitor))
+
+    response = client.get("/ok")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["retry-after"] == "1"
@@ -0,0 +1,153 @@
+from collections.abc import Iterator
+
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from backend.application.common.interfaces import CacheNamespace
+from backend.infrastructure.cache import InMemoryCacheStorage, ResponseCache
+from backend.infrastructure.database.pool import PoolWaitMonitor
+from backend.presentation.api.config import RateLimitConfig
+from backend.presentation.api.middlewares import register_middlewares
+from backend.presentation.api.rate_limit import LoadShedder, RateLimiter
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    return ResponseCache(
+        local=InMemoryCacheStorage(max_entries=16, ttl=60),
+        shared=InMemoryCacheStorage(max_entries=16, ttl=60),
+    )
+
+
+@pytest.fixture
+def calls() -> dict[str, int]:
+    return {"comics": 0, "tags": 0}
+
+
+@pytest.fixture
+def client(cache: ResponseCache, calls: dict[str, int]) -> Iterator[TestClient]:
+    class CacheProvider(Provider):
+        @provide(scope=Scope.APP)
+        def provide_cache(self) -> ResponseCache:
+            return cache
+
+        @provide(scope=Scope.APP)
+        def provide_rate_limiter(self) -> RateLimiter:
+            return RateLimiter(RateLimitConfig())
+
+        @provide(scope=Scope.APP)
+        def provide_load_shedder(self) -> LoadShedder:
+            return LoadShedder(RateLimitConfig(), PoolWaitMonitor())
+
+    app = FastAPI(default_response_class=ORJSONResponse)
+    register_middlewares(app)
+
+    @app.get("/comics")
+    async def get_comics(page: int = 1) -> dict[str, int]:
+        calls["comics"] += 1
+        return {"page": page}
+
+    @app.get("/comics/all")
+    async def get_all_comics() -> list[dict[str, int]]:
+        calls["comics"] += 1
+        return [{"id": comic_id} for comic_id in range(1000)]
+
+    @app.get("/comics/latest")
+    async def get_latest_comic_during_update() -> dict[str, int]:
+        calls["comics"] += 1
+        await cache.invalidate([CacheNamespace.COMICS])
+        return {"id": calls["comics"]}
+
+    @app.get("/tags/{tag_id}")
+    async def get_tag(tag_id: int) -> dict[str, int]:
+        calls["tags"] += 1
+        return {"id": tag_id}
+
+    setup_dishka(make_async_container(CacheProvider()), app)
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_repeated_request_is_served_from_cache(
+    client: TestClient,
+    calls: dict[str, int],
+) -> None:
+    first = client.get("/comics?page=2&psize=10")
+    second = client.get("/comics?psize=10&page=2")
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json() == {"page": 2}
+    assert calls["comics"] == 1
+
+
+def test_shared_tier_fills_local_tier(
+    client: TestClient,
+    cache: ResponseCache,
+    calls: dict[str, int],
+) -> None:
+    client.get("/comics")
+    cache.local = InMemoryCacheStorage(max_entries=16, ttl=60)
+
+    assert client.get("/comics").headers["x-cache"] == "HIT"
+    assert calls["comics"] == 1
+
+
+async def test_invalidation_drops_only_affected_namespace(
+    client: TestClient,
+    cache: ResponseCache,
+    calls: dict[str, int],
+) -> None:
+    client.get("/comics")
+    client.get("/tags/1")
+
+    await cache.invalidate([CacheNamespace.COMICS])
+
+    assert client.get("/comics").headers["x-cache"] == "MISS"
+    assert client.get("/tags/1").headers["x-cache"] == "HIT"
+    assert calls == {"comics": 2, "tags": 1}
+
+
+def test_response_read_before_invalidation_is_not_stored(
+    client: TestClient,
+    calls: dict[str, int],
+) -> None:
+    first = client.get("/comics/latest")
+    second = client.get("/comics/latest")
+
+    assert first.headers["x-cache"] == second.headers["x-cache"] == "MISS"
+    assert second.json() == {"id": 2}
+    assert calls == {"comics": 2, "tags": 0}
+
+
+def test_conditional_request_bypasses_cache(client: TestClient) -> None:
+    client.get("/comics")
+
+    response = client.get("/comics", headers={"If-None-Match": '"etag"'})
+
+    assert "x-cache" not in response.headers
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "content_encoding"),
+    [("gzip, deflate", "gzip"), ("br;q=0, gzip;q=0.5", "gzip"), ("identity", None)],
+)
+def test_cached_response_is_served_precompressed(
+    client: TestClient,
+    calls: dict[str, int],
+    accept_encoding: str,
+    content_encoding: str | None,
+) -> None:
+    first = client.get("/comics/all", headers={"Accept-Encoding": accept_encoding})
+    second = client.get("/comics/all", headers={"Accept-Encoding": accept_encoding})
+
+    assert "content-encoding" not in first.headers
+    assert second.headers.get("content-encoding") == content_encoding
+    assert second.headers["vary"] == "Accept-Encoding"
+    assert second.json() == first.json()
+    assert calls["comics"] == 1